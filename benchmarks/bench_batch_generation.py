@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Question generation throughput: one generate_*_core call per row (the
+per-item path the engine uses) against QuestionGenerator.generate_batch,
+which draws every wrong option and option order of the batch with NumPy.
+
+Rates are question cores per second for one question per row; "rendered"
+adds render_question for every core, and "memory" is what the cores
+take beyond the rows they refer to. Before timing, every batch question
+must have four distinct options with the answer at correct_answer, and
+the batch must leave out exactly the rows the per-item path can't ask
+about; the check exits non-zero otherwise.
+
+Usage:
+    python benchmarks/bench_batch_generation.py [--scale 10] [--repeat 3]
+"""
+
+import argparse
+import random
+import sys
+
+from common import DATA_DIR, format_seconds, make_synthetic_data_dir, time_call
+
+from src.data.csv_loader import CSVLoader
+from src.data.question_generator import QuestionGenerator
+from src.data.records import GrammarItem
+from src.utils.memory import deep_sizeof, format_bytes
+
+# Question category -> field holding its answer
+ANSWER_FIELDS = {
+    'reading': 'hiragana',
+    'meaning_to_japanese': 'kanji',
+    'japanese_to_meaning': 'korean_meaning',
+    'sentence_completion': 'grammar_pattern',
+    'pattern_identification': 'grammar_pattern',
+    'japanese_to_korean_comprehension': 'korean_translation',
+    'korean_to_japanese_comprehension': 'japanese_sentence',
+}
+
+
+def generate_each(generator: QuestionGenerator, items, rng):
+    cores = []
+    for item in items:
+        if isinstance(item, GrammarItem):
+            generate = generator.generate_grammar_core
+        else:
+            generate = generator.generate_vocabulary_core
+        try:
+            cores.append(generate(item, rng))
+        except ValueError:
+            continue
+    return cores
+
+
+def check(generator: QuestionGenerator, label: str, items) -> bool:
+    batch = generator.generate_batch(items, -1, 1)
+    ok = True
+    if sorted(map(id, (core.item for core in generate_each(generator, items, random.Random(1))))) != \
+            sorted(map(id, batch.items)):
+        print(f"FAIL {label}: batch and per-item path ask about different rows")
+        ok = False
+    positions = [0] * 4
+    for index, core in enumerate(batch):
+        answer = getattr(core.item, ANSWER_FIELDS[core.category])
+        if len(set(core.options)) != 4 or core.options[core.correct_answer] != answer:
+            print(f"FAIL {label}: question {index} has options {core.options}, answer {answer!r}")
+            ok = False
+            break
+        positions[core.correct_answer] += 1
+        if index < 200:
+            generator.render_question(core, False)
+            generator.render_question(core, True)
+    # The answer's column must be uniform; 4 standard deviations of slack
+    expected = len(batch) / 4
+    if any(abs(count - expected) > 4 * (expected * 0.75) ** 0.5 for count in positions):
+        print(f"FAIL {label}: answer columns {positions} are not uniform")
+        ok = False
+    return ok
+
+
+def run_dataset(label: str, data_dir, repeat: int):
+    loader = CSVLoader(str(data_dir))
+    generator = QuestionGenerator(loader)
+    vocabulary = list(loader.load_vocabulary('N4'))
+    grammar = list(loader.load_grammar('N4'))
+    print(f"\n== {label}: {len(vocabulary)} vocabulary rows, {len(grammar)} grammar rows ==")
+
+    datasets = {'vocabulary': vocabulary, 'grammar': grammar, 'mixed': vocabulary + grammar}
+    if not all([check(generator, mode, items) for mode, items in datasets.items()]):
+        sys.exit(1)
+
+    def rendered(cores):
+        for core in cores:
+            generator.render_question(core, False)
+
+    print(f"{'mode':<12}{'questions':>10}{'path':>10}{'time':>12}{'q/s':>12}{'rendered':>12}{'memory':>12}")
+    for mode, items in datasets.items():
+        each = generate_each(generator, items, random.Random(0))
+        batch = generator.generate_batch(items, -1, 0)
+        seen = set()
+        deep_sizeof(loader, seen)
+        deep_sizeof(items, seen)
+        sizes = {'per-item': deep_sizeof(each, seen), 'batch': batch.nbytes() + deep_sizeof(batch.items, seen)}
+        paths = {
+            'per-item': lambda: generate_each(generator, items, random.Random(0)),
+            'batch': lambda: generator.generate_batch(items, -1, 0),
+        }
+        for path, generate in paths.items():
+            elapsed = time_call(generate, repeat)
+            with_render = time_call(lambda: rendered(generate()), repeat)
+            print(f"{mode:<12}{len(batch):>10}{path:>10}{format_seconds(elapsed):>12}"
+                  f"{len(batch) / elapsed:>12,.0f}{len(batch) / with_render:>12,.0f}{format_bytes(sizes[path]):>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=10, help='size multiplier for the synthetic corpus')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per measurement (median)')
+    args = parser.parse_args()
+
+    run_dataset('N4', DATA_DIR, args.repeat)
+    with make_synthetic_data_dir(args.scale) as data_dir:
+        run_dataset(f'synthetic x{args.scale}', data_dir, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
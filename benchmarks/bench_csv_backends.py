@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Compare the stdlib csv and pandas CSVLoader backends.
+
+Each backend runs in a fresh interpreter that loads both N4 files without a
+snapshot, reporting backend import time, parse time and resident memory.
+
+Usage:
+    python benchmarks/bench_csv_backends.py [--runs 5] [--scale 10]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+from common import DATA_DIR, PROJECT_ROOT, format_seconds, make_synthetic_data_dir
+
+# Runs in the child process; prints "<import s> <load s> <rss KB>"
+CHILD_SCRIPT = '''
+import sys, time, resource
+sys.path.insert(0, {project_root!r})
+start = time.perf_counter()
+if {backend!r} == 'pandas':
+    import pandas
+imported = time.perf_counter()
+from src.data.csv_loader import CSVLoader
+loader = CSVLoader({data_dir!r}, use_snapshot=False, backend={backend!r})
+loader.load_vocabulary('N4')
+loader.load_grammar('N4')
+loaded = time.perf_counter()
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+with open('/proc/self/status') as f:
+    for line in f:
+        if line.startswith('VmRSS:'):
+            rss_kb = int(line.split()[1])
+print(imported - start, loaded - imported, rss_kb)
+'''
+
+
+def run_backend(data_dir, backend: str, runs: int):
+    script = CHILD_SCRIPT.format(project_root=str(PROJECT_ROOT), data_dir=str(data_dir), backend=backend)
+    results = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True,
+                                text=True, check=True).stdout.split()
+        results.append((float(output[0]), float(output[1]), int(output[2])))
+    return tuple(statistics.median(column) for column in zip(*results))
+
+
+def run_dataset(label: str, data_dir, runs: int):
+    print(f"\n== {label} (median of {runs} fresh interpreters) ==")
+    print(f"{'backend':<10}{'import':>12}{'load':>12}{'total':>12}{'RSS':>10}")
+    for backend in ('pandas', 'csv'):
+        import_s, load_s, rss_kb = run_backend(data_dir, backend, runs)
+        print(f"{backend:<10}{format_seconds(import_s):>12}{format_seconds(load_s):>12}"
+              f"{format_seconds(import_s + load_s):>12}{rss_kb / 1024:>7.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters per backend (median)')
+    parser.add_argument('--scale', type=int, default=10, help='size multiplier for the synthetic corpus')
+    args = parser.parse_args()
+
+    run_dataset('N4', DATA_DIR, args.runs)
+    with make_synthetic_data_dir(args.scale) as data_dir:
+        run_dataset(f'synthetic x{args.scale}', data_dir, args.runs)
+
+
+if __name__ == "__main__":
+    main()
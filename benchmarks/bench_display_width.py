@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Throughput of the display-width engine used to align option columns,
+against the per-character range checks QuestionGenerator used before.
+
+Checks first that the engine agrees with rich's cell widths (what the
+terminal renderer uses) on every text the alignment helpers measure, and
+exits non-zero on a mismatch; the old function's disagreements are
+reported for comparison. Fixed mixed kana/kanji/Hangul cases are in
+tests/test_display_width.py.
+
+Usage:
+    python benchmarks/bench_display_width.py [--repeat 5]
+"""
+
+import argparse
+import sys
+
+from rich.cells import cell_len
+
+from common import DATA_DIR, format_seconds, time_call
+from src.data.csv_loader import CSVLoader
+from src.utils.display_width import display_width
+
+def legacy_display_width(text: str) -> int:
+    """QuestionGenerator._get_display_width before the width engine"""
+    if not text:
+        return 0
+
+    width = 0
+    for char in text:
+        if '\u3040' <= char <= '\u309F' or '\u30A0' <= char <= '\u30FF' or '\u4E00' <= char <= '\u9FAF':
+            width += 2
+        else:
+            width += 1
+    return width
+
+
+def corpus_texts():
+    """Every kanji, hiragana and Korean meaning the alignment helpers measure"""
+    loader = CSVLoader(str(DATA_DIR))
+    texts = []
+    for item in loader.load_vocabulary('N4'):
+        texts.extend(text for text in (item.kanji, f"({item.hiragana})", item.korean_meaning) if text)
+    return texts
+
+
+def check(texts) -> bool:
+    mismatches = [text for text in set(texts) if display_width(text) != cell_len(text)]
+    legacy_mismatches = [text for text in set(texts) if legacy_display_width(text) != cell_len(text)]
+    for text in mismatches[:10]:
+        print(f"FAIL {text!r}: {display_width(text)} cells, rich says {cell_len(text)}")
+    print(f"checks: {len(set(texts))} corpus texts "
+          f"({len(mismatches)} disagree with rich; old function: {len(legacy_mismatches)})")
+    return not mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='timed repetitions (median)')
+    args = parser.parse_args()
+
+    texts = corpus_texts()
+    if not check(texts):
+        sys.exit(1)
+
+    def measure_all(width):
+        for text in texts:
+            width(text)
+
+    print(f"\n== {len(texts)} texts ==")
+    print(f"{'engine':<22}{'time':>12}{'texts/s':>14}")
+    for label, width in (('old range checks', legacy_display_width),
+                         ('engine, no str cache', lambda text: display_width.__wrapped__(text)),
+                         ('width engine', display_width),
+                         ('rich cell_len', cell_len)):
+        seconds = time_call(lambda: measure_all(width), args.repeat)
+        print(f"{label:<22}{format_seconds(seconds):>12}{len(texts) / seconds:>14.0f}")
+    info = display_width.cache_info()
+    print(f"string cache: {info.hits} hits, {info.misses} misses, {info.currsize}/{info.maxsize} entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark distractor selection per call.
+
+"before" re-runs the old per-call list comprehensions over the whole level,
+"after" draws from the pre-bucketed pools built once per level by CSVLoader.
+
+Usage:
+    python benchmarks/bench_distractors.py [--scale 10] [--calls 2000]
+"""
+
+import argparse
+import random
+import time
+
+from common import DATA_DIR, format_seconds, make_synthetic_data_dir
+
+from src.data.csv_loader import CSVLoader
+from src.data.question_generator import QuestionGenerator
+
+
+# Old implementations, kept here as the "before" reference
+def legacy_similar_vocabulary_items(all_vocab, vocab_item):
+    similar_items = [
+        item for item in all_vocab
+        if item.get('pos') == vocab_item.get('pos')
+        and item['kanji'] != vocab_item['kanji']
+    ]
+    if len(similar_items) < 3:
+        similar_items = [item for item in all_vocab if item['kanji'] != vocab_item['kanji']]
+    return random.sample(similar_items, min(3, len(similar_items)))
+
+
+def legacy_similar_meanings(all_vocab, vocab_item):
+    different_meanings = [
+        item['korean_meaning'] for item in all_vocab
+        if item['korean_meaning'] != vocab_item['korean_meaning']
+    ]
+    return random.sample(different_meanings, min(3, len(different_meanings)))
+
+
+def legacy_similar_translations(all_grammar, grammar_item):
+    different_translations = [
+        item['korean_translation'] for item in all_grammar
+        if item['korean_translation'] != grammar_item['korean_translation']
+    ]
+    return random.sample(different_translations, min(3, len(different_translations)))
+
+
+def legacy_similar_japanese_sentences(all_grammar, grammar_item):
+    different_sentences = [
+        item['japanese_sentence'] for item in all_grammar
+        if item['japanese_sentence'] != grammar_item['japanese_sentence']
+    ]
+    return random.sample(different_sentences, min(3, len(different_sentences)))
+
+
+def per_call(func, items, calls: int) -> float:
+    """Average seconds per call of func(item) over `calls` random items"""
+    sample = [random.choice(items) for _ in range(calls)]
+    start = time.perf_counter()
+    for item in sample:
+        func(item)
+    return (time.perf_counter() - start) / calls
+
+
+def run_dataset(label: str, data_dir, calls: int):
+    loader = CSVLoader(str(data_dir))
+    generator = QuestionGenerator(loader)
+    all_vocab = loader.load_vocabulary('N4')
+    all_grammar = loader.load_grammar('N4')
+
+    cases = [
+        ('_get_similar_vocabulary_items_data', all_vocab,
+         lambda item: legacy_similar_vocabulary_items(all_vocab, item),
+         lambda item: generator._get_similar_vocabulary_items_data(item, random)),
+        ('_get_similar_meanings', all_vocab,
+         lambda item: legacy_similar_meanings(all_vocab, item),
+         lambda item: generator._get_similar_meanings(item, random)),
+        ('_get_similar_translations', all_grammar,
+         lambda item: legacy_similar_translations(all_grammar, item),
+         lambda item: generator._get_similar_translations(item, random)),
+        ('_get_similar_japanese_sentences', all_grammar,
+         lambda item: legacy_similar_japanese_sentences(all_grammar, item),
+         lambda item: generator._get_similar_japanese_sentences(item, random)),
+    ]
+
+    print(f"\n== {label}: {len(all_vocab)} vocabulary rows, {len(all_grammar)} grammar rows ==")
+    print(f"{'function':<36}{'before':>12}{'after':>12}{'speedup':>10}")
+    for name, items, before_func, after_func in cases:
+        before = per_call(before_func, items, calls)
+        after = per_call(after_func, items, calls)
+        print(f"{name:<36}{format_seconds(before):>12}{format_seconds(after):>12}{before / after:>9.0f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=10, help='size multiplier for the synthetic corpus')
+    parser.add_argument('--calls', type=int, default=2000, help='calls per measurement')
+    args = parser.parse_args()
+
+    random.seed(0)
+    run_dataset('N4', DATA_DIR, args.calls)
+    with make_synthetic_data_dir(args.scale) as data_dir:
+        run_dataset(f'synthetic x{args.scale}', data_dir, max(args.calls // 10, 100))
+
+
+if __name__ == "__main__":
+    main()
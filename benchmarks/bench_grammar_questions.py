@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Per-question generation time for grammar questions, with the sentence blank
+looked up from the loader's precomputed blanks versus computed while the
+question is generated.
+
+"precomputed" is QuestionGenerator as shipped; "matcher" blanks each
+question with the level's PatternMatcher and "legacy" with the old
+if/elif hiding functions (benchmarks/legacy_pattern_hiding.py). Also prints
+the compiled-matcher cache counters after loading the corpus with several
+independent loaders.
+
+Usage:
+    python benchmarks/bench_grammar_questions.py [--repeat 5] [--loaders 3]
+"""
+
+import argparse
+import random
+
+from common import DATA_DIR, format_seconds, time_call
+from legacy_pattern_hiding import hide_grammar_pattern_in_hiragana, hide_grammar_pattern_in_kanji
+from src.data.csv_loader import CSVLoader
+from src.data.pattern_matcher import clear_matcher_cache, matcher_cache_info
+from src.data.question_generator import QuestionGenerator
+from src.data.sentence_blanks import BLANK_QUESTION_TYPES, SENTENCE_BLANK, BlankedSentence
+
+
+class MatcherBlankingGenerator(QuestionGenerator):
+    """Blanks the sentence at question time with the level's matcher"""
+
+    def _sentence_blank(self, grammar_item) -> BlankedSentence:
+        matcher = self.csv_loader.get_pattern_matcher('N4')
+        pattern = grammar_item.grammar_pattern
+        return BlankedSentence(matcher.hide(grammar_item.japanese_sentence, pattern, SENTENCE_BLANK),
+                               matcher.hide(grammar_item.hiragana_reading, pattern))
+
+
+class LegacyBlankingGenerator(QuestionGenerator):
+    """Blanks the sentence at question time with the old per-pattern functions"""
+
+    def _sentence_blank(self, grammar_item) -> BlankedSentence:
+        pattern = grammar_item.grammar_pattern
+        return BlankedSentence(hide_grammar_pattern_in_kanji(grammar_item.japanese_sentence, pattern),
+                               hide_grammar_pattern_in_hiragana(grammar_item.hiragana_reading, pattern))
+
+
+def generate_all(generator: QuestionGenerator, items) -> int:
+    generated = 0
+    for item in items:
+        try:
+            generator.generate_grammar_question(item, True)
+            generated += 1
+        except ValueError:
+            pass
+    return generated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='timed repetitions (median)')
+    parser.add_argument('--loaders', type=int, default=3, help='independent loaders for the cache counters')
+    args = parser.parse_args()
+
+    clear_matcher_cache()
+    loaders = [CSVLoader(str(DATA_DIR), use_snapshot=False) for _ in range(args.loaders)]
+    for loader in loaders:
+        loader.load_grammar('N4')
+        loader.get_pattern_matcher('N4')
+    info = matcher_cache_info()
+    print(f"matcher cache after {args.loaders} cold loads: {info['hits']} hits, {info['misses']} misses, "
+          f"{info['size']}/{info['maxsize']} entries")
+
+    loader = loaders[0]
+    grammar = list(loader.load_grammar('N4'))
+    generators = (('precomputed', QuestionGenerator(loader)),
+                  ('matcher', MatcherBlankingGenerator(loader)),
+                  ('legacy', LegacyBlankingGenerator(loader)))
+
+    print(f"\n== n4_grammar.csv: {len(grammar)} rows ==")
+    print(f"{'question type':<24}{'blanking':<13}{'per question':>14}{'generated':>12}")
+    for question_type in BLANK_QUESTION_TYPES:
+        items = [item for item in grammar if item.question_type == question_type]
+        for label, generator in generators:
+            random.seed(0)
+            seconds = time_call(lambda: generate_all(generator, items), args.repeat)
+            generated = generate_all(generator, items)
+            print(f"{question_type:<24}{label:<13}{format_seconds(seconds / len(items)):>14}"
+                  f"{generated:>6}/{len(items)}")
+
+
+if __name__ == "__main__":
+    main()
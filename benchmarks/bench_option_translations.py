@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Cost of option translations when preparing an "all questions" quiz.
+
+Every prepared question is rendered, as the quiz does when it is shown.
+"lazy" is the renderer as shipped: each question carries a LazyTranslations
+that is only built when immediate feedback shows it. "eager" resolves every
+question's translations right after rendering, which is what generation used
+to do. Memory is the marginal size of the rendered questions, excluding the
+corpus and generator they reference.
+
+Usage:
+    python benchmarks/bench_option_translations.py [--repeat 3]
+"""
+
+import argparse
+
+from common import DATA_DIR, format_seconds, time_call
+
+from src.data.csv_loader import CSVLoader
+from src.quiz.quiz_engine import QuizEngine
+from src.utils.memory import deep_sizeof, format_bytes
+
+
+def prepare(engine: QuizEngine, mode: str, eager: bool):
+    engine.prepare_quiz('N4', mode, -1, 'immediate', False, seed=0)
+    questions = [engine.render_question(ref) for ref in engine.questions]
+    if eager:
+        for question in questions:
+            translations = question.get('option_translations')
+            if translations is not None:
+                translations.resolve()
+    return questions
+
+
+def questions_size(engine: QuizEngine, questions) -> int:
+    seen = set()
+    deep_sizeof(engine.csv_loader, seen)
+    deep_sizeof(engine.question_generator, seen)
+    return deep_sizeof(questions, seen)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per measurement (median)')
+    args = parser.parse_args()
+
+    engine = QuizEngine(CSVLoader(str(DATA_DIR)))
+    engine.csv_loader.load_vocabulary('N4')
+    engine.csv_loader.load_grammar('N4')
+
+    print(f"{'mode':<12}{'path':<7}{'questions':>10}{'prepare':>12}{'per question':>14}")
+    for mode in ('vocabulary', 'grammar', 'mixed'):
+        for eager in (False, True):
+            seconds = time_call(lambda: prepare(engine, mode, eager), args.repeat)
+            questions = prepare(engine, mode, eager)
+            count = len(questions)
+            print(f"{mode:<12}{'eager' if eager else 'lazy':<7}{count:>10}{format_seconds(seconds):>12}"
+                  f"{format_bytes(questions_size(engine, questions) // count):>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Compare the pattern matcher with the old per-pattern if/elif hiding
+functions over every row of n4_grammar.csv.
+
+Each row's grammar pattern is hidden in its Japanese sentence and in its
+hiragana reading. "covered" counts rows where something was blanked; the
+legacy functions (benchmarks/legacy_pattern_hiding.py) also blank unrelated
+text in their fallbacks, so their coverage is an upper bound. "matcher build"
+is the one-time per-level setup hide() needs; "automaton build" the
+Aho-Corasick compile the coverage reports trigger on first use; "rules" the
+expansion of data/conjugation_rules.json that `--build-cache` stores
+precompiled.
+
+Usage:
+    python benchmarks/bench_pattern_matcher.py [--repeat 5] [--show-unmatched]
+"""
+
+import argparse
+import time
+
+from common import DATA_DIR, format_seconds, time_call
+from legacy_pattern_hiding import hide_grammar_pattern_in_hiragana, hide_grammar_pattern_in_kanji
+from src.data.csv_loader import CSVLoader
+from src.data.conjugation_rules import expand_rules, load_surface_forms, read_rules, rules_path
+from src.data.pattern_matcher import PatternMatcher
+
+
+def hide_all(hide, rows):
+    return [hide(text, pattern) for text, pattern in rows]
+
+
+def covered(rows, hidden) -> int:
+    return sum(1 for (text, _), result in zip(rows, hidden) if result != text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='timed repetitions (median)')
+    parser.add_argument('--show-unmatched', action='store_true', help='list patterns the matcher misses')
+    args = parser.parse_args()
+
+    loader = CSVLoader(str(DATA_DIR), use_snapshot=False)
+    grammar = list(loader.load_grammar('N4'))
+    patterns = {item.grammar_pattern for item in grammar}
+
+    rules = read_rules(rules_path(DATA_DIR))
+    expand = time_call(lambda: expand_rules(rules), args.repeat)
+    surface_forms = load_surface_forms(DATA_DIR)
+    start = time.perf_counter()
+    matcher = PatternMatcher(patterns, surface_forms)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    list(matcher.find(''))
+    compile_automaton = time.perf_counter() - start
+
+    columns = (
+        ('sentence', [(item.japanese_sentence, item.grammar_pattern) for item in grammar],
+         hide_grammar_pattern_in_kanji, lambda text, pattern: matcher.hide(text, pattern, '____')),
+        ('reading', [(item.hiragana_reading, item.grammar_pattern) for item in grammar],
+         hide_grammar_pattern_in_hiragana, matcher.hide),
+    )
+
+    print(f"== n4_grammar.csv: {len(grammar)} rows, {len(patterns)} patterns ==")
+    print(f"rules expansion {format_seconds(expand)} ({len(surface_forms)} rules)")
+    print(f"matcher build   {format_seconds(build)}")
+    print(f"automaton build {format_seconds(compile_automaton)}")
+    print(f"{'column':<10}{'engine':<10}{'time':>12}{'rows/s':>12}{'covered':>10}")
+    for label, rows, legacy_hide, matcher_hide in columns:
+        for engine, hide in (('legacy', legacy_hide), ('matcher', matcher_hide)):
+            seconds = time_call(lambda: hide_all(hide, rows), args.repeat)
+            hidden = hide_all(hide, rows)
+            print(f"{label:<10}{engine:<10}{format_seconds(seconds):>12}{len(rows) / seconds:>12.0f}"
+                  f"{covered(rows, hidden):>6}/{len(rows)}")
+
+        unmatched = matcher.unmatched_patterns(rows)
+        print(f"  {label}: {len(unmatched)} patterns with unmatched rows")
+        if args.show_unmatched:
+            coverage = matcher.coverage(rows)
+            for pattern in unmatched:
+                counts = coverage[pattern]
+                print(f"    {pattern:<12} {counts['matched']}/{counts['rows']}")
+
+
+if __name__ == "__main__":
+    main()
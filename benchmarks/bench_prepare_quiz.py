@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark QuizEngine.prepare_quiz latency for 25/50/100/all questions.
+
+Compares the sample-first path used by prepare_quiz against the old eager path
+(generate the whole pool, then sample; kept in benchmarks/legacy_prepare_quiz.py)
+on the N4 data and on a synthetic corpus.
+
+Usage:
+    python benchmarks/bench_prepare_quiz.py [--scale 10] [--repeat 3]
+"""
+
+import argparse
+import random
+
+from common import DATA_DIR, format_seconds, make_synthetic_data_dir, time_call
+from legacy_prepare_quiz import prepare_eager
+
+from src.data.csv_loader import CSVLoader
+from src.quiz.quiz_engine import QuizEngine
+
+QUESTION_COUNTS = [25, 50, 100, -1]
+MODES = ['vocabulary', 'grammar', 'mixed']
+
+
+def make_engine(data_dir) -> QuizEngine:
+    """Create a quiz engine reading from data_dir"""
+    return QuizEngine(CSVLoader(str(data_dir)))
+
+
+def run_dataset(label: str, data_dir, repeat: int):
+    engine = make_engine(data_dir)
+    # Warm the loader cache so only question preparation is measured
+    vocab_rows = len(engine.csv_loader.load_vocabulary('N4'))
+    grammar_rows = len(engine.csv_loader.load_grammar('N4'))
+    print(f"\n== {label}: {vocab_rows} vocabulary rows, {grammar_rows} grammar rows ==")
+    print(f"{'mode':<12}{'count':>6}  {'sample-first':>12}  {'eager':>12}")
+
+    for mode in MODES:
+        for count in QUESTION_COUNTS:
+            count_label = 'all' if count == -1 else str(count)
+            lazy = time_call(lambda: engine.prepare_quiz('N4', mode, count, 'immediate', False, seed=0), repeat)
+            eager = time_call(lambda: prepare_eager(engine, 'N4', mode, count, False), repeat)
+            print(f"{mode:<12}{count_label:>6}  {format_seconds(lazy):>12}  {format_seconds(eager):>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=10, help='size multiplier for the synthetic corpus')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per measurement (median)')
+    args = parser.parse_args()
+
+    random.seed(0)
+    run_dataset('N4', DATA_DIR, args.repeat)
+    with make_synthetic_data_dir(args.scale) as data_dir:
+        run_dataset(f'synthetic x{args.scale}', data_dir, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Back-to-back quiz preparation with the same settings: every prepare_quiz
+building its candidate pool from scratch ("cold", the pool cache cleared
+first) against reusing the pool the previous session left in the cache
+("warm"), where only the new session's rows, seeds and option orders are drawn.
+"toggled" is the first session after switching the hiragana setting; pools
+don't depend on it, so that session finds the pool warm too.
+
+A warm pool must prepare the same quiz as a cold one for the same seed;
+the check exits non-zero otherwise.
+
+Usage:
+    python benchmarks/bench_question_pools.py [--scale 10] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+
+from common import DATA_DIR, format_seconds, make_synthetic_data_dir, time_call
+
+from src.data.csv_loader import CSVLoader
+from src.quiz.question_pool import clear_pool_cache, pool_cache_info
+from src.quiz.quiz_engine import QuizEngine
+from src.utils.memory import format_bytes
+
+QUESTION_COUNTS = [25, 100, -1]
+MODES = ['vocabulary', 'grammar', 'mixed']
+
+
+def prepared(engine: QuizEngine):
+    return [(ref.category, ref.position, ref.seed) for ref in engine.questions]
+
+
+def check(engine: QuizEngine) -> bool:
+    ok = True
+    for mode in MODES:
+        for count in QUESTION_COUNTS:
+            clear_pool_cache()
+            engine.prepare_quiz('N4', mode, count, 'immediate', False, seed=1)
+            cold = prepared(engine)
+            engine.prepare_quiz('N4', mode, count, 'immediate', False, seed=1)
+            if prepared(engine) != cold:
+                print(f"FAIL {mode} {count}: warm pool prepared a different quiz")
+                ok = False
+    return ok
+
+
+def run_dataset(label: str, data_dir, repeat: int):
+    engine = QuizEngine(CSVLoader(str(data_dir)))
+    # Warm the loader cache so only question preparation is measured
+    vocab_rows = len(engine.csv_loader.load_vocabulary('N4'))
+    grammar_rows = len(engine.csv_loader.load_grammar('N4'))
+    print(f"\n== {label}: {vocab_rows} vocabulary rows, {grammar_rows} grammar rows ==")
+    if not check(engine):
+        sys.exit(1)
+
+    def prepare_cold(mode, count):
+        clear_pool_cache()
+        engine.prepare_quiz('N4', mode, count, 'immediate', False)
+
+    print(f"{'mode':<12}{'count':>6}{'cold':>12}{'warm':>12}{'toggled':>12}")
+    for mode in MODES:
+        for count in QUESTION_COUNTS:
+            cold = time_call(lambda: prepare_cold(mode, count), repeat)
+            engine.prepare_quiz('N4', mode, count, 'immediate', False)
+            warm = time_call(lambda: engine.prepare_quiz('N4', mode, count, 'immediate', False), repeat)
+            prepare_cold(mode, count)
+            start = time.perf_counter()
+            engine.prepare_quiz('N4', mode, count, 'immediate', True)
+            toggled = time.perf_counter() - start
+            count_label = 'all' if count == -1 else str(count)
+            print(f"{mode:<12}{count_label:>6}{format_seconds(cold):>12}{format_seconds(warm):>12}"
+                  f"{format_seconds(toggled):>12}")
+
+    info = pool_cache_info()
+    print(f"pool cache: {info['size']}/{info['maxsize']} pools, "
+          f"{format_bytes(info['bytes'])} of {format_bytes(info['maxbytes'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=10, help='size multiplier for the synthetic corpus')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per measurement (median)')
+    args = parser.parse_args()
+
+    run_dataset('N4', DATA_DIR, args.repeat)
+    with make_synthetic_data_dir(args.scale) as data_dir:
+        run_dataset(f'synthetic x{args.scale}', data_dir, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Memory of a prepared "all questions" session: the compact QuestionRefs the
+engine keeps versus the same questions as rendered dicts (how prepared
+questions used to be stored), on the N4 data and a synthetic corpus.
+
+Sizes are marginal, excluding the corpus and generator the questions
+reference. "render" is the per-question cost of get_current_question for a
+question that is not the cached current one.
+
+Usage:
+    python benchmarks/bench_question_refs.py [--scale 10] [--repeat 3]
+"""
+
+import argparse
+import time
+
+from common import DATA_DIR, format_seconds, make_synthetic_data_dir, time_call
+
+from src.data.csv_loader import CSVLoader
+from src.quiz.quiz_engine import QuizEngine
+from src.utils.memory import deep_sizeof, format_bytes
+
+
+def marginal_size(engine: QuizEngine, obj) -> int:
+    seen = set()
+    deep_sizeof(engine.csv_loader, seen)
+    deep_sizeof(engine.question_generator, seen)
+    return deep_sizeof(obj, seen)
+
+
+def run_dataset(label: str, data_dir, repeat: int):
+    engine = QuizEngine(CSVLoader(str(data_dir)))
+    engine.csv_loader.load_vocabulary('N4')
+    engine.csv_loader.load_grammar('N4')
+
+    print(f"\n== {label} ==")
+    print(f"{'mode':<12}{'questions':>10}{'prepare':>12}{'refs':>12}{'rendered':>12}{'render':>12}")
+    for mode in ('vocabulary', 'grammar', 'mixed'):
+        prepare = time_call(lambda: engine.prepare_quiz('N4', mode, -1, 'immediate', False, seed=0), repeat)
+        refs = engine.questions
+        count = len(refs)
+
+        start = time.perf_counter()
+        rendered = [engine.render_question(ref) for ref in refs]
+        render = (time.perf_counter() - start) / count
+
+        print(f"{mode:<12}{count:>10}{format_seconds(prepare):>12}{format_bytes(marginal_size(engine, refs)):>12}"
+              f"{format_bytes(marginal_size(engine, rendered)):>12}{format_seconds(render):>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=10, help='size multiplier for the synthetic corpus')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per measurement (median)')
+    args = parser.parse_args()
+
+    run_dataset('N4', DATA_DIR, args.repeat)
+    with make_synthetic_data_dir(args.scale) as data_dir:
+        run_dataset(f'synthetic x{args.scale}', data_dir, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
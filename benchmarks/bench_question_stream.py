@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Time until the first question can be shown, for the prepared engine (every
+question is generated before the quiz starts) against the streaming engine
+(questions are generated by a background thread a few ahead of the quiz).
+
+"first" is prepare_quiz plus get_current_question; "walk" additionally
+reads every question in order, as a quiz that is answered instantly would.
+A seeded streaming quiz of N questions must match the prepared one; the
+check exits non-zero otherwise.
+
+Usage:
+    python benchmarks/bench_question_stream.py [--scale 10] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+
+from common import DATA_DIR, format_seconds, make_synthetic_data_dir, time_call
+
+from src.data.csv_loader import CSVLoader
+from src.quiz.quiz_engine import QuizEngine
+
+QUESTION_COUNTS = [25, -1]
+MODES = ['vocabulary', 'grammar', 'mixed']
+
+
+def first_question(engine: QuizEngine, mode: str, count: int):
+    engine.prepare_quiz('N4', mode, count, 'immediate', False, seed=0)
+    engine.start_quiz()
+    return engine.get_current_question()
+
+
+def walk(engine: QuizEngine, mode: str, count: int) -> int:
+    first_question(engine, mode, count)
+    while engine.next_question():
+        engine.get_current_question()
+    return engine.current_question_index
+
+
+def check(loader: CSVLoader) -> bool:
+    prepared, streaming = QuizEngine(loader), QuizEngine(loader, streaming=True)
+    ok = True
+    for mode in MODES:
+        prepared.prepare_quiz('N4', mode, 50, 'immediate', False, seed=1)
+        expected = [prepared.render_question(ref)['id'] for ref in prepared.questions]
+        streaming.prepare_quiz('N4', mode, 50, 'immediate', False, seed=1)
+        streamed = [streaming.questions[index]['id'] for index in range(len(expected))]
+        if streamed != expected or streaming.questions.has(len(expected)):
+            print(f"FAIL {mode}: streamed questions differ from the prepared quiz")
+            ok = False
+    return ok
+
+
+def run_dataset(label: str, data_dir, repeat: int):
+    loader = CSVLoader(str(data_dir))
+    # Warm the loader cache so only question preparation is measured
+    vocab_rows = len(loader.load_vocabulary('N4'))
+    grammar_rows = len(loader.load_grammar('N4'))
+    print(f"\n== {label}: {vocab_rows} vocabulary rows, {grammar_rows} grammar rows ==")
+    if not check(loader):
+        sys.exit(1)
+
+    engines = {'prepared': QuizEngine(loader), 'streaming': QuizEngine(loader, streaming=True)}
+    print(f"{'mode':<12}{'count':>6}{'engine':>11}{'first':>12}{'walk':>12}")
+    for mode in MODES:
+        for count in QUESTION_COUNTS:
+            for name, engine in engines.items():
+                first = time_call(lambda: first_question(engine, mode, count), repeat)
+                start = time.perf_counter()
+                walk(engine, mode, count)
+                walked = time.perf_counter() - start
+                count_label = 'all' if count == -1 else str(count)
+                print(f"{mode:<12}{count_label:>6}{name:>11}{format_seconds(first):>12}{format_seconds(walked):>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=10, help='size multiplier for the synthetic corpus')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per measurement (median)')
+    args = parser.parse_args()
+
+    run_dataset('N4', DATA_DIR, args.repeat)
+    with make_synthetic_data_dir(args.scale) as data_dir:
+        run_dataset(f'synthetic x{args.scale}', data_dir, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Measure corpus memory for row dicts, slotted records and normalized tables.
+
+The dict rows are parsed the way CSVLoader did before it produced records (one
+dict per row, no string interning). "records" is one VocabItem/GrammarItem per
+row; "table" is the normalized CorpusTable CSVLoader caches (one entity per
+word or sentence plus array-coded rows). Each layout is measured with
+deep_sizeof and with tracemalloc on a synthetic N1-sized corpus (about 10,000
+words).
+
+Usage:
+    python benchmarks/bench_record_memory.py [--scale 9]
+"""
+
+import argparse
+import csv
+import gc
+import tracemalloc
+
+from common import DATA_DIR, format_seconds, make_synthetic_data_dir, time_call
+from src.data.csv_loader import CSVLoader, _parse_int
+from src.data.corpus_table import CorpusTable
+from src.data.records import VocabItem, GrammarItem
+from src.utils.memory import deep_sizeof, format_bytes
+
+
+def read_dict_rows(filepath):
+    """Legacy layout: one dict per CSV row"""
+    with open(filepath, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = []
+        for values in reader:
+            if not values:
+                continue
+            values[header.index('difficulty')] = _parse_int(values[header.index('difficulty')])
+            rows.append(dict(zip(header, values)))
+    return rows
+
+
+def load_dicts(data_dir):
+    return (read_dict_rows(data_dir / 'n4_vocabulary.csv'),
+            read_dict_rows(data_dir / 'n4_grammar.csv'))
+
+
+def load_records(data_dir):
+    loader = CSVLoader(str(data_dir), use_snapshot=False)
+    return loader._read_rows(data_dir / 'n4_vocabulary.csv', loader.VOCABULARY_COLUMNS, VocabItem)[0], \
+        loader._read_rows(data_dir / 'n4_grammar.csv', loader.GRAMMAR_COLUMNS, GrammarItem)[0]
+
+
+def load_tables(data_dir):
+    vocabulary, grammar = load_records(data_dir)
+    return CorpusTable.from_records(vocabulary, VocabItem), CorpusTable.from_records(grammar, GrammarItem)
+
+
+def traced_size(load, data_dir) -> int:
+    """Bytes still allocated once load(data_dir) has returned"""
+    gc.collect()
+    tracemalloc.start()
+    result = load(data_dir)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def run_dataset(label: str, data_dir):
+    vocabulary, grammar = load_dicts(data_dir)
+    print(f"\n== {label}: {len(vocabulary)} vocabulary rows, {len(grammar)} grammar rows ==")
+    print(f"{'layout':<10}{'vocabulary':>14}{'grammar':>14}{'deep total':>14}{'traced':>14}{'load':>12}")
+
+    results = {}
+    for name, load in (('dicts', load_dicts), ('records', load_records), ('table', load_tables)):
+        vocabulary, grammar = load(data_dir)
+        seen = set()
+        vocabulary_size = deep_sizeof(vocabulary, seen)
+        grammar_size = deep_sizeof(grammar, seen)
+        traced = traced_size(load, data_dir)
+        load_time = time_call(lambda: load(data_dir), repeat=3)
+        results[name] = vocabulary_size + grammar_size
+        print(f"{name:<10}{format_bytes(vocabulary_size):>14}{format_bytes(grammar_size):>14}"
+              f"{format_bytes(vocabulary_size + grammar_size):>14}{format_bytes(traced):>14}"
+              f"{format_seconds(load_time):>12}")
+
+    for name in ('records', 'table'):
+        print(f"{name} use {results[name] / results['dicts']:.0%} of the dict layout")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=9, help='size multiplier for the synthetic corpus (9 ~ N1)')
+    args = parser.parse_args()
+
+    run_dataset('N4', DATA_DIR)
+    with make_synthetic_data_dir(args.scale) as data_dir:
+        run_dataset(f'synthetic x{args.scale}', data_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Measure what row filters cost on top of the full corpus tables.
+
+"full" loads the tables a quiz mode needs. "quiz" runs prepare_quiz, which
+asks for the rows its question types can use; on these CSVs that is every
+row, so it must hold the same tables as "full" and parse each CSV once.
+"difficulty 1" adds a real selection (one difficulty) to the full tables.
+Snapshots are disabled so every run parses the CSVs. "rows" counts rows in
+the distinct cached tables, "bytes" what the loader holds afterwards and
+"peak" the most memory allocated while loading. The run exits non-zero if
+"quiz" parses a CSV twice or caches a second copy of a table.
+
+Usage:
+    python benchmarks/bench_row_filters.py [--scale 10]
+"""
+
+import argparse
+import sys
+import tracemalloc
+
+from common import DATA_DIR, format_seconds, make_synthetic_data_dir, time_call
+from src.data.corpus_table import RowFilter
+from src.data.csv_loader import CSVLoader
+from src.quiz.quiz_engine import QuizEngine
+from src.utils.memory import format_bytes
+
+MODES = ('vocabulary', 'grammar', 'mixed')
+
+
+def load_full(data_dir, mode: str) -> CSVLoader:
+    loader = CSVLoader(str(data_dir), use_snapshot=False)
+    if mode in ('vocabulary', 'mixed'):
+        loader.load_vocabulary_table('N4')
+    if mode in ('grammar', 'mixed'):
+        loader.load_grammar_table('N4')
+    return loader
+
+
+def load_quiz(data_dir, mode: str) -> CSVLoader:
+    loader = CSVLoader(str(data_dir), use_snapshot=False)
+    QuizEngine(loader).prepare_quiz('N4', mode, 25, 'immediate', False)
+    return loader
+
+
+def load_selection(data_dir, mode: str) -> CSVLoader:
+    loader = CSVLoader(str(data_dir), use_snapshot=False)
+    row_filter = RowFilter.create(difficulties=[1])
+    if mode in ('vocabulary', 'mixed'):
+        loader.load_vocabulary_table('N4', row_filter)
+    if mode in ('grammar', 'mixed'):
+        loader.load_grammar_table('N4', row_filter)
+    return loader
+
+
+STRATEGIES = (('full', load_full), ('quiz', load_quiz), ('difficulty 1', load_selection))
+
+
+def peak_bytes(load, data_dir, mode: str) -> int:
+    """Peak bytes allocated while loading, including rows parsed and then discarded"""
+    tracemalloc.start()
+    load(data_dir, mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def materialized(loader: CSVLoader):
+    """(rows, unique entities, bytes) held by a loader's distinct cached tables"""
+    tables = {id(table): table for cache in (loader.vocabulary_cache, loader.grammar_cache)
+              for table in cache.values()}.values()
+    rows = sum(len(table) for table in tables)
+    entities = len({id(entity) for table in tables for entity in table.entities})
+    return rows, entities, loader.memory_footprint()['total']
+
+
+def parses(load, data_dir, mode: str) -> int:
+    """Number of CSV files parsed by one load"""
+    count = 0
+    read_rows = CSVLoader._read_rows
+
+    def counting(self, *args):
+        nonlocal count
+        count += 1
+        return read_rows(self, *args)
+
+    CSVLoader._read_rows = counting
+    try:
+        load(data_dir, mode)
+    finally:
+        CSVLoader._read_rows = read_rows
+    return count
+
+
+def check(data_dir) -> bool:
+    ok = True
+    for mode in MODES:
+        full, quiz = load_full(data_dir, mode), load_quiz(data_dir, mode)
+        if parses(load_quiz, data_dir, mode) != parses(load_full, data_dir, mode):
+            print(f"FAIL {mode}: prepare_quiz parsed a CSV more than once")
+            ok = False
+        if materialized(quiz)[:2] != materialized(full)[:2]:
+            print(f"FAIL {mode}: prepare_quiz cached tables {materialized(quiz)[:2]}, "
+                  f"the full tables are {materialized(full)[:2]}")
+            ok = False
+    return ok
+
+
+def run_dataset(label: str, data_dir):
+    print(f"\n== {label} ==")
+    if not check(data_dir):
+        sys.exit(1)
+    print(f"{'mode':<12}{'strategy':<14}{'rows':>8}{'entities':>10}{'bytes':>12}{'peak':>12}{'time':>12}")
+    for mode in MODES:
+        for strategy, load in STRATEGIES:
+            rows, entities, size = materialized(load(data_dir, mode))
+            peak = peak_bytes(load, data_dir, mode)
+            seconds = time_call(lambda: load(data_dir, mode), repeat=3)
+            print(f"{mode:<12}{strategy:<14}{rows:>8}{entities:>10}"
+                  f"{format_bytes(size):>12}{format_bytes(peak):>12}{format_seconds(seconds):>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=10, help='size multiplier for the synthetic corpus')
+    args = parser.parse_args()
+
+    run_dataset('N4', DATA_DIR)
+    with make_synthetic_data_dir(args.scale) as data_dir:
+        run_dataset(f'synthetic x{args.scale}', data_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark time-to-first-question from a cold interpreter.
+
+Each run starts a fresh Python process that imports the quiz engine, prepares
+a 25-question quiz and renders the first question, once loading from the CSV
+files and once from a compiled corpus snapshot (see `--build-cache`).
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--mode vocabulary]
+"""
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from common import DATA_DIR, PROJECT_ROOT, format_seconds
+
+from src.data.csv_loader import CSVLoader
+
+# Runs in the child process; prints "<seconds> <pandas imported>"
+CHILD_SCRIPT = '''
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, {project_root!r})
+from src.data.csv_loader import CSVLoader
+from src.quiz.quiz_engine import QuizEngine
+engine = QuizEngine(CSVLoader({data_dir!r}, use_snapshot={use_snapshot!r}))
+engine.prepare_quiz('N4', {mode!r}, 25, 'immediate', False)
+engine.start_quiz()
+assert engine.get_current_question() is not None
+print(time.perf_counter() - start, 'pandas' in sys.modules)
+'''
+
+
+def time_first_question(data_dir: Path, use_snapshot: bool, mode: str, runs: int):
+    """Median in-process time-to-first-question and whether pandas got imported"""
+    script = CHILD_SCRIPT.format(project_root=str(PROJECT_ROOT), data_dir=str(data_dir),
+                                 use_snapshot=use_snapshot, mode=mode)
+    timings = []
+    pandas_imported = False
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True,
+                                text=True, check=True).stdout.split()
+        timings.append(float(output[-2]))
+        pandas_imported = output[-1] == 'True'
+    return statistics.median(timings), pandas_imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='cold starts per configuration (median)')
+    parser.add_argument('--mode', default='mixed', choices=['vocabulary', 'grammar', 'mixed'])
+    args = parser.parse_args()
+
+    # Work on a copy so the benchmark never touches the real snapshot directory
+    with tempfile.TemporaryDirectory(prefix='jlpt-bench-startup-') as target:
+        data_dir = Path(target)
+        for csv_file in DATA_DIR.glob('*.csv'):
+            shutil.copy(csv_file, data_dir)
+        CSVLoader(str(data_dir)).build_snapshot('N4')
+
+        print(f"time to first question ({args.mode}, 25 questions, median of {args.runs} cold starts)")
+        for label, use_snapshot in (('CSV', False), ('snapshot', True)):
+            seconds, pandas_imported = time_first_question(data_dir, use_snapshot, args.mode, args.runs)
+            print(f"  {label:<10}{format_seconds(seconds):>12}   pandas imported: {pandas_imported}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Compare validating every level one process at a time against the single
+`--validate --level all` run.
+
+A synthetic data directory holds a copy of the N4 corpus under each of
+N5-N1. "per level" runs `src/main.py --validate --level <L>` once per level,
+as `make validate-all` used to; "all" runs `--level all` once. The in-process
+section times validate_levels with increasing worker counts.
+
+Usage:
+    python benchmarks/bench_validate_levels.py [--scale 5] [--runs 3]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from common import PROJECT_ROOT, format_seconds, make_synthetic_data_dir, time_call
+from src.data.csv_loader import CSVLoader
+from src.data.validation import validate_levels
+
+# Runs main() against another data directory; prints nothing but the report
+CHILD_SCRIPT = '''
+import os, sys
+sys.path.insert(0, {project_root!r})
+os.chdir({data_parent!r})
+sys.argv = ['main.py', '--validate', '--level', {level!r}]
+from src.main import main
+main(standalone_mode=False)
+'''
+
+
+@contextmanager
+def make_all_levels_dir(scale: int):
+    """Synthetic data directory with the same corpus under every level, deleted on exit"""
+    with make_synthetic_data_dir(scale) as data_dir, tempfile.TemporaryDirectory(prefix='jlpt-bench-root-') as root:
+        for level in CSVLoader.LEVELS:
+            for category in ('vocabulary', 'grammar'):
+                target = data_dir / f"{level.lower()}_{category}.csv"
+                if not target.exists():
+                    shutil.copy(data_dir / f"n4_{category}.csv", target)
+        # main.py reads ./data, so expose the directory under that name
+        parent = Path(root)
+        (parent / "data").symlink_to(data_dir)
+        yield data_dir, parent
+
+
+def run_cli(parent, levels, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for level in levels:
+            script = CHILD_SCRIPT.format(project_root=str(PROJECT_ROOT), data_parent=str(parent), level=level)
+            subprocess.run([sys.executable, '-c', script], capture_output=True, check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=5, help='size multiplier for each level\'s corpus')
+    parser.add_argument('--runs', type=int, default=3, help='repetitions (median)')
+    args = parser.parse_args()
+
+    with make_all_levels_dir(args.scale) as (data_dir, parent):
+        levels = list(CSVLoader.LEVELS)
+
+        print(f"== CLI, {len(levels)} levels x{args.scale} (median of {args.runs}) ==")
+        print(f"{'per level':<14}{format_seconds(run_cli(parent, levels, args.runs)):>12}")
+        print(f"{'all':<14}{format_seconds(run_cli(parent, ['all'], args.runs)):>12}")
+
+        cores = os.cpu_count() or 1
+        print(f"\n== validate_levels in process ({cores} cores) ==")
+        worker_counts = sorted({1, min(2, cores), min(len(levels), cores)})
+        for workers in worker_counts:
+            seconds = time_call(lambda: validate_levels(str(data_dir), levels, max_workers=workers), repeat=args.runs)
+            print(f"{workers:>2} workers    {format_seconds(seconds):>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Time the rule-based integrity checks against the old per-row validation loop.
+
+The legacy loop is the row-by-row `if` chain validate_data_integrity used to
+run (missing fields and difficulty only). The rule engine runs every rule in
+src/data/integrity.py column-wise over the cached tables. Loading is excluded
+from both timings. The synthetic corpus suffixes readings with copy numbers,
+so its hiragana_not_kana warnings are expected.
+
+Usage:
+    python benchmarks/bench_validation.py [--scale 31] [--repeat 5]
+"""
+
+import argparse
+
+from common import DATA_DIR, format_seconds, make_synthetic_data_dir, time_call
+from src.data.csv_loader import CSVLoader
+from src.data.integrity import build_report
+
+
+def legacy_validate(vocab_data, grammar_data):
+    """Row-by-row checks as validate_data_integrity ran them before the rule engine"""
+    issues = {'vocabulary': [], 'grammar': []}
+    for i, item in enumerate(vocab_data):
+        if not item.get('kanji'):
+            issues['vocabulary'].append(f"Row {i+1}: Missing kanji")
+        if not item.get('hiragana'):
+            issues['vocabulary'].append(f"Row {i+1}: Missing hiragana")
+        if not item.get('korean_meaning'):
+            issues['vocabulary'].append(f"Row {i+1}: Missing Korean meaning")
+        if item.get('difficulty') not in [1, 2, 3]:
+            issues['vocabulary'].append(f"Row {i+1}: Invalid difficulty level")
+    for i, item in enumerate(grammar_data):
+        if not item.get('grammar_pattern'):
+            issues['grammar'].append(f"Row {i+1}: Missing grammar pattern")
+        if not item.get('japanese_sentence'):
+            issues['grammar'].append(f"Row {i+1}: Missing Japanese sentence")
+        if not item.get('korean_translation'):
+            issues['grammar'].append(f"Row {i+1}: Missing Korean translation")
+        if item.get('difficulty') not in [1, 2, 3]:
+            issues['grammar'].append(f"Row {i+1}: Invalid difficulty level")
+    return issues
+
+
+def run_dataset(label: str, data_dir, repeat: int):
+    loader = CSVLoader(str(data_dir), use_snapshot=False)
+    tables = {'vocabulary': loader.load_vocabulary_table('N4'), 'grammar': loader.load_grammar_table('N4')}
+    # The legacy loop walked fully materialized rows
+    vocab_rows = list(loader.load_vocabulary('N4'))
+    grammar_rows = list(loader.load_grammar('N4'))
+    total_rows = len(vocab_rows) + len(grammar_rows)
+
+    legacy = time_call(lambda: legacy_validate(vocab_rows, grammar_rows), repeat)
+    engine = time_call(lambda: build_report('N4', tables), repeat)
+    report = build_report('N4', tables)
+
+    print(f"\n== {label}: {total_rows} rows ==")
+    print(f"{'legacy loop (4 checks)':<28}{format_seconds(legacy):>12}")
+    print(f"{'rule engine (all rules)':<28}{format_seconds(engine):>12}")
+    for category, result in report['categories'].items():
+        counts = ', '.join(f"{issue['rule']}={issue['count']}" for issue in result['issues']) or 'no issues'
+        print(f"  {category}: {counts}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=31, help='size multiplier (31 ~ 100k vocabulary rows)')
+    parser.add_argument('--repeat', type=int, default=5, help='timed repetitions (median)')
+    args = parser.parse_args()
+
+    run_dataset('N4', DATA_DIR, args.repeat)
+    with make_synthetic_data_dir(args.scale) as data_dir:
+        run_dataset(f'synthetic x{args.scale}', data_dir, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
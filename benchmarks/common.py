@@ -0,0 +1,82 @@
+"""Shared helpers for JLPT quiz benchmarks"""
+
+import csv
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List
+
+# Add project root directory to Python path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+DATA_DIR = PROJECT_ROOT / "data"
+
+# Text columns that get a copy suffix so synthetic rows stay distinct
+VOCABULARY_TEXT_COLUMNS = ['kanji', 'hiragana', 'korean_meaning']
+GRAMMAR_TEXT_COLUMNS = ['japanese_sentence', 'hiragana_reading', 'korean_translation']
+
+
+def time_call(func: Callable, repeat: int = 5) -> float:
+    """Return the median wall time of func() in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration for benchmark tables"""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:8.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:8.1f} ms"
+    return f"{seconds:8.2f} s "
+
+
+def _read_csv(filepath: Path) -> List[Dict[str, str]]:
+    with open(filepath, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def _write_csv(filepath: Path, rows: List[Dict[str, str]], fieldnames: List[str]):
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _scale_rows(rows: List[Dict[str, str]], scale: int, text_columns: List[str]) -> List[Dict[str, str]]:
+    """Repeat rows `scale` times, suffixing text columns so every copy is a distinct entry"""
+    scaled = list(rows)
+    for copy in range(1, scale):
+        for row in rows:
+            new_row = dict(row)
+            for column in text_columns:
+                if new_row.get(column):
+                    new_row[column] = f"{new_row[column]}{copy}"
+            scaled.append(new_row)
+    return scaled
+
+
+@contextmanager
+def make_synthetic_data_dir(scale: int, level: str = "N4", source_level: str = "N4") -> Iterator[Path]:
+    """Write a synthetic corpus `scale` times the size of the real one into a temp directory.
+
+    The directory, and any snapshot cache built inside it, is deleted when the context exits.
+    """
+    with tempfile.TemporaryDirectory(prefix=f"jlpt-bench-x{scale}-") as target:
+        target_dir = Path(target)
+        for kind, text_columns in (('vocabulary', VOCABULARY_TEXT_COLUMNS),
+                                   ('grammar', GRAMMAR_TEXT_COLUMNS)):
+            source = DATA_DIR / f"{source_level.lower()}_{kind}.csv"
+            rows = _read_csv(source)
+            fieldnames = list(rows[0].keys())
+            _write_csv(target_dir / f"{level.lower()}_{kind}.csv",
+                       _scale_rows(rows, scale, text_columns), fieldnames)
+        yield target_dir
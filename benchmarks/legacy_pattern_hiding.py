@@ -0,0 +1,44 @@
+"""
+The pattern-hiding functions QuestionGenerator used before the Aho-Corasick
+matcher (src/data/pattern_matcher.py), the baseline for bench_pattern_matcher.py
+and bench_grammar_questions.py.
+
+They are read from the repository's first commit with git rather than kept
+as a copy here, so the benchmarks need a git checkout.
+"""
+
+import ast
+import subprocess
+import sys
+
+from common import PROJECT_ROOT
+
+SOURCE_PATH = 'src/data/question_generator.py'
+METHODS = ('_hide_grammar_pattern_in_hiragana', '_hide_grammar_pattern_in_kanji', '_handle_remaining_pattern_fixes')
+
+
+def _git(*args) -> str:
+    return subprocess.run(['git', *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True).stdout
+
+
+def _load_methods():
+    """Compile the hiding methods of the first commit's QuestionGenerator into a class of their own"""
+    try:
+        baseline = _git('rev-list', '--max-parents=0', 'HEAD').split()[-1]
+        source = _git('show', f'{baseline}:{SOURCE_PATH}')
+    except (OSError, subprocess.CalledProcessError) as e:
+        sys.exit(f"The legacy baseline is read from git history: {e}")
+
+    generator = next(node for node in ast.parse(source).body
+                     if isinstance(node, ast.ClassDef) and node.name == 'QuestionGenerator')
+    methods = [node for node in generator.body if isinstance(node, ast.FunctionDef) and node.name in METHODS]
+    module = ast.Module(body=[ast.ClassDef(name='LegacyHiding', bases=[], keywords=[], body=methods,
+                                           decorator_list=[])], type_ignores=[])
+    namespace = {}
+    exec(compile(ast.fix_missing_locations(module), f'{baseline[:7]}:{SOURCE_PATH}', 'exec'), namespace)
+    return namespace['LegacyHiding']()
+
+
+_legacy = _load_methods()
+hide_grammar_pattern_in_hiragana = _legacy._hide_grammar_pattern_in_hiragana
+hide_grammar_pattern_in_kanji = _legacy._hide_grammar_pattern_in_kanji
@@ -0,0 +1,53 @@
+"""
+The eager question preparation QuizEngine used before prepare_quiz sampled
+rows first: every eligible row is generated, then the quiz is sampled from
+the result. Kept as the baseline for bench_prepare_quiz.py.
+"""
+
+import random
+from typing import Dict, List
+
+from src.data.sentence_blanks import BLANK_QUESTION_TYPES
+from src.quiz.quiz_engine import QuizEngine
+
+
+def prepare_vocabulary_questions(engine: QuizEngine, vocab_data: List[Dict], show_hiragana: bool) -> List[Dict]:
+    """Prepare vocabulary questions from data"""
+    questions = []
+    for item in vocab_data:
+        # Skip reading questions when hiragana is being displayed
+        if show_hiragana and item.question_type == 'reading':
+            continue
+        question = engine._generate_question('vocabulary', item, show_hiragana, engine.rng)
+        if question is not None:
+            questions.append(question)
+    return questions
+
+
+def prepare_grammar_questions(engine: QuizEngine, grammar_data: List[Dict], show_hiragana: bool) -> List[Dict]:
+    """Prepare grammar questions from data"""
+    blanks = engine.csv_loader.get_sentence_blanks(engine.quiz_config.get('level', 'N4'),
+                                                   engine.question_generator.grammar_filter)
+    questions = []
+    for item in grammar_data:
+        if item.question_type not in engine.GRAMMAR_QUESTION_TYPES:
+            continue
+        if item.question_type in BLANK_QUESTION_TYPES and item not in blanks:
+            continue
+        question = engine._generate_question('grammar', item, show_hiragana, engine.rng)
+        if question is not None:
+            questions.append(question)
+    return questions
+
+
+def prepare_eager(engine: QuizEngine, level: str, mode: str, question_count: int, show_hiragana: bool) -> List[Dict]:
+    """Generate every question of the mode, then sample question_count of them (-1 for all)"""
+    pool = []
+    if mode in ('vocabulary', 'mixed'):
+        pool += prepare_vocabulary_questions(engine, engine.csv_loader.load_vocabulary(level), show_hiragana)
+    if mode in ('grammar', 'mixed'):
+        pool += prepare_grammar_questions(engine, engine.csv_loader.load_grammar(level), show_hiragana)
+    if question_count == -1:
+        random.shuffle(pool)
+        return pool
+    return random.sample(pool, min(question_count, len(pool)))
@@ -0,0 +1,129 @@
+"""Declarative conjugation rules for grammar patterns, compiled into a surface-form table"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from .corpus_snapshot import SNAPSHOT_DIR, read_snapshot, source_hash, write_snapshot
+
+RULES_FILENAME = 'conjugation_rules.json'
+COMPILED_FILENAME = 'surface_forms.snapshot'
+# Used when a data directory has no rules file of its own (e.g. benchmark corpora)
+DEFAULT_RULES_PATH = Path(__file__).resolve().parent.parent.parent / 'data' / RULES_FILENAME
+
+# rules file (path, mtime_ns, size) -> SurfaceForms, so every loader and generator shares one table
+_loaded = {}
+_lock = threading.Lock()
+
+
+def base_form(pattern: str) -> str:
+    """Pattern without a trailing usage note such as （推測）"""
+    if pattern.endswith('）') and '（' in pattern:
+        return pattern[:pattern.rindex('（')]
+    return pattern
+
+
+class SurfaceForms:
+    """Pattern -> surface forms (kanji and kana spellings, conjugated) table"""
+
+    def __init__(self, table: Dict[str, Tuple[str, ...]], default_suffixes: Iterable[str] = ()):
+        self.table = table
+        self.default_suffixes = tuple(default_suffixes)
+
+    def forms(self, pattern: str) -> Tuple[str, ...]:
+        """Every surface form of pattern; unknown patterns get the default suffixes"""
+        forms = self.table.get(pattern)
+        if forms is None:
+            base = base_form(pattern)
+            forms = _unique([pattern, base] + [base + suffix for suffix in self.default_suffixes])
+        return forms
+
+    def __contains__(self, pattern: str) -> bool:
+        return pattern in self.table
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+
+def _unique(forms: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(form for form in dict.fromkeys(forms) if form)
+
+
+def _expand_pattern(pattern: str, rules: Dict, seen: Tuple[str, ...] = ()) -> List[str]:
+    spec = rules['patterns'].get(pattern, {})
+    forms = [pattern, base_form(pattern)]
+    if 'same_as' in spec:
+        if spec['same_as'] in seen:
+            raise ValueError(f"Circular same_as for grammar pattern: {pattern}")
+        return forms + _expand_pattern(spec['same_as'], rules, seen + (pattern,))
+
+    conjugation = None
+    if 'conjugation' in spec:
+        conjugation = rules['conjugations'].get(spec['conjugation'])
+        if conjugation is None:
+            raise ValueError(f"Unknown conjugation class for {pattern}: {spec['conjugation']}")
+
+    for spelling in [spec.get('lemma', base_form(pattern))] + list(spec.get('readings', ())):
+        forms.append(spelling)
+        if conjugation is not None:
+            suffix = conjugation['suffix']
+            if not spelling.endswith(suffix):
+                raise ValueError(f"{pattern}: '{spelling}' does not end in '{suffix}' ({spec['conjugation']})")
+            stem = spelling[:len(spelling) - len(suffix)]
+            forms.extend(stem + ending for ending in conjugation['endings'])
+        forms.extend(spelling + suffix for suffix in spec.get('suffixes', ()))
+    forms.extend(spec.get('forms', ()))
+    return forms
+
+
+def expand_rules(rules: Dict) -> SurfaceForms:
+    """Expand a rules document into the pattern -> surface forms table"""
+    table = {pattern: _unique(_expand_pattern(pattern, rules)) for pattern in rules['patterns']}
+    return SurfaceForms(table, rules.get('default_suffixes', ()))
+
+
+def rules_path(data_dir) -> Path:
+    """The rules file for a data directory, falling back to the project's rules"""
+    path = Path(data_dir) / RULES_FILENAME
+    return path if path.exists() else DEFAULT_RULES_PATH
+
+
+def compiled_path(path: Path) -> Path:
+    """Where the compiled table for a rules file is written"""
+    return Path(path).parent / SNAPSHOT_DIR / COMPILED_FILENAME
+
+
+def read_rules(path: Path) -> Dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compile_surface_forms(data_dir) -> Path:
+    """Build step: expand the rules once and store the table next to the corpus snapshots"""
+    path = rules_path(data_dir)
+    content_hash = source_hash([path])
+    surface_forms = expand_rules(read_rules(path))
+    target = compiled_path(path)
+    write_snapshot(target, content_hash,
+                   {'table': surface_forms.table, 'default_suffixes': surface_forms.default_suffixes})
+    return target
+
+
+def load_surface_forms(data_dir) -> SurfaceForms:
+    """Load the surface-form table for a data directory, once per version of its rules file.
+
+    The compiled table is used when it matches the rules; otherwise the rules
+    are expanded in memory (see compile_surface_forms).
+    """
+    path = rules_path(data_dir)
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        if key not in _loaded:
+            payload = read_snapshot(compiled_path(path), source_hash([path]))
+            if payload is not None:
+                _loaded[key] = SurfaceForms(payload['table'], payload['default_suffixes'])
+            else:
+                _loaded[key] = expand_rules(read_rules(path))
+        return _loaded[key]
@@ -0,0 +1,52 @@
+"""Process-wide registry of shared corpus loaders"""
+
+import threading
+from pathlib import Path
+from typing import Dict
+
+from .csv_loader import CSVLoader
+
+
+class CorpusRegistry:
+    """Hands out one shared CSVLoader per data directory so each level is parsed once per process"""
+
+    def __init__(self):
+        self._loaders = {}
+        self._lock = threading.Lock()
+
+    def get_loader(self, data_dir: str = "data") -> CSVLoader:
+        """Get the shared loader for data_dir, creating it on first use"""
+        key = str(Path(data_dir).resolve())
+        with self._lock:
+            loader = self._loaders.get(key)
+            if loader is None:
+                loader = CSVLoader(data_dir)
+                self._loaders[key] = loader
+            return loader
+
+    def memory_footprint(self) -> Dict[str, Dict[str, int]]:
+        """Get the memory footprint of every shared loader, keyed by data directory"""
+        with self._lock:
+            loaders = dict(self._loaders)
+        return {data_dir: loader.memory_footprint() for data_dir, loader in loaders.items()}
+
+    def clear(self):
+        """Drop all cached corpora (loaders stay registered)"""
+        with self._lock:
+            loaders = list(self._loaders.values())
+        for loader in loaders:
+            loader.clear_cache()
+
+
+# Default registry shared by the whole process
+_registry = CorpusRegistry()
+
+
+def get_registry() -> CorpusRegistry:
+    """Get the process-wide corpus registry"""
+    return _registry
+
+
+def get_shared_loader(data_dir: str = "data") -> CSVLoader:
+    """Get the process-wide loader for data_dir"""
+    return _registry.get_loader(data_dir)
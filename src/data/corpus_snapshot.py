@@ -0,0 +1,66 @@
+"""Compiled binary corpus snapshots for fast cold start"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Bump whenever the payload layout or any pickled class changes shape
+SNAPSHOT_VERSION = 9
+SNAPSHOT_MAGIC = b'JLPTSNAP'
+SNAPSHOT_DIR = 'cache'
+
+# Header: magic, 2-byte version, 64-byte hex sha256 of the source CSVs
+_HASH_LENGTH = 64
+_HEADER_LENGTH = len(SNAPSHOT_MAGIC) + 2 + _HASH_LENGTH
+
+
+def snapshot_path(data_dir: Path, level: str) -> Path:
+    """Get the snapshot file for a level"""
+    return Path(data_dir) / SNAPSHOT_DIR / f"{level.lower()}_corpus.snapshot"
+
+
+def source_hash(filepaths: List[Path]) -> str:
+    """Hash the contents of the source CSV files a snapshot is compiled from"""
+    digest = hashlib.sha256()
+    for filepath in filepaths:
+        digest.update(Path(filepath).name.encode('utf-8'))
+        with open(filepath, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _header(content_hash: str) -> bytes:
+    return SNAPSHOT_MAGIC + SNAPSHOT_VERSION.to_bytes(2, 'big') + content_hash.encode('ascii')
+
+
+def write_snapshot(path: Path, content_hash: str, payload: Dict):
+    """Write payload atomically, tagged with the snapshot version and source hash"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_header(content_hash))
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def read_snapshot(path: Path, content_hash: str) -> Optional[Dict]:
+    """Read a snapshot payload, or None if it is missing, stale, from another version or unreadable"""
+    try:
+        with open(path, 'rb') as f:
+            # Check the header before unpickling anything
+            if f.read(_HEADER_LENGTH) != _header(content_hash):
+                return None
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
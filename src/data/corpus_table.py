@@ -0,0 +1,237 @@
+"""Normalized corpus tables: unique entities plus a compact row table"""
+
+import operator
+from array import array
+from collections.abc import Sequence
+from typing import FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .records import content_hash
+
+
+class RowFilter(NamedTuple):
+    """Row predicates selecting part of a corpus table.
+
+    Filters are hashable, so each distinct selection is cached next to the
+    level's full table. Fields left as None accept everything.
+    """
+
+    question_types: Optional[FrozenSet[str]] = None
+    difficulties: Optional[FrozenSet[int]] = None
+    pos: Optional[FrozenSet[str]] = None
+
+    @classmethod
+    def create(cls, question_types: Optional[Iterable[str]] = None, difficulties: Optional[Iterable[int]] = None,
+               pos: Optional[Iterable[str]] = None) -> 'RowFilter':
+        """Build a filter from any iterables"""
+        return cls(*(frozenset(values) if values is not None else None
+                     for values in (question_types, difficulties, pos)))
+
+
+class CorpusTable:
+    """Distinct entities of one CSV plus one (entity_id, question_type, difficulty) entry per row.
+
+    The CSVs repeat each word or sentence once per question type; storing the
+    entity once and the per-row columns as small integer codes keeps memory,
+    indexes and distractor pools sized by unique items.
+    """
+
+    def __init__(self, row_type):
+        self.row_type = row_type
+        self.entities = []
+        # Per-row columns, parallel arrays indexed by row number
+        self.entity_ids = array('I')
+        # Two bytes per code; a corrupted CSV with more distinct values widens them (see _append_code)
+        self.question_type_codes = array('H')
+        self.difficulty_codes = array('H')
+        # Stable content hash of each row (see records.content_hash), computed once at load
+        self.row_ids = array('Q')
+        # 0-based CSV data row each row was read from; reports keep file positions
+        # after rows are filtered out or quarantined
+        self.source_rows = array('I')
+        # Code -> value tables for the categorical columns (difficulty keeps raw text when invalid)
+        self.question_types = []
+        self.difficulties = []
+
+    @classmethod
+    def from_records(cls, records: Iterable, row_type,
+                     source_rows: Optional[Iterable[int]] = None) -> 'CorpusTable':
+        """Normalize parsed row records into a table.
+
+        source_rows gives the CSV data row of each record when the reader skipped
+        some; by default records are the file's rows in order.
+        """
+        table = cls(row_type)
+        entity_type = row_type.ENTITY_TYPE
+        entity_key = operator.attrgetter(*entity_type.FIELDS)
+        entity_positions = {}
+        question_type_positions = {}
+        difficulty_positions = {}
+        hashes = {}
+
+        for record in records:
+            difficulty = record.difficulty
+            if difficulty != difficulty:
+                difficulty = None  # NaN from the pandas backend
+            key = entity_key(record)
+            entity_id = entity_positions.get(key)
+            if entity_id is None:
+                entity_id = entity_positions[key] = len(table.entities)
+                table.entities.append(entity_type(*key))
+            table.entity_ids.append(entity_id)
+            table.question_type_codes = _append_code(
+                table.question_type_codes, _code(question_type_positions, table.question_types, record.question_type))
+            table.difficulty_codes = _append_code(
+                table.difficulty_codes, _code(difficulty_positions, table.difficulties, difficulty))
+            hash_key = (entity_id, record.question_type)
+            row_id = hashes.get(hash_key)
+            if row_id is None:
+                row_id = hashes[hash_key] = content_hash(record, record.question_type)
+            table.row_ids.append(row_id)
+        table.source_rows = array('I', source_rows if source_rows is not None else range(len(table.entity_ids)))
+        return table
+
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+
+    def _passing(self, row_filter: RowFilter) -> Tuple[Set[int], Set[int], List[bool]]:
+        """Question type codes, difficulty codes and entities (by id) that pass row_filter"""
+        question_type_codes = {code for code, question_type in enumerate(self.question_types)
+                               if row_filter.question_types is None or question_type in row_filter.question_types}
+        difficulty_codes = {code for code, difficulty in enumerate(self.difficulties)
+                            if row_filter.difficulties is None or difficulty in row_filter.difficulties}
+        entity_matches = [row_filter.pos is None or getattr(entity, 'pos', None) in row_filter.pos
+                          for entity in self.entities]
+        return question_type_codes, difficulty_codes, entity_matches
+
+    def keeps_all(self, row_filter: RowFilter) -> bool:
+        """Check whether every row passes row_filter, without copying the table"""
+        question_type_codes, difficulty_codes, entity_matches = self._passing(row_filter)
+        # Every entity belongs to a row, but code tables can outlive the rows using them
+        return (all(entity_matches) and set(self.question_type_codes) <= question_type_codes and
+                set(self.difficulty_codes) <= difficulty_codes)
+
+    def select(self, row_filter: RowFilter) -> 'CorpusTable':
+        """Build a table with only the rows that pass row_filter, sharing entity objects"""
+        question_type_codes, difficulty_codes, entity_matches = self._passing(row_filter)
+
+        table = CorpusTable(self.row_type)
+        table.question_types = list(self.question_types)
+        table.difficulties = list(self.difficulties)
+        table.question_type_codes = array(self.question_type_codes.typecode)
+        table.difficulty_codes = array(self.difficulty_codes.typecode)
+        new_ids = {}
+        for entity_id, question_type_code, difficulty_code, row_id, source_row in zip(
+                self.entity_ids, self.question_type_codes, self.difficulty_codes, self.row_ids, self.source_rows):
+            if (question_type_code not in question_type_codes or difficulty_code not in difficulty_codes
+                    or not entity_matches[entity_id]):
+                continue
+            new_id = new_ids.get(entity_id)
+            if new_id is None:
+                new_id = new_ids[entity_id] = len(table.entities)
+                table.entities.append(self.entities[entity_id])
+            table.entity_ids.append(new_id)
+            table.question_type_codes.append(question_type_code)
+            table.difficulty_codes.append(difficulty_code)
+            table.row_ids.append(row_id)
+            table.source_rows.append(source_row)
+        return table
+
+    def without_entities(self, entity_ids: Iterable[int]) -> 'CorpusTable':
+        """Build a table without the rows of some entities, sharing the remaining entity objects"""
+        dropped = set(entity_ids)
+        table = CorpusTable(self.row_type)
+        table.question_types = list(self.question_types)
+        table.difficulties = list(self.difficulties)
+        table.question_type_codes = array(self.question_type_codes.typecode)
+        table.difficulty_codes = array(self.difficulty_codes.typecode)
+        new_ids = {}
+        for entity_id, entity in enumerate(self.entities):
+            if entity_id not in dropped:
+                new_ids[entity_id] = len(table.entities)
+                table.entities.append(entity)
+        for entity_id, question_type_code, difficulty_code, row_id, source_row in zip(
+                self.entity_ids, self.question_type_codes, self.difficulty_codes, self.row_ids, self.source_rows):
+            new_id = new_ids.get(entity_id)
+            if new_id is not None:
+                table.entity_ids.append(new_id)
+                table.question_type_codes.append(question_type_code)
+                table.difficulty_codes.append(difficulty_code)
+                table.row_ids.append(row_id)
+                table.source_rows.append(source_row)
+        return table
+
+    def count_question_type(self, question_type: str) -> int:
+        """Number of rows with question_type, counted on the code column"""
+        if question_type not in self.question_types:
+            return 0
+        return self.question_type_codes.count(self.question_types.index(question_type))
+
+    def positions(self, question_types: Iterable[str]) -> List[int]:
+        """Row numbers whose question type is one of question_types, in file order"""
+        codes = {self.question_types.index(question_type) for question_type in question_types
+                 if question_type in self.question_types}
+        return [position for position, code in enumerate(self.question_type_codes) if code in codes]
+
+    def row(self, position: int):
+        """Materialize one CSV row as a record"""
+        return self.row_type.from_entity(self.entities[self.entity_ids[position]],
+                                         self.question_types[self.question_type_codes[position]],
+                                         self.difficulties[self.difficulty_codes[position]],
+                                         self.row_ids[position])
+
+    def iter_rows(self) -> Iterator:
+        """Materialize every CSV row in file order"""
+        from_entity = self.row_type.from_entity
+        entities, question_types, difficulties = self.entities, self.question_types, self.difficulties
+        for entity_id, question_type_code, difficulty_code, row_id in zip(
+                self.entity_ids, self.question_type_codes, self.difficulty_codes, self.row_ids):
+            yield from_entity(entities[entity_id], question_types[question_type_code],
+                              difficulties[difficulty_code], row_id)
+
+    def rows(self) -> 'CorpusRows':
+        """List-like view of the table in the old one-record-per-row shape"""
+        return CorpusRows(self)
+
+
+class CorpusRows(Sequence):
+    """Read-only view that materializes row records from a CorpusTable on access"""
+
+    def __init__(self, table: CorpusTable):
+        self.table = table
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self.table.row(i) for i in range(*position.indices(len(self.table)))]
+        if position < 0:
+            position += len(self.table)
+        if not 0 <= position < len(self.table):
+            raise IndexError("corpus row index out of range")
+        return self.table.row(position)
+
+    def __iter__(self) -> Iterator:
+        return self.table.iter_rows()
+
+    def __repr__(self) -> str:
+        return f"CorpusRows({len(self.table)} {self.table.row_type.__name__} rows)"
+
+
+def _code(positions: dict, values: List, value) -> int:
+    """Get the small integer code for a categorical value, assigning the next one if new"""
+    code = positions.get(value)
+    if code is None:
+        code = positions[value] = len(values)
+        values.append(value)
+    return code
+
+
+def _append_code(codes: array, code: int) -> array:
+    """Append a code, copying codes to four-byte items first if it doesn't fit; returns the array to keep"""
+    try:
+        codes.append(code)
+    except OverflowError:
+        codes = array('I', codes)
+        codes.append(code)
+    return codes
@@ -1,123 +1,491 @@
 """CSV data loader for JLPT quiz questions"""
 
-import pandas as pd
+import csv
+import operator
 import os
-from typing import List, Dict, Optional
+import sys
+import threading
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+from .distractor_index import VocabularyDistractors, GrammarDistractors
+from .records import VocabItem, GrammarItem, VocabEntity, GrammarEntity
+from .corpus_table import CorpusTable, CorpusRows, RowFilter
+from .integrity import build_report, report_messages
+from .sanitizer import sanitize_grammar
+from .pattern_matcher import PatternMatcher, compiled_matcher
+from .conjugation_rules import DEFAULT_RULES_PATH, RULES_FILENAME, load_surface_forms, rules_path
+from .sentence_blanks import SentenceBlanks
+from .corpus_snapshot import snapshot_path, source_hash, read_snapshot, write_snapshot
+from ..utils.memory import deep_sizeof
+
+
+class _EmptyFileError(ValueError):
+    """Raised by the CSV backends when a file has no header row"""
+
+
 class CSVLoader:
     """Loads and manages JLPT question data from CSV files"""
     
-    def __init__(self, data_dir: str = "data"):
+    # Columns every CSV of each category must have
+    VOCABULARY_COLUMNS = ('kanji', 'hiragana', 'pos', 'korean_meaning', 'question_type', 'difficulty')
+    GRAMMAR_COLUMNS = ('grammar_pattern', 'japanese_sentence', 'hiragana_reading',
+                       'korean_translation', 'question_type', 'difficulty')
+    # Columns parsed as integers
+    INTEGER_COLUMNS = ('difficulty',)
+    
+    # CSV parsing backends: 'csv' streams rows with the stdlib csv module, 'pandas' uses
+    # pd.read_csv (empty cells become NaN), 'auto' picks 'csv' so pandas is never imported
+    BACKENDS = ('auto', 'csv', 'pandas')
+    
+    # JLPT levels, easiest first
+    LEVELS = ('N5', 'N4', 'N3', 'N2', 'N1')
+    
+    # Fields that get a hash index for O(1) row lookups
+    VOCABULARY_INDEX_FIELDS = ('kanji', 'hiragana', 'korean_meaning')
+    GRAMMAR_INDEX_FIELDS = ('japanese_sentence', 'korean_translation')
+    
+    def __init__(self, data_dir: str = "data", use_snapshot: bool = True, backend: str = "auto"):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown CSV backend: {backend}")
+        
         self.data_dir = Path(data_dir)
+        self.backend = backend
+        # Load compiled snapshots (see build_snapshot) when they match the CSVs
+        self.use_snapshot = use_snapshot
+        # level -> CorpusTable (unique entities plus per-row question type and difficulty);
+        # tables loaded with a RowFilter are keyed (level, row_filter) in the same caches
         self.vocabulary_cache = {}
         self.grammar_cache = {}
+        self.vocabulary_index_cache = {}
+        self.grammar_index_cache = {}
+        self.vocabulary_distractor_cache = {}
+        self.grammar_distractor_cache = {}
+        # Grammar repairs and quarantines made while loading, keyed like grammar_cache
+        self.grammar_sanitization = {}
+        # level -> PatternMatcher over the level's grammar patterns, built on first use
+        self.grammar_matcher_cache = {}
+        # SentenceBlanks (pattern blanked out of each sentence), keyed like grammar_cache
+        self.grammar_blank_cache = {}
+        # (category, level) -> (mtime_ns, size) of the CSV each cache entry was built from;
+        # ('rules', level) -> (path, mtime_ns, size) of the conjugation rules the level's
+        # grammar blanks and matcher were built with
+        self.file_signatures = {}
+        self._csv_paths = {}
+        self._rules_paths = (str(self.data_dir / RULES_FILENAME), str(DEFAULT_RULES_PATH))
+        # Loaders are shared across the process, so loading is serialized
+        self._lock = threading.RLock()
+    
+    def _csv_path(self, category: str, level: str) -> Path:
+        """Get the CSV file path for a category ('vocabulary' or 'grammar') and level"""
+        # Lookups check their CSV for edits on every call, so paths are built once
+        path = self._csv_paths.get((category, level))
+        if path is None:
+            path = self._csv_paths[(category, level)] = self.data_dir / f"{level.lower()}_{category}.csv"
+        return path
+    
+    def _file_signature(self, filepath: Path) -> Tuple[int, int]:
+        """Get the (mtime_ns, size) signature used to detect changed CSV files"""
+        stat = filepath.stat()
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _rules_signature(self) -> Optional[Tuple]:
+        """Get the (path, mtime_ns, size) signature of the conjugation rules in use, None if unreadable"""
+        # The file rules_path picks, found with one stat when the data directory has its own
+        for path in self._rules_paths:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            except OSError:
+                return None
+            return path, stat.st_mtime_ns, stat.st_size
+        return None
+    
+    def _is_fresh(self, category: str, level: str, filepath: Path) -> bool:
+        """Check whether the cached data for category/level still matches its CSV file"""
+        try:
+            return self.file_signatures.get((category, level)) == self._file_signature(filepath)
+        except OSError:
+            return False
+    
+    def _cache_key(self, level: str, row_filter: Optional[RowFilter] = None):
+        """Get the cache key for a level's full table, or for a filtered table of it"""
+        return level if row_filter is None else (level, row_filter)
+    
+    def _invalidate(self, category: str, level: str):
+        """Drop every cache entry derived from one CSV file, filtered tables included"""
+        if category == 'vocabulary':
+            caches = (self.vocabulary_cache, self.vocabulary_index_cache, self.vocabulary_distractor_cache)
+        else:
+            caches = (self.grammar_cache, self.grammar_index_cache, self.grammar_distractor_cache,
+                      self.grammar_sanitization, self.grammar_matcher_cache, self.grammar_blank_cache)
+        for cache in caches:
+            for key in [key for key in cache if key == level or (isinstance(key, tuple) and key[0] == level)]:
+                del cache[key]
+        self.file_signatures.pop((category, level), None)
+        if category == 'grammar':
+            self.file_signatures.pop(('rules', level), None)
+    
+    def _drop_stale(self, category: str, level: str, filepath: Path):
+        """Invalidate category/level if its CSV (or, for grammar, the conjugation rules) changed since it was cached"""
+        if (category, level) in self.file_signatures and not self._is_fresh(category, level, filepath):
+            self._invalidate(category, level)
+        elif (category == 'grammar' and ('rules', level) in self.file_signatures
+              and self.file_signatures[('rules', level)] != self._rules_signature()):
+            # Blanks, the matcher and the question pools built on them all follow the
+            # grammar table, so the level's grammar is reloaded as if its CSV changed
+            self._invalidate(category, level)
+    
+    def _cache_level(self, category: str, level: str, table: CorpusTable, signature: Tuple[int, int],
+                     indexes: Optional[Dict] = None, distractors=None, row_filter: Optional[RowFilter] = None,
+                     sanitization: Optional[List[Dict]] = None, blanks: Optional[SentenceBlanks] = None,
+                     rules_signature: Optional[Tuple] = None):
+        """Cache one category's table for a level along with its indexes and distractor pools.
+        
+        rules_signature is that of the conjugation rules read for a freshly loaded grammar table.
+        """
+        if self.file_signatures.get((category, level), signature) != signature:
+            # The CSV changed since the other tables for it were cached
+            self._invalidate(category, level)
+        
+        # Indexes and pools are built over unique entities, not over the repeated rows
+        key = self._cache_key(level, row_filter)
+        if category == 'vocabulary':
+            self.vocabulary_cache[key] = table
+            self.vocabulary_index_cache[key] = (
+                indexes if indexes is not None else self._build_indexes(table.entities, self.VOCABULARY_INDEX_FIELDS))
+            self.vocabulary_distractor_cache[key] = (
+                distractors if distractors is not None else VocabularyDistractors(table.entities))
+        else:
+            self.grammar_cache[key] = table
+            self.grammar_index_cache[key] = (
+                indexes if indexes is not None else self._build_indexes(table.entities, self.GRAMMAR_INDEX_FIELDS))
+            self.grammar_distractor_cache[key] = (
+                distractors if distractors is not None else GrammarDistractors(table.entities))
+            self.grammar_sanitization[key] = sanitization or []
+            # Blanking runs once here, never while a quiz is generated
+            self.grammar_blank_cache[key] = (
+                blanks if blanks is not None else SentenceBlanks.build(table.entities, load_surface_forms(self.data_dir)))
+            if rules_signature is not None:
+                self.file_signatures[('rules', level)] = rules_signature
+        self.file_signatures[(category, level)] = signature
+    
+    def _cache_selection(self, category: str, level: str, row_filter: RowFilter):
+        """Cache a filtered table selected from the level's already-loaded full table"""
+        if category == 'vocabulary':
+            caches = (self.vocabulary_cache, self.vocabulary_index_cache, self.vocabulary_distractor_cache)
+        else:
+            caches = (self.grammar_cache, self.grammar_index_cache, self.grammar_distractor_cache)
+        full_table, indexes, distractors = (cache[level] for cache in caches)
+        if full_table.keeps_all(row_filter):
+            # Nothing to select: share the full table and everything built from it
+            table = full_table
+        else:
+            table, indexes, distractors = full_table.select(row_filter), None, None
+        # The full table is already sanitized and blanked; blanks are keyed by the shared entities
+        self._cache_level(category, level, table, self.file_signatures[(category, level)],
+                          indexes=indexes, distractors=distractors, row_filter=row_filter,
+                          sanitization=self.grammar_sanitization.get(level),
+                          blanks=self.grammar_blank_cache.get(level))
     
-    def load_vocabulary(self, level: str = "N4") -> List[Dict]:
-        """Load vocabulary data for specified JLPT level"""
-        if level in self.vocabulary_cache:
-            return self.vocabulary_cache[level]
+    def _load_snapshot(self, level: str) -> bool:
+        """Populate both categories for level from a compiled snapshot if it matches the CSVs"""
+        if not self.use_snapshot:
+            return False
+        
+        filepaths = [self._csv_path('vocabulary', level), self._csv_path('grammar', level)]
+        rules_signature = self._rules_signature()
+        try:
+            signatures = [self._file_signature(filepath) for filepath in filepaths]
+            # Blanked sentences depend on the conjugation rules too
+            content_hash = source_hash(filepaths + [rules_path(self.data_dir)])
+        except OSError:
+            return False
         
-        filename = f"{level.lower()}_vocabulary.csv"
-        filepath = self.data_dir / filename
+        payload = read_snapshot(snapshot_path(self.data_dir, level), content_hash)
+        if payload is None:
+            return False
         
+        for category, signature in zip(('vocabulary', 'grammar'), signatures):
+            entry = payload[category]
+            self._cache_level(category, level, entry['table'], signature,
+                              indexes=entry['indexes'], distractors=entry['distractors'],
+                              sanitization=entry.get('sanitization'), blanks=entry.get('blanks'),
+                              rules_signature=rules_signature)
+        return True
+    
+    def build_snapshot(self, level: str = "N4") -> Path:
+        """Compile a level's CSVs and derived indexes into a binary snapshot for fast startup"""
+        vocabulary_path = self._csv_path('vocabulary', level)
+        grammar_path = self._csv_path('grammar', level)
+        
+        with self._lock:
+            # Hash before parsing so an edit made while building leaves the snapshot stale
+            content_hash = source_hash([vocabulary_path, grammar_path, rules_path(self.data_dir)])
+            self._load_vocabulary_file(level, vocabulary_path)
+            self._load_grammar_file(level, grammar_path)
+            
+            payload = {
+                'vocabulary': {
+                    'table': self.vocabulary_cache[level],
+                    'indexes': self.vocabulary_index_cache[level],
+                    'distractors': self.vocabulary_distractor_cache[level],
+                },
+                'grammar': {
+                    'table': self.grammar_cache[level],
+                    'indexes': self.grammar_index_cache[level],
+                    'distractors': self.grammar_distractor_cache[level],
+                    'sanitization': self.grammar_sanitization[level],
+                    'blanks': self.grammar_blank_cache[level],
+                },
+            }
+            path = snapshot_path(self.data_dir, level)
+            write_snapshot(path, content_hash, payload)
+            return path
+    
+    def load_vocabulary(self, level: str = "N4") -> CorpusRows:
+        """Load vocabulary data for specified JLPT level (one VocabItem per CSV row)"""
+        return self.load_vocabulary_table(level).rows()
+    
+    def load_vocabulary_table(self, level: str = "N4", row_filter: Optional[RowFilter] = None) -> CorpusTable:
+        """Load the normalized vocabulary table for specified JLPT level.
+        
+        With a row_filter only matching rows are kept. Filtered tables are selected
+        from the level's full table, so the CSV is parsed once however many
+        filters are used.
+        """
+        with self._lock:
+            return self.vocabulary_cache[self._load_key('vocabulary', level, row_filter)]
+    
+    def _load_key(self, category: str, level: str, row_filter: Optional[RowFilter] = None):
+        """Load a category's table for level and row_filter if needed, returning its cache key.
+        
+        Reloads the level first if its CSV changed. Callers hold self._lock.
+        """
+        filepath = self._csv_path(category, level)
+        cache = self.vocabulary_cache if category == 'vocabulary' else self.grammar_cache
+        self._drop_stale(category, level, filepath)
+        if level not in cache and not self._load_snapshot(level):
+            if category == 'vocabulary':
+                self._load_vocabulary_file(level, filepath)
+            else:
+                self._load_grammar_file(level, filepath)
+        key = self._cache_key(level, row_filter)
+        if key not in cache:
+            self._cache_selection(category, level, row_filter)
+        return key
+    
+    def _load_vocabulary_file(self, level: str, filepath: Path) -> CorpusTable:
+        """Parse a vocabulary CSV file and cache it with its derived structures"""
         if not filepath.exists():
             raise FileNotFoundError(f"Vocabulary file not found: {filepath}")
         
         try:
-            df = pd.read_csv(filepath)
+            # Take the signature before reading so a concurrent edit is caught next time
+            signature = self._file_signature(filepath)
+            records, source_rows = self._read_rows(filepath, self.VOCABULARY_COLUMNS, VocabItem)
+            table = CorpusTable.from_records(records, VocabItem, source_rows)
             
-            # Validate required columns
-            required_columns = ['kanji', 'hiragana', 'pos', 'korean_meaning', 'question_type', 'difficulty']
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                raise ValueError(f"Missing required columns: {missing_columns}")
+            # Cache the data with its lookup indexes and distractor pools
+            self._cache_level('vocabulary', level, table, signature)
             
-            # Convert to list of dictionaries
-            vocabulary_data = df.to_dict('records')
+            return table
             
-            # Cache the data
-            self.vocabulary_cache[level] = vocabulary_data
-            
-            return vocabulary_data
-            
-        except pd.errors.EmptyDataError:
+        except _EmptyFileError:
             raise ValueError(f"Empty vocabulary file: {filepath}")
         except Exception as e:
             raise RuntimeError(f"Error loading vocabulary data: {str(e)}")
     
-    def load_grammar(self, level: str = "N4") -> List[Dict]:
-        """Load grammar data for specified JLPT level"""
-        if level in self.grammar_cache:
-            return self.grammar_cache[level]
-        
-        filename = f"{level.lower()}_grammar.csv"
-        filepath = self.data_dir / filename
-        
+    def load_grammar(self, level: str = "N4") -> CorpusRows:
+        """Load grammar data for specified JLPT level (one GrammarItem per CSV row)"""
+        return self.load_grammar_table(level).rows()
+    
+    def load_grammar_table(self, level: str = "N4", row_filter: Optional[RowFilter] = None) -> CorpusTable:
+        """Load the normalized grammar table for specified JLPT level (see load_vocabulary_table)"""
+        with self._lock:
+            return self.grammar_cache[self._load_key('grammar', level, row_filter)]
+    
+    def _load_grammar_file(self, level: str, filepath: Path) -> CorpusTable:
+        """Parse a grammar CSV file and cache it with its derived structures"""
         if not filepath.exists():
             raise FileNotFoundError(f"Grammar file not found: {filepath}")
         
         try:
-            df = pd.read_csv(filepath)
+            # Take the signatures before reading so a concurrent edit is caught next time
+            signature = self._file_signature(filepath)
+            rules_signature = self._rules_signature()
+            records, source_rows = self._read_rows(filepath, self.GRAMMAR_COLUMNS, GrammarItem)
+            table = CorpusTable.from_records(records, GrammarItem, source_rows)
+            # Repair corrupted rows once here so question generation can trust every row
+            table, sanitization = sanitize_grammar(table)
             
-            # Validate required columns
-            required_columns = ['grammar_pattern', 'japanese_sentence', 'hiragana_reading', 
-                               'korean_translation', 'question_type', 'difficulty']
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                raise ValueError(f"Missing required columns: {missing_columns}")
+            # Cache the data with its lookup indexes and distractor pools
+            self._cache_level('grammar', level, table, signature, sanitization=sanitization,
+                              rules_signature=rules_signature)
             
-            # Convert to list of dictionaries
-            grammar_data = df.to_dict('records')
+            return table
             
-            # Cache the data
-            self.grammar_cache[level] = grammar_data
-            
-            return grammar_data
-            
-        except pd.errors.EmptyDataError:
+        except _EmptyFileError:
             raise ValueError(f"Empty grammar file: {filepath}")
         except Exception as e:
             raise RuntimeError(f"Error loading grammar data: {str(e)}")
     
+    def _read_rows(self, filepath: Path, required_columns: tuple, record_type) -> Tuple[List[Dict], List[int]]:
+        """Read a CSV file into a list of records with the configured backend.
+
+        Also returns the 0-based data row of each record, since blank lines are skipped.
+        """
+        if self.backend == 'pandas':
+            return self._read_rows_pandas(filepath, required_columns, record_type)
+        return self._read_rows_csv(filepath, required_columns, record_type)
+    
+    def _check_columns(self, columns: List[str], required_columns: tuple):
+        """Validate required columns"""
+        missing_columns = [col for col in required_columns if col not in columns]
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {missing_columns}")
+    
+    def _read_rows_csv(self, filepath: Path, required_columns: tuple, record_type) -> Tuple[List[Dict], List[int]]:
+        """Stream rows with the stdlib csv module (empty cells become '')"""
+        with open(filepath, newline='', encoding='utf-8-sig') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                raise _EmptyFileError()
+            self._check_columns(header, required_columns)
+            
+            # Optional record fields missing from the file read an extra empty column
+            width = len(header)
+            positions = [header.index(field) if field in header else width for field in record_type.FIELDS]
+            take = operator.itemgetter(*positions)
+            interned = [i for i, field in enumerate(record_type.FIELDS) if field in record_type.INTERNED_FIELDS]
+            integers = [i for i, field in enumerate(record_type.FIELDS) if field in self.INTEGER_COLUMNS]
+            
+            rows = []
+            source_rows = []
+            data_row = -1
+            for values in reader:
+                if not values:
+                    continue  # Blank line (pandas skips these too)
+                data_row += 1
+                if len(values) <= width:
+                    values.extend([''] * (width + 1 - len(values)))
+                fields = list(take(values))
+                for i in integers:
+                    fields[i] = _parse_int(fields[i])
+                for i in interned:
+                    fields[i] = sys.intern(fields[i])
+                rows.append(record_type(*fields))
+                source_rows.append(data_row)
+        return rows, source_rows
+    
+    def _read_rows_pandas(self, filepath: Path, required_columns: tuple, record_type) -> Tuple[List[Dict], List[int]]:
+        """Read rows with pandas (empty cells become NaN)"""
+        import pandas as pd
+        
+        try:
+            df = pd.read_csv(filepath)
+        except pd.errors.EmptyDataError:
+            raise _EmptyFileError()
+        
+        self._check_columns(list(df.columns), required_columns)
+        
+        # Convert to records; the default RangeIndex numbers the data rows, blank lines excluded
+        return [record_type.from_row(row) for row in df.to_dict('records')], df.index.tolist()
+    
+    def _build_indexes(self, data: List[Dict], fields: tuple) -> Dict[str, Dict[str, Dict]]:
+        """Build one hash index per field mapping value -> first entity with that value"""
+        indexes = {field: {} for field in fields}
+        for item in data:
+            for field in fields:
+                value = item.get(field)
+                # Skip missing values (pandas gives NaN floats for empty cells)
+                if isinstance(value, str) and value:
+                    indexes[field].setdefault(value, item)
+        return indexes
+    
+    def find_vocabulary(self, level: str, field: str, value: str,
+                        row_filter: Optional[RowFilter] = None) -> Optional[VocabEntity]:
+        """Find the first vocabulary word whose field equals value"""
+        with self._lock:
+            index = self.vocabulary_index_cache[self._load_key('vocabulary', level, row_filter)].get(field)
+        if index is None:
+            raise ValueError(f"Vocabulary field is not indexed: {field}")
+        return index.get(value)
+    
+    def find_grammar(self, level: str, field: str, value: str,
+                     row_filter: Optional[RowFilter] = None) -> Optional[GrammarEntity]:
+        """Find the first grammar sentence whose field equals value"""
+        with self._lock:
+            index = self.grammar_index_cache[self._load_key('grammar', level, row_filter)].get(field)
+        if index is None:
+            raise ValueError(f"Grammar field is not indexed: {field}")
+        return index.get(value)
+    
+    def get_vocabulary_distractors(self, level: str = "N4",
+                                   row_filter: Optional[RowFilter] = None) -> VocabularyDistractors:
+        """Get the pre-bucketed wrong-answer pools for vocabulary questions"""
+        with self._lock:
+            return self.vocabulary_distractor_cache[self._load_key('vocabulary', level, row_filter)]
+    
+    def get_grammar_distractors(self, level: str = "N4",
+                                row_filter: Optional[RowFilter] = None) -> GrammarDistractors:
+        """Get the pre-bucketed wrong-answer pools for grammar questions"""
+        with self._lock:
+            return self.grammar_distractor_cache[self._load_key('grammar', level, row_filter)]
+    
+    def get_pattern_matcher(self, level: str = "N4") -> PatternMatcher:
+        """Get the automaton matching every grammar pattern of a level and its conjugations"""
+        with self._lock:
+            table = self.load_grammar_table(level)
+            if level not in self.grammar_matcher_cache:
+                self.grammar_matcher_cache[level] = compiled_matcher(
+                    (entity.grammar_pattern for entity in table.entities if entity.grammar_pattern),
+                    load_surface_forms(self.data_dir))
+            return self.grammar_matcher_cache[level]
+    
+    def get_sentence_blanks(self, level: str = "N4", row_filter: Optional[RowFilter] = None) -> SentenceBlanks:
+        """Get the precomputed blanked sentences for a level's grammar rows"""
+        with self._lock:
+            return self.grammar_blank_cache[self._load_key('grammar', level, row_filter)]
+    
     def get_vocabulary_count(self, level: str = "N4", question_type: Optional[str] = None) -> int:
         """Get count of vocabulary questions"""
-        data = self.load_vocabulary(level)
+        table = self.load_vocabulary_table(level)
         
         if question_type:
-            return len([item for item in data if item['question_type'] == question_type])
-        return len(data)
+            return table.count_question_type(question_type)
+        return len(table)
     
     def get_grammar_count(self, level: str = "N4", question_type: Optional[str] = None) -> int:
         """Get count of grammar questions"""
-        data = self.load_grammar(level)
+        table = self.load_grammar_table(level)
         
         if question_type:
-            return len([item for item in data if item['question_type'] == question_type])
-        return len(data)
+            return table.count_question_type(question_type)
+        return len(table)
     
     def get_available_levels(self) -> List[str]:
         """Get list of available JLPT levels"""
-        available_levels = []
-        
-        for level in ['N5', 'N4', 'N3', 'N2', 'N1']:
-            vocab_file = self.data_dir / f"{level.lower()}_vocabulary.csv"
-            grammar_file = self.data_dir / f"{level.lower()}_grammar.csv"
-            
-            if vocab_file.exists() and grammar_file.exists():
-                available_levels.append(level)
+        # One directory listing instead of probing each file
+        try:
+            filenames = set(os.listdir(self.data_dir))
+        except OSError:
+            return []
         
-        return available_levels
+        return [level for level in self.LEVELS
+                if self._csv_path('vocabulary', level).name in filenames
+                and self._csv_path('grammar', level).name in filenames]
     
     def get_question_types(self, level: str = "N4", category: str = "vocabulary") -> List[str]:
         """Get available question types for a category"""
         if category == "vocabulary":
-            data = self.load_vocabulary(level)
+            table = self.load_vocabulary_table(level)
         else:
-            data = self.load_grammar(level)
+            table = self.load_grammar_table(level)
         
-        question_types = list(set(item['question_type'] for item in data))
-        return sorted(question_types)
+        return sorted(table.question_types)
     
     def filter_by_difficulty(self, data: List[Dict], difficulty: int) -> List[Dict]:
         """Filter questions by difficulty level (1-3)"""
@@ -127,43 +495,67 @@ class CSVLoader:
         """Filter questions by question type"""
         return [item for item in data if item['question_type'] == question_type]
     
+    def integrity_report(self, level: str = "N4") -> Dict:
+        """Run the integrity rules over both categories and return a JSON-serializable report"""
+        tables = {}
+        load_errors = {}
+        unblanked = {}
+        sanitization = None
+        # Held throughout so the blanks and log describe the grammar table that was loaded
+        with self._lock:
+            for category, load in (('vocabulary', self.load_vocabulary_table), ('grammar', self.load_grammar_table)):
+                try:
+                    tables[category] = load(level)
+                except Exception as e:
+                    load_errors[category] = str(e)
+            if 'grammar' in tables:
+                unblanked['grammar'] = self.grammar_blank_cache[level].unblanked_rows(tables['grammar'])
+                sanitization = self.grammar_sanitization[level]
+        return build_report(level, tables, load_errors, sanitization={'grammar': sanitization},
+                            unblanked=unblanked)
+    
+    def sanitization_log(self, level: str = "N4") -> List[Dict]:
+        """Repairs and quarantines applied to a level's grammar rows when it was loaded"""
+        with self._lock:
+            return self.grammar_sanitization[self._load_key('grammar', level)]
+    
     def validate_data_integrity(self, level: str = "N4") -> Dict[str, List[str]]:
         """Validate data integrity and return any issues found"""
-        issues = {'vocabulary': [], 'grammar': []}
-        
-        # Validate vocabulary data
-        try:
-            vocab_data = self.load_vocabulary(level)
-            for i, item in enumerate(vocab_data):
-                if not item.get('kanji'):
-                    issues['vocabulary'].append(f"Row {i+1}: Missing kanji")
-                if not item.get('hiragana'):
-                    issues['vocabulary'].append(f"Row {i+1}: Missing hiragana")
-                if not item.get('korean_meaning'):
-                    issues['vocabulary'].append(f"Row {i+1}: Missing Korean meaning")
-                if item.get('difficulty') not in [1, 2, 3]:
-                    issues['vocabulary'].append(f"Row {i+1}: Invalid difficulty level")
-        except Exception as e:
-            issues['vocabulary'].append(f"Failed to load vocabulary: {str(e)}")
-        
-        # Validate grammar data
-        try:
-            grammar_data = self.load_grammar(level)
-            for i, item in enumerate(grammar_data):
-                if not item.get('grammar_pattern'):
-                    issues['grammar'].append(f"Row {i+1}: Missing grammar pattern")
-                if not item.get('japanese_sentence'):
-                    issues['grammar'].append(f"Row {i+1}: Missing Japanese sentence")
-                if not item.get('korean_translation'):
-                    issues['grammar'].append(f"Row {i+1}: Missing Korean translation")
-                if item.get('difficulty') not in [1, 2, 3]:
-                    issues['grammar'].append(f"Row {i+1}: Invalid difficulty level")
-        except Exception as e:
-            issues['grammar'].append(f"Failed to load grammar: {str(e)}")
-        
-        return issues
+        return report_messages(self.integrity_report(level))
+    
+    def memory_footprint(self) -> Dict[str, int]:
+        """Approximate bytes held by the cached data and each derived structure"""
+        # Indexes and pools point at the cached entities, so each entry reports only its own overhead
+        seen = set()
+        footprint = {
+            'vocabulary': deep_sizeof(self.vocabulary_cache, seen),
+            'grammar': deep_sizeof(self.grammar_cache, seen),
+            'indexes': (deep_sizeof(self.vocabulary_index_cache, seen) +
+                        deep_sizeof(self.grammar_index_cache, seen)),
+            'distractors': (deep_sizeof(self.vocabulary_distractor_cache, seen) +
+                            deep_sizeof(self.grammar_distractor_cache, seen)),
+        }
+        footprint['total'] = sum(footprint.values())
+        return footprint
     
     def clear_cache(self):
         """Clear cached data"""
-        self.vocabulary_cache.clear()
-        self.grammar_cache.clear()
\ No newline at end of file
+        with self._lock:
+            self.file_signatures.clear()
+            self.vocabulary_cache.clear()
+            self.grammar_cache.clear()
+            self.vocabulary_index_cache.clear()
+            self.grammar_index_cache.clear()
+            self.vocabulary_distractor_cache.clear()
+            self.grammar_distractor_cache.clear()
+            self.grammar_sanitization.clear()
+            self.grammar_matcher_cache.clear()
+            self.grammar_blank_cache.clear()
+
+
+def _parse_int(value: str):
+    """Parse an integer cell, keeping the raw text (or None if empty) when it isn't one"""
+    try:
+        return int(value)
+    except ValueError:
+        return value.strip() or None
@@ -0,0 +1,94 @@
+"""Pre-bucketed distractor pools for JLPT quiz questions"""
+
+import random
+from typing import Any, Callable, Hashable, List, Optional
+
+from .records import VocabItem, GrammarItem
+
+
+class DistractorPool:
+    """Distinct candidate answers that wrong options are drawn from"""
+
+    def __init__(self, items: List[Any], key: Optional[Callable[[Any], Hashable]] = None):
+        key = key or (lambda item: item)
+        self.items = []
+        self.positions = {}  # key -> index into items
+        for item in items:
+            item_key = key(item)
+            if item_key not in self.positions:
+                self.positions[item_key] = len(self.items)
+                self.items.append(item)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def available(self, exclude: Optional[Hashable] = None) -> int:
+        """Number of items that can be drawn when exclude is left out"""
+        return len(self.items) - (1 if exclude in self.positions else 0)
+
+    def sample(self, k: int, exclude: Optional[Hashable] = None, rng=random) -> List[Any]:
+        """Draw up to k distinct items whose key is not exclude"""
+        size = len(self.items)
+        excluded_position = self.positions.get(exclude)
+
+        if self.available(exclude) <= k:
+            # Small pool: every remaining item is used, in random order
+            remaining = [item for i, item in enumerate(self.items) if i != excluded_position]
+            return rng.sample(remaining, len(remaining))
+
+        # Rejection sampling: expected O(k) draws while the pool is much larger than k
+        chosen = []
+        seen = set()
+        while len(chosen) < k:
+            position = rng.randrange(size)
+            if position == excluded_position or position in seen:
+                continue
+            seen.add(position)
+            chosen.append(self.items[position])
+        return chosen
+
+
+class VocabularyDistractors:
+    """Wrong-answer pools for vocabulary questions of one level"""
+
+    def __init__(self, vocabulary_data: List[VocabItem]):
+        word_key = lambda item: item.kanji
+
+        # Distinct words overall and bucketed by part of speech
+        self.words = DistractorPool(vocabulary_data, key=word_key)
+        items_by_pos = {}
+        for item in self.words.items:
+            items_by_pos.setdefault(item.pos, []).append(item)
+        self.words_by_pos = {pos: DistractorPool(items, key=word_key) for pos, items in items_by_pos.items()}
+
+        self.meanings = DistractorPool([item.korean_meaning for item in vocabulary_data])
+
+    def sample_words(self, vocab_item: VocabItem, k: int = 3, rng=random) -> List[VocabItem]:
+        """Draw k distinct words with the same part of speech but a different kanji"""
+        kanji = vocab_item.kanji
+        bucket = self.words_by_pos.get(vocab_item.pos)
+
+        if bucket is None or bucket.available(kanji) < k:
+            # If not enough similar items, use any different items
+            bucket = self.words
+        return bucket.sample(k, exclude=kanji, rng=rng)
+
+    def sample_meanings(self, korean_meaning: str, k: int = 3, rng=random) -> List[str]:
+        """Draw k distinct Korean meanings other than korean_meaning"""
+        return self.meanings.sample(k, exclude=korean_meaning, rng=rng)
+
+
+class GrammarDistractors:
+    """Wrong-answer pools for grammar questions of one level"""
+
+    def __init__(self, grammar_data: List[GrammarItem]):
+        self.translations = DistractorPool([item.korean_translation for item in grammar_data])
+        self.sentences = DistractorPool([item.japanese_sentence for item in grammar_data])
+
+    def sample_translations(self, korean_translation: str, k: int = 3, rng=random) -> List[str]:
+        """Draw k distinct Korean translations other than korean_translation"""
+        return self.translations.sample(k, exclude=korean_translation, rng=rng)
+
+    def sample_sentences(self, japanese_sentence: str, k: int = 3, rng=random) -> List[str]:
+        """Draw k distinct Japanese sentences other than japanese_sentence"""
+        return self.sentences.sample(k, exclude=japanese_sentence, rng=rng)
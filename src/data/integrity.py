@@ -0,0 +1,275 @@
+"""Rule-based, column-wise data integrity checks for corpus tables"""
+
+import operator
+import re
+from bisect import bisect_right
+from itertools import repeat
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from .corpus_table import CorpusTable
+
+# Values the CSV columns are allowed to take
+VOCABULARY_QUESTION_TYPES = ('reading', 'meaning_to_japanese', 'japanese_to_meaning')
+GRAMMAR_QUESTION_TYPES = ('sentence_completion', 'meaning_comprehension', 'pattern_identification')
+DIFFICULTIES = (1, 2, 3)
+# Parts of speech; a word may combine several with '/' (e.g. 'n/v')
+POS_TAGS = ('n', 'v', 'adj', 'i-adj', 'na-adj', 'adv', 'num', 'pron', 'det', 'conj', 'int')
+# Text left behind by a NaN or null being written out as a string
+NULL_STRINGS = ('nan', 'none', 'null')
+
+# Characters that must not appear in a kana-only column (newline separates joined values)
+_NON_KANA = re.compile(r'[^\u3040-\u30ff\n]')
+HANGUL = re.compile(r'[\uac00-\ud7af\u1100-\u11ff\u3130-\u318f]')
+# Whole values (lines of a joined column) that are blank or a null written as text
+_BLANK = re.compile(r'^[^\S\n]*$', re.MULTILINE)
+_NULL_STRING = re.compile(r'^[^\S\n]*(?:%s)[^\S\n]*$' % '|'.join(NULL_STRINGS), re.MULTILINE | re.IGNORECASE)
+
+
+class ValidationRule(NamedTuple):
+    """One integrity rule: which column it checks and how it reports offending rows"""
+
+    rule_id: str
+    severity: str  # 'error' or 'warning'
+    field: Optional[str]  # None when the rule spans several columns
+    message: str  # Shown as "Row N: <message>"
+    check: Callable[['_Columns'], Iterable[int]]  # Yields offending row numbers (0-based)
+
+
+class _Columns:
+    """Column views of a CorpusTable shared by every rule in one validation run"""
+
+    def __init__(self, table: CorpusTable):
+        self.table = table
+        self._columns = {}
+
+    def column(self, field: str) -> List[str]:
+        """Entity column as strings (non-string values such as NaN become '')"""
+        if field not in self._columns:
+            values = list(map(operator.attrgetter(field), self.table.entities))
+            if set(map(type, values)) - {str}:
+                values = [value if isinstance(value, str) else '' for value in values]
+            self._columns[field] = values
+        return self._columns[field]
+
+    def matching_entities(self, field: str, pattern) -> List[int]:
+        """Entities whose value contains pattern, found by scanning the joined column at C speed.
+
+        Values are joined with newlines, so a MULTILINE ^...$ pattern matches whole values.
+        """
+        column = self.column(field)
+        text = '\n'.join(column)
+        starts = list(_accumulate_starts(column))
+
+        matches = []
+        position = 0
+        while position <= len(text):
+            match = pattern.search(text, position)
+            if match is None:
+                break
+            entity_id = bisect_right(starts, match.start()) - 1
+            matches.append(entity_id)
+            # Skip the rest of this value
+            if entity_id + 1 >= len(starts):
+                break
+            position = starts[entity_id + 1]
+        return matches
+
+    def rows_for_entities(self, entity_ids: Iterable[int]) -> List[int]:
+        """Every row that refers to one of entity_ids"""
+        entity_ids = set(entity_ids)
+        if not entity_ids:
+            return []
+        return [row for row, entity_id in enumerate(self.table.entity_ids) if entity_id in entity_ids]
+
+    def rows_for_codes(self, codes_column, bad_codes: Iterable[int]) -> List[int]:
+        """Every row whose code in codes_column is one of bad_codes"""
+        bad_codes = set(bad_codes)
+        if not bad_codes:
+            return []
+        return [row for row, code in enumerate(codes_column) if code in bad_codes]
+
+
+def _accumulate_starts(column: List[str]) -> Iterable[int]:
+    """Offset of each value in '\\n'.join(column)"""
+    offset = 0
+    for length in map(len, column):
+        yield offset
+        offset += length + 1
+
+
+def contains(field: str, pattern) -> Callable[[_Columns], List[int]]:
+    def check(columns: _Columns) -> List[int]:
+        return columns.rows_for_entities(columns.matching_entities(field, pattern))
+    return check
+
+
+def missing(field: str) -> Callable[[_Columns], List[int]]:
+    return contains(field, _BLANK)
+
+
+def missing_reading(columns: _Columns) -> List[int]:
+    """Missing hiragana, except for words already written only in kana"""
+    missing_ids = columns.matching_entities('hiragana', _BLANK)
+    if not missing_ids:
+        return []
+    kanji = columns.column('kanji')
+    kana_only = set(missing_ids) - set(columns.matching_entities('kanji', _NON_KANA))
+    return columns.rows_for_entities(i for i in missing_ids if i not in kana_only or not kanji[i])
+
+
+def null_string(fields: Iterable[str]) -> Callable[[_Columns], List[int]]:
+    def check(columns: _Columns) -> List[int]:
+        entity_ids = set()
+        for field in fields:
+            entity_ids.update(columns.matching_entities(field, _NULL_STRING))
+        return columns.rows_for_entities(entity_ids)
+    return check
+
+
+def unknown_question_type(allowed: Iterable[str]) -> Callable[[_Columns], List[int]]:
+    def check(columns: _Columns) -> List[int]:
+        table = columns.table
+        return columns.rows_for_codes(table.question_type_codes,
+                                      (code for code, value in enumerate(table.question_types) if value not in allowed))
+    return check
+
+
+def invalid_difficulty(columns: _Columns) -> List[int]:
+    table = columns.table
+    return columns.rows_for_codes(table.difficulty_codes,
+                                  (code for code, value in enumerate(table.difficulties) if value not in DIFFICULTIES))
+
+
+def unknown_pos(columns: _Columns) -> List[int]:
+    return columns.rows_for_entities(
+        i for i, value in enumerate(columns.column('pos'))
+        if not value or any(tag not in POS_TAGS for tag in value.split('/')))
+
+
+def duplicate_key(columns: _Columns) -> List[int]:
+    """Rows repeating an earlier row's entity and question type"""
+    table = columns.table
+    # Fast path: one integer key per row, built and compared without a Python-level loop
+    keys = list(map(operator.add, map(operator.mul, table.entity_ids, repeat(len(table.question_types) or 1)),
+                    table.question_type_codes))
+    if len(set(keys)) == len(keys):
+        return []
+
+    seen = set()
+    duplicates = []
+    for row, key in enumerate(zip(table.entity_ids, table.question_type_codes)):
+        if key in seen:
+            duplicates.append(row)
+        else:
+            seen.add(key)
+    return duplicates
+
+
+VOCABULARY_RULES = (
+    ValidationRule('missing_kanji', 'error', 'kanji', "Missing kanji", missing('kanji')),
+    ValidationRule('missing_hiragana', 'error', 'hiragana', "Missing hiragana", missing_reading),
+    ValidationRule('missing_korean_meaning', 'error', 'korean_meaning', "Missing Korean meaning",
+                   missing('korean_meaning')),
+    ValidationRule('invalid_difficulty', 'error', 'difficulty', "Invalid difficulty level", invalid_difficulty),
+    ValidationRule('hiragana_not_kana', 'warning', 'hiragana', "Reading contains non-kana characters",
+                   contains('hiragana', _NON_KANA)),
+    ValidationRule('null_string', 'error', None, "Null value written as text",
+                   null_string(('kanji', 'hiragana', 'pos', 'korean_meaning'))),
+    ValidationRule('unknown_question_type', 'error', 'question_type', "Unknown question type",
+                   unknown_question_type(VOCABULARY_QUESTION_TYPES)),
+    ValidationRule('unknown_pos', 'warning', 'pos', "Unknown part of speech", unknown_pos),
+    ValidationRule('duplicate_key', 'warning', 'kanji', "Duplicate word and question type", duplicate_key),
+)
+
+GRAMMAR_RULES = (
+    ValidationRule('missing_grammar_pattern', 'error', 'grammar_pattern', "Missing grammar pattern",
+                   missing('grammar_pattern')),
+    ValidationRule('missing_japanese_sentence', 'error', 'japanese_sentence', "Missing Japanese sentence",
+                   missing('japanese_sentence')),
+    ValidationRule('missing_korean_translation', 'error', 'korean_translation', "Missing Korean translation",
+                   missing('korean_translation')),
+    ValidationRule('invalid_difficulty', 'error', 'difficulty', "Invalid difficulty level", invalid_difficulty),
+    ValidationRule('korean_in_japanese_sentence', 'error', 'japanese_sentence',
+                   "Korean text in Japanese sentence", contains('japanese_sentence', HANGUL)),
+    ValidationRule('korean_in_hiragana_reading', 'error', 'hiragana_reading',
+                   "Korean text in hiragana reading", contains('hiragana_reading', HANGUL)),
+    ValidationRule('null_string', 'error', None, "Null value written as text",
+                   null_string(('grammar_pattern', 'japanese_sentence', 'hiragana_reading', 'korean_translation'))),
+    ValidationRule('unknown_question_type', 'error', 'question_type', "Unknown question type",
+                   unknown_question_type(GRAMMAR_QUESTION_TYPES)),
+    ValidationRule('duplicate_key', 'warning', 'japanese_sentence', "Duplicate sentence and question type",
+                   duplicate_key),
+)
+
+RULES = {'vocabulary': VOCABULARY_RULES, 'grammar': GRAMMAR_RULES}
+
+
+def run_rules(table: CorpusTable, category: str) -> List[Dict]:
+    """Run every rule for category over a table; one result per rule that found rows"""
+    columns = _Columns(table)
+    source_rows = table.source_rows
+    results = []
+    for rule in RULES[category]:
+        rows = sorted(set(rule.check(columns)))
+        if rows:
+            results.append({
+                'rule': rule.rule_id,
+                'severity': rule.severity,
+                'field': rule.field,
+                'message': rule.message,
+                'count': len(rows),
+                # 1-based CSV data rows, as in the issue messages
+                'rows': sorted(source_rows[row] + 1 for row in rows),
+            })
+    return results
+
+
+def build_report(level: str, tables: Dict[str, Optional[CorpusTable]],
+                 load_errors: Optional[Dict[str, str]] = None,
+                 sanitization: Optional[Dict[str, List[Dict]]] = None,
+                 unblanked: Optional[Dict[str, List[Dict]]] = None) -> Dict:
+    """JSON-serializable integrity report for one level.
+
+    sanitization holds the per-category repair logs of the loader; the rules run
+    on the repaired tables, so those logs are the only record of what was fixed.
+    unblanked lists the rows whose sentence has no verified blank (see sentence_blanks).
+    """
+    load_errors = load_errors or {}
+    sanitization = sanitization or {}
+    unblanked = unblanked or {}
+    report = {'level': level, 'categories': {}}
+    for category in ('vocabulary', 'grammar'):
+        table = tables.get(category)
+        if table is None:
+            report['categories'][category] = {'load_error': load_errors.get(category, "Not loaded"), 'issues': []}
+            continue
+        issues = run_rules(table, category)
+        report['categories'][category] = {
+            'rows': len(table),
+            'entities': len(table.entities),
+            'errors': sum(issue['count'] for issue in issues if issue['severity'] == 'error'),
+            'warnings': sum(issue['count'] for issue in issues if issue['severity'] == 'warning'),
+            'issues': issues,
+            'sanitized': sanitization.get(category) or [],
+            'unblanked': unblanked.get(category) or [],
+        }
+    return report
+
+
+def report_messages(report: Dict) -> Dict[str, List[str]]:
+    """Flatten a report into per-category "Row N: message" lists, ordered by row"""
+    messages = {}
+    for category, result in report['categories'].items():
+        if 'load_error' in result:
+            messages[category] = [f"Failed to load {category}: {result['load_error']}"]
+            continue
+        rule_order = [rule.rule_id for rule in RULES[category]]
+        entries = [(row, rule_order.index(issue['rule']), issue['message'])
+                   for issue in result['issues'] for row in issue['rows']]
+        entries.extend((row, len(rule_order), action['message'])
+                       for action in result.get('sanitized', ()) for row in action['rows'])
+        entries.extend((row, len(rule_order) + 1, f"No blank for grammar questions ({gap['reason']})")
+                       for gap in result.get('unblanked', ()) for row in gap['rows'])
+        entries.sort()
+        messages[category] = [f"Row {row}: {message}" for row, _, message in entries]
+    return messages
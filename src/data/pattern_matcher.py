@@ -0,0 +1,212 @@
+"""Aho-Corasick matching of grammar patterns and their conjugated surface forms"""
+
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from .conjugation_rules import SurfaceForms
+
+# Compiled matchers kept by compiled_matcher(); one per level and rules version is typical
+MATCHER_CACHE_SIZE = 16
+
+
+class _Automaton:
+    """Aho-Corasick automaton finding every form of every pattern in one pass over a text"""
+
+    def __init__(self, forms: Iterable[Tuple[str, int]]):
+        # Trie nodes: transitions, failure link and (length, pattern_id) outputs
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [[]]
+        for form, pattern_id in forms:
+            self._add(form, pattern_id)
+        self._link()
+        # Transitions with failure links already followed, filled in as text is scanned
+        self._delta = [dict(transitions) for transitions in self._goto]
+
+    def _add(self, form: str, pattern_id: int):
+        node = 0
+        for char in form:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            node = next_node
+        self._outputs[node].append((len(form), pattern_id))
+
+    def _link(self):
+        """Set failure links breadth-first and inherit the outputs of each node's suffixes"""
+        # Depth-one nodes keep the root as their failure link
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._outputs[child].extend(self._outputs[self._fail[child]])
+
+    def _step(self, node: int, char: str) -> int:
+        """Follow failure links from node until char can be consumed, and remember the result"""
+        state = node
+        while state and char not in self._goto[state]:
+            state = self._fail[state]
+        target = self._goto[state].get(char, 0)
+        self._delta[node][char] = target
+        return target
+
+    def find(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """Yield (start, end, pattern_id) for every form occurring in text"""
+        delta, outputs = self._delta, self._outputs
+        node = 0
+        for end, char in enumerate(text, 1):
+            next_node = delta[node].get(char)
+            node = self._step(node, char) if next_node is None else next_node
+            for length, pattern_id in outputs[node]:
+                yield end - length, end, pattern_id
+
+
+class PatternMatcher:
+    """The surface forms of a set of grammar patterns, searched one pattern or all at once.
+
+    Built once per level from the shared surface-form table. hide() and
+    longest_match() only look for the forms of the row's own pattern, longest
+    first, with str.find; find() and the coverage reports scan for every form
+    of every pattern in one pass with an Aho-Corasick automaton, compiled on
+    first use.
+    """
+
+    def __init__(self, patterns: Iterable[str], surface_forms: SurfaceForms):
+        self.patterns = sorted(set(patterns))
+        self.pattern_ids = {pattern: i for i, pattern in enumerate(self.patterns)}
+        # Per pattern: its forms grouped by length, longest group first
+        self._form_groups = {pattern: _by_length(surface_forms.forms(pattern)) for pattern in self.patterns}
+        self._automaton: Optional[_Automaton] = None
+        self._lock = threading.Lock()
+
+    def _compiled(self) -> _Automaton:
+        """The automaton over every form of every pattern, compiled on first use"""
+        with self._lock:
+            if self._automaton is None:
+                self._automaton = _Automaton((form, self.pattern_ids[pattern])
+                                             for pattern, groups in self._form_groups.items()
+                                             for group in groups for form in group)
+            return self._automaton
+
+    def find(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start, end, pattern) for every surface form occurring in text"""
+        patterns = self.patterns
+        for start, end, pattern_id in self._compiled().find(text):
+            yield start, end, patterns[pattern_id]
+
+    def longest_match(self, text: str, pattern: str) -> Optional[Tuple[int, int]]:
+        """(start, end) of the longest form of pattern in text, leftmost on ties; None if absent"""
+        groups = self._form_groups.get(pattern)
+        if groups is None or not text:
+            return None
+
+        find = text.find
+        for group in groups:
+            best = -1
+            for form in group:
+                start = find(form)
+                if start >= 0 and (best < 0 or start < best):
+                    best = start
+            if best >= 0:
+                return best, best + len(group[0])
+        return None
+
+    def hide(self, text: str, pattern: str, blank: Optional[str] = None) -> str:
+        """Blank the longest form of pattern in text (one underscore per character by default)"""
+        match = self.longest_match(text, pattern)
+        if match is None:
+            return text
+        start, end = match
+        return text[:start] + (blank if blank is not None else '_' * (end - start)) + text[end:]
+
+    def coverage(self, rows: Iterable[Tuple[str, str]]) -> Dict[str, Dict[str, int]]:
+        """Per pattern, how many of the (text, pattern) rows contain one of its forms"""
+        report = {}
+        for text, pattern in rows:
+            counts = report.setdefault(pattern, {'rows': 0, 'matched': 0})
+            counts['rows'] += 1
+            if any(found == pattern for _, _, found in self.find(text)):
+                counts['matched'] += 1
+        return report
+
+    def unmatched_patterns(self, rows: Iterable[Tuple[str, str]]) -> List[str]:
+        """Patterns with at least one row where none of their forms occurs"""
+        return sorted(pattern for pattern, counts in self.coverage(rows).items()
+                      if counts['matched'] < counts['rows'])
+
+
+def _by_length(forms: Iterable[str]) -> Tuple[Tuple[str, ...], ...]:
+    """Distinct non-empty forms grouped by length, longest group first"""
+    groups = {}
+    for form in dict.fromkeys(forms):
+        if form:
+            groups.setdefault(len(form), []).append(form)
+    return tuple(tuple(groups[length]) for length in sorted(groups, reverse=True))
+
+
+class _MatcherCache:
+    """Bounded LRU of compiled matchers keyed by (pattern set, surface-form table)"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Tuple[FrozenSet[str], SurfaceForms], PatternMatcher]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, patterns: Iterable[str], surface_forms: SurfaceForms) -> PatternMatcher:
+        # SurfaceForms hashes by identity; load_surface_forms returns one table per rules version
+        key = (frozenset(patterns), surface_forms)
+        with self._lock:
+            matcher = self._entries.get(key)
+            if matcher is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return matcher
+            self.misses += 1
+        # Compiled outside the lock; a concurrent miss on the same key just builds it twice
+        matcher = PatternMatcher(key[0], surface_forms)
+        with self._lock:
+            self._entries[key] = matcher
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return matcher
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._entries), 'maxsize': self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_matchers = _MatcherCache(MATCHER_CACHE_SIZE)
+
+
+def compiled_matcher(patterns: Iterable[str], surface_forms: SurfaceForms) -> PatternMatcher:
+    """Shared matcher for a set of patterns, compiled on first use (bounded LRU)"""
+    return _matchers.get(patterns, surface_forms)
+
+
+def matcher_cache_info() -> Dict[str, int]:
+    """Hit/miss counters and size of the compiled-matcher cache, for instrumentation"""
+    return _matchers.info()
+
+
+def clear_matcher_cache():
+    """Drop every compiled matcher and reset the counters"""
+    _matchers.clear()
@@ -0,0 +1,257 @@
+"""Many question cores drawn at once, with NumPy, and stored column-wise"""
+
+from collections.abc import Sequence
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from .distractor_index import DistractorPool, GrammarDistractors, VocabularyDistractors
+from .question_generator import QuestionCore
+
+# QuestionBatch.category_codes values
+CATEGORIES = (
+    'reading', 'meaning_to_japanese', 'japanese_to_meaning', 'sentence_completion',
+    'japanese_to_korean_comprehension', 'korean_to_japanese_comprehension', 'pattern_identification'
+)
+_CATEGORY_CODES = {category: code for code, category in enumerate(CATEGORIES)}
+_MEANING_TO_JAPANESE = _CATEGORY_CODES['meaning_to_japanese']
+# Option code of an option shown without a reading
+_NO_READING = -1
+# Wrong options per question
+_WRONG_OPTIONS = 3
+
+
+def numpy_rng(rng=None) -> np.random.Generator:
+    """NumPy generator for rng: used as is, seeded from a random.Random, or from a seed (None: fresh)"""
+    if isinstance(rng, np.random.Generator):
+        return rng
+    if hasattr(rng, 'getrandbits'):
+        return np.random.default_rng(rng.getrandbits(64))
+    return np.random.default_rng(rng)
+
+
+def _word_reading(item) -> str:
+    """Reading shown next to a word option; '' when it is empty, NaN or the word itself"""
+    hiragana = item.hiragana
+    if not hiragana or str(hiragana).lower() == 'nan' or hiragana == item.kanji:
+        return ''
+    return hiragana
+
+
+class BatchTables:
+    """Every distractor pool as a slice of one array of string codes.
+
+    Options are drawn for a whole batch as offsets into these slices. The
+    string table also takes the answers, so it grows with the rows asked
+    about, up to the corpus' distinct strings.
+    """
+
+    def __init__(self, similar_readings: Tuple[str, ...], grammar_patterns: Tuple[str, ...],
+                 vocabulary: Optional[VocabularyDistractors] = None,
+                 grammar: Optional[GrammarDistractors] = None):
+        self.vocabulary = vocabulary
+        self.grammar = grammar
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+        # Pool name -> (start in the flat arrays, size, key -> offset in the pool)
+        self.pools: Dict = {}
+        codes, readings = [], []
+
+        def add_pool(name, keys, option_codes, reading_codes, offsets=None):
+            if offsets is None:
+                offsets = {}
+                for offset, key in enumerate(keys):
+                    offsets.setdefault(key, offset)
+            self.pools[name] = (len(codes), len(option_codes), offsets)
+            codes.extend(option_codes)
+            readings.extend(reading_codes)
+
+        def add_values(name, values):
+            add_pool(name, values, [self.code(value) for value in values], [_NO_READING] * len(values))
+
+        def add_words(name, pool: DistractorPool):
+            add_pool(name, None, [self.code(item.kanji) for item in pool.items],
+                     [self.code(_word_reading(item)) if _word_reading(item) else _NO_READING for item in pool.items],
+                     pool.positions)
+
+        add_values('readings', similar_readings)
+        add_values('patterns', grammar_patterns)
+        if vocabulary is not None:
+            add_words('words', vocabulary.words)
+            for pos, bucket in vocabulary.words_by_pos.items():
+                add_words(('words', pos), bucket)
+            add_values('meanings', vocabulary.meanings.items)
+        if grammar is not None:
+            add_values('translations', grammar.translations.items)
+            add_values('sentences', grammar.sentences.items)
+        self.codes = np.array(codes, dtype=np.int32)
+        self.readings = np.array(readings, dtype=np.int32)
+
+    def matches(self, vocabulary: Optional[VocabularyDistractors], grammar: Optional[GrammarDistractors]) -> bool:
+        """Whether the tables were built from these pools (a reloaded CSV gives new ones)"""
+        return ((vocabulary is None or vocabulary is self.vocabulary) and
+                (grammar is None or grammar is self.grammar))
+
+    def code(self, value: str) -> int:
+        """Code of a string, added to the table on first use"""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def word_pool(self, vocab_item) -> Hashable:
+        """Pool meaning-to-Japanese options come from, as VocabularyDistractors.sample_words picks it"""
+        name = ('words', vocab_item.pos)
+        pool = self.pools.get(name)
+        if pool is None or pool[1] - (vocab_item.kanji in pool[2]) < _WRONG_OPTIONS:
+            return 'words'
+        return name
+
+
+class QuestionBatch(Sequence):
+    """Question cores generated together, one row per question in NumPy arrays.
+
+    options holds four string codes per question and correct_answer the
+    column of the answer; readings holds the hiragana of meaning-to-Japanese
+    options (-1 elsewhere). Indexing gives a QuestionCore, which
+    QuestionGenerator.render_question formats for either hiragana setting.
+    """
+
+    def __init__(self, items: List, category_codes: np.ndarray, options: np.ndarray,
+                 readings: np.ndarray, correct_answer: np.ndarray, values: List[str]):
+        self.items = items
+        self.category_codes = category_codes
+        self.options = options
+        self.readings = readings
+        self.correct_answer = correct_answer
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index: int) -> QuestionCore:
+        if not -len(self.items) <= index < len(self.items):
+            raise IndexError("batch index out of range")
+        values = self.values
+        category_code = self.category_codes[index]
+        options = tuple(values[code] for code in self.options[index].tolist())
+        readings = ()
+        if category_code == _MEANING_TO_JAPANESE:
+            readings = tuple(values[code] if code != _NO_READING else '' for code in self.readings[index].tolist())
+        return QuestionCore(CATEGORIES[category_code], self.items[index], options,
+                            int(self.correct_answer[index]), readings)
+
+    def nbytes(self) -> int:
+        """Bytes of the arrays (the items and strings they refer to belong to the corpus)"""
+        return (self.category_codes.nbytes + self.options.nbytes + self.readings.nbytes +
+                self.correct_answer.nbytes)
+
+
+def _distinct_offsets(rng: np.random.Generator, sizes: np.ndarray) -> np.ndarray:
+    """Three distinct offsets below each row's size, uniformly and without a loop.
+
+    The k-th draw is taken from size - k values and shifted past the draws
+    before it, which gives every ordered triple the same probability.
+    """
+    draws = rng.integers(0, np.maximum(sizes[:, None] - np.arange(_WRONG_OPTIONS), 1))
+    first = draws[:, 0]
+    second = draws[:, 1] + (draws[:, 1] >= first)
+    low, high = np.minimum(first, second), np.maximum(first, second)
+    third = draws[:, 2] + (draws[:, 2] >= low)
+    third += third >= high
+    return np.stack([first, second, third], axis=1)
+
+
+def sample_batch(tables: BatchTables, items: List, rng: np.random.Generator,
+                 blanks=None) -> QuestionBatch:
+    """Draw the options of one question per item, for all items in one pass.
+
+    Wrong options come from the same pools, excluding the answer, as the
+    per-item generators use. Grammar rows without a blanked sentence in
+    blanks can't be asked as completion or pattern questions and are left out.
+    """
+    count = len(items)
+    # Meaning comprehension: 0 = Japanese->Korean, 1 = Korean->Japanese
+    directions = rng.integers(0, 2, size=count).tolist()
+
+    category_codes = np.empty(count, dtype=np.uint8)
+    starts = np.empty(count, dtype=np.int64)
+    sizes = np.empty(count, dtype=np.int64)
+    excluded = np.empty(count, dtype=np.int64)
+    answers = np.empty(count, dtype=np.int32)
+    answer_readings = np.full(count, _NO_READING, dtype=np.int32)
+    keep = np.ones(count, dtype=bool)
+    pools, code = tables.pools, tables.code
+
+    for row, (item, direction) in enumerate(zip(items, directions)):
+        question_type = item.question_type
+        if question_type == 'reading':
+            category, pool, answer = 'reading', 'readings', item.hiragana
+        elif question_type == 'meaning_to_japanese':
+            category, pool, answer = 'meaning_to_japanese', tables.word_pool(item), item.kanji
+            reading = _word_reading(item)
+            if reading:
+                answer_readings[row] = code(reading)
+        elif question_type == 'japanese_to_meaning':
+            category, pool, answer = 'japanese_to_meaning', 'meanings', item.korean_meaning
+        elif question_type in ('sentence_completion', 'pattern_identification'):
+            if blanks is None or blanks.get(item) is None:
+                keep[row] = False
+                category_codes[row] = starts[row] = sizes[row] = excluded[row] = answers[row] = 0
+                continue
+            category, pool, answer = question_type, 'patterns', item.grammar_pattern
+        elif question_type == 'meaning_comprehension':
+            if direction == 0:
+                category, pool, answer = 'japanese_to_korean_comprehension', 'translations', item.korean_translation
+            else:
+                category, pool, answer = 'korean_to_japanese_comprehension', 'sentences', item.japanese_sentence
+        else:
+            raise ValueError(f"Unknown question type: {question_type}")
+
+        start, size, offsets = pools[pool]
+        category_codes[row] = _CATEGORY_CODES[category]
+        starts[row] = start
+        sizes[row] = size
+        excluded[row] = offsets.get(answer, -1)
+        answers[row] = code(answer)
+
+    # Offsets of the wrong options within each row's pool, skipping the answer
+    available = sizes - (excluded >= 0)
+    offsets = _distinct_offsets(rng, available)
+    offsets += (excluded[:, None] >= 0) & (offsets >= excluded[:, None])
+    positions = starts[:, None] + offsets
+    small = available < _WRONG_OPTIONS
+    positions[small] = 0
+
+    candidates = np.empty((count, _WRONG_OPTIONS + 1), dtype=np.int32)
+    candidate_readings = np.empty_like(candidates)
+    candidates[:, 0] = answers
+    candidates[:, 1:] = tables.codes[positions]
+    candidate_readings[:, 0] = answer_readings
+    candidate_readings[:, 1:] = tables.readings[positions]
+
+    # Pools with fewer than three other options: all of them, then placeholders
+    for row in np.flatnonzero(small & keep).tolist():
+        start, size = int(starts[row]), int(sizes[row])
+        remaining = [start + offset for offset in range(size) if offset != excluded[row]]
+        remaining = [remaining[i] for i in rng.permutation(len(remaining)).tolist()]
+        for column in range(_WRONG_OPTIONS):
+            if column < len(remaining):
+                candidates[row, column + 1] = tables.codes[remaining[column]]
+                candidate_readings[row, column + 1] = tables.readings[remaining[column]]
+            else:
+                candidates[row, column + 1] = code(f"옵션 {column + 1}")
+                candidate_readings[row, column + 1] = _NO_READING
+
+    # Shuffle each row's options; the answer is wherever column 0 went
+    order = np.argsort(rng.random(candidates.shape), axis=1)
+    options = np.take_along_axis(candidates, order, axis=1)
+    readings = np.take_along_axis(candidate_readings, order, axis=1)
+    correct_answer = np.argmax(order == 0, axis=1).astype(np.uint8)
+
+    if not keep.all():
+        items = [item for item, kept in zip(items, keep.tolist()) if kept]
+        category_codes, options, readings, correct_answer = (
+            category_codes[keep], options[keep], readings[keep], correct_answer[keep])
+    return QuestionBatch(list(items), category_codes, options, readings, correct_answer, tables.values)
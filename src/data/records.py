@@ -0,0 +1,191 @@
+"""Compact record types for JLPT corpus rows"""
+
+import hashlib
+import sys
+import unicodedata
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class _Record:
+    """Slotted row record that also supports the dict-style access older code uses"""
+
+    __slots__ = ()
+
+    # Field names in CSV column order; subclasses set these
+    FIELDS: Tuple[str, ...] = ()
+    # Fields with few distinct values whose strings are interned and shared
+    INTERNED_FIELDS: Tuple[str, ...] = ()
+    # Fields that identify the row's content, hashed into its stable id
+    CONTENT_FIELDS: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]):
+        """Build a record from a row dictionary, interning repeated strings"""
+        values = []
+        for name in cls.FIELDS:
+            value = row.get(name, '')
+            if name in cls.INTERNED_FIELDS and isinstance(value, str):
+                value = sys.intern(value)
+            values.append(value)
+        return cls(*values)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    # Records are mutable like the row dicts they replace, so they are not hashable
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        return getattr(self, key, default) if key in self.FIELDS else default
+
+    def keys(self):
+        return self.FIELDS
+
+    def items(self):
+        return [(name, getattr(self, name)) for name in self.FIELDS]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def replace(self, **changes):
+        """Return a copy with some fields changed"""
+        values = [changes.get(name, getattr(self, name)) for name in self.FIELDS]
+        return type(self)(*values)
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.FIELDS, state):
+            setattr(self, name, value)
+
+
+class VocabEntity(_Record):
+    """One distinct vocabulary word, shared by every question row about it"""
+
+    __slots__ = ('kanji', 'hiragana', 'pos', 'korean_meaning')
+    FIELDS = __slots__
+    INTERNED_FIELDS = ('pos',)
+    CONTENT_FIELDS = FIELDS
+    
+    def __init__(self, kanji, hiragana, pos, korean_meaning):
+        self.kanji = kanji
+        self.hiragana = hiragana
+        self.pos = pos
+        self.korean_meaning = korean_meaning
+
+
+class GrammarEntity(_Record):
+    """One distinct grammar example sentence, shared by every question row about it"""
+
+    __slots__ = ('grammar_pattern', 'japanese_sentence', 'hiragana_reading', 'korean_translation', 'file_source')
+    FIELDS = __slots__
+    INTERNED_FIELDS = ('grammar_pattern', 'file_source')
+    # file_source only says which file a sentence came from and may be projected away
+    CONTENT_FIELDS = ('grammar_pattern', 'japanese_sentence', 'hiragana_reading', 'korean_translation')
+    
+    def __init__(self, grammar_pattern, japanese_sentence, hiragana_reading, korean_translation, file_source=''):
+        self.grammar_pattern = grammar_pattern
+        self.japanese_sentence = japanese_sentence
+        self.hiragana_reading = hiragana_reading
+        self.korean_translation = korean_translation
+        self.file_source = file_source
+
+
+class VocabItem(_Record):
+    """One row of a vocabulary CSV"""
+
+    FIELDS = ('kanji', 'hiragana', 'pos', 'korean_meaning', 'question_type', 'difficulty')
+    # row_id is the cached content_hash of the row, not a CSV column
+    __slots__ = FIELDS + ('row_id',)
+    INTERNED_FIELDS = ('pos', 'question_type')
+    CONTENT_FIELDS = VocabEntity.CONTENT_FIELDS
+    ENTITY_TYPE = VocabEntity
+    
+    def __init__(self, kanji, hiragana, pos, korean_meaning, question_type, difficulty, row_id=None):
+        self.kanji = kanji
+        self.hiragana = hiragana
+        self.pos = pos
+        self.korean_meaning = korean_meaning
+        self.question_type = question_type
+        self.difficulty = difficulty
+        self.row_id = row_id
+    
+    @classmethod
+    def from_entity(cls, entity: VocabEntity, question_type: str, difficulty, row_id: Optional[int] = None):
+        """Build the row for one question type of a word"""
+        return cls(entity.kanji, entity.hiragana, entity.pos, entity.korean_meaning, question_type, difficulty,
+                   row_id)
+
+
+class GrammarItem(_Record):
+    """One row of a grammar CSV"""
+
+    FIELDS = ('grammar_pattern', 'japanese_sentence', 'hiragana_reading', 'korean_translation',
+              'question_type', 'difficulty', 'file_source')
+    __slots__ = FIELDS + ('row_id',)
+    INTERNED_FIELDS = ('grammar_pattern', 'question_type', 'file_source')
+    CONTENT_FIELDS = GrammarEntity.CONTENT_FIELDS
+    ENTITY_TYPE = GrammarEntity
+    
+    def __init__(self, grammar_pattern, japanese_sentence, hiragana_reading, korean_translation,
+                 question_type, difficulty, file_source='', row_id=None):
+        self.grammar_pattern = grammar_pattern
+        self.japanese_sentence = japanese_sentence
+        self.hiragana_reading = hiragana_reading
+        self.korean_translation = korean_translation
+        self.question_type = question_type
+        self.difficulty = difficulty
+        self.file_source = file_source
+        self.row_id = row_id
+    
+    @classmethod
+    def from_entity(cls, entity: GrammarEntity, question_type: str, difficulty, row_id: Optional[int] = None):
+        """Build the row for one question type of a sentence"""
+        return cls(entity.grammar_pattern, entity.japanese_sentence, entity.hiragana_reading,
+                   entity.korean_translation, question_type, difficulty, entity.file_source, row_id)
+
+
+def content_hash(record, question_type: str) -> int:
+    """Stable 64-bit id of a row: its normalized CONTENT_FIELDS plus question type.
+
+    Unlike hash(), this is the same in every run and process.
+    """
+    parts = [_normalize(getattr(record, name, '')) for name in record.CONTENT_FIELDS]
+    parts.append(_normalize(question_type))
+    digest = hashlib.blake2b('\x1f'.join(parts).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def stable_row_id(item) -> int:
+    """The cached content hash of an item row, computed if it was built outside a CorpusTable"""
+    cached = getattr(item, 'row_id', None)
+    return cached if cached is not None else content_hash(item, item.question_type)
+
+
+def _normalize(value) -> str:
+    """Field text as hashed: NFC, surrounding whitespace stripped, missing values empty"""
+    if value is None or value != value:  # NaN from the pandas backend
+        return ''
+    return unicodedata.normalize('NFC', str(value).strip())
@@ -0,0 +1,60 @@
+"""One-time repair of corrupted corpus rows, applied when a table is loaded or compiled"""
+
+from typing import Dict, List, Tuple
+
+from .corpus_table import CorpusTable
+from .integrity import HANGUL
+
+REPAIRED = 'repaired'
+QUARANTINED = 'quarantined'
+
+
+def _contains_korean(value) -> bool:
+    return isinstance(value, str) and HANGUL.search(value) is not None
+
+
+def sanitize_grammar(table: CorpusTable) -> Tuple[CorpusTable, List[Dict]]:
+    """Repair or quarantine grammar entities whose Japanese sentence holds Korean text.
+
+    The hiragana reading replaces a corrupted sentence when it is clean Japanese;
+    otherwise every row of the entity is dropped. Returns the clean table and a
+    JSON-serializable log with one entry per affected entity (rows are 1-based
+    CSV data rows). Repairs replace entries of table.entities.
+    """
+    actions = {}
+    for entity_id, entity in enumerate(table.entities):
+        if not _contains_korean(entity.japanese_sentence):
+            continue
+        reading = entity.hiragana_reading
+        if reading and not _contains_korean(reading):
+            actions[entity_id] = (REPAIRED, reading)
+        else:
+            actions[entity_id] = (QUARANTINED, None)
+    if not actions:
+        return table, []
+
+    rows = {entity_id: [] for entity_id in actions}
+    for entity_id, source_row in zip(table.entity_ids, table.source_rows):
+        if entity_id in rows:
+            rows[entity_id].append(source_row + 1)
+
+    log = []
+    for entity_id, (action, replacement) in actions.items():
+        entity = table.entities[entity_id]
+        log.append({
+            'action': action,
+            'field': 'japanese_sentence',
+            'grammar_pattern': entity.grammar_pattern,
+            'before': entity.japanese_sentence,
+            'after': replacement,
+            'rows': rows[entity_id],
+            'message': ("Korean text in Japanese sentence replaced with its hiragana reading" if action == REPAIRED
+                        else "Korean text in Japanese sentence; row quarantined"),
+        })
+        if action == REPAIRED:
+            table.entities[entity_id] = entity.replace(japanese_sentence=replacement)
+
+    quarantined = [entity_id for entity_id, (action, _) in actions.items() if action == QUARANTINED]
+    if quarantined:
+        table = table.without_entities(quarantined)
+    return table, log
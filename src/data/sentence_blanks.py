@@ -0,0 +1,97 @@
+"""Grammar sentences with their pattern blanked out, precomputed when a corpus is loaded or compiled"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .conjugation_rules import SurfaceForms
+from .corpus_table import CorpusTable
+from .pattern_matcher import PatternMatcher, compiled_matcher
+
+SENTENCE_BLANK = '____'
+# Question types that show a sentence with its grammar pattern blanked
+BLANK_QUESTION_TYPES = ('sentence_completion', 'pattern_identification')
+
+
+class BlankedSentence(NamedTuple):
+    """A grammar row's sentence and reading with the pattern hidden"""
+
+    sentence: str  # japanese_sentence with the pattern's longest form replaced by SENTENCE_BLANK
+    reading: str  # hiragana_reading with the form replaced by one underscore per character
+
+
+def _blank(entity, matcher: PatternMatcher) -> Tuple[Optional[BlankedSentence], Optional[str]]:
+    """Blank one entity, returning (blanked sentence, None) or (None, reason it can't be blanked)"""
+    sentence, reading, pattern = entity.japanese_sentence, entity.hiragana_reading, entity.grammar_pattern
+    match = matcher.longest_match(sentence, pattern)
+    if match is None:
+        return None, "pattern not found in sentence"
+    start, end = match
+    if not (sentence[:start] + sentence[end:]).strip('。、！？ '):
+        return None, "pattern covers the whole sentence"
+
+    hidden_reading = ''
+    if reading:
+        hidden_reading = matcher.hide(reading, pattern)
+        if hidden_reading == reading:
+            # Showing the reading would give the answer away
+            return None, "pattern not found in reading"
+
+    blanked = BlankedSentence(sentence[:start] + SENTENCE_BLANK + sentence[end:], hidden_reading)
+    if SENTENCE_BLANK not in blanked.sentence:
+        return None, "blank not inserted"
+    return blanked, None
+
+
+class SentenceBlanks:
+    """Verified blanked sentences for a set of grammar entities, keyed by (pattern, sentence).
+
+    Tables selected from a level share the level's blanks, so lookups go by
+    entity content rather than position.
+    """
+
+    def __init__(self, blanks: Dict[Tuple[str, str], BlankedSentence], failures: Dict[Tuple[str, str], str]):
+        self.blanks = blanks
+        # (pattern, sentence) -> why no blank could be made
+        self.failures = failures
+
+    @classmethod
+    def build(cls, entities: Iterable, surface_forms: SurfaceForms) -> 'SentenceBlanks':
+        """Blank every entity once with the shared matcher over the entities' own patterns"""
+        entities = list(entities)
+        matcher = compiled_matcher((entity.grammar_pattern for entity in entities if entity.grammar_pattern),
+                                   surface_forms)
+        blanks = {}
+        failures = {}
+        for entity in entities:
+            key = (entity.grammar_pattern, entity.japanese_sentence)
+            if not entity.grammar_pattern or not entity.japanese_sentence:
+                failures[key] = "missing pattern or sentence"
+                continue
+            blanked, reason = _blank(entity, matcher)
+            if blanked is None:
+                failures[key] = reason
+            else:
+                blanks[key] = blanked
+        return cls(blanks, failures)
+
+    def get(self, item) -> Optional[BlankedSentence]:
+        """Blanked sentence for a grammar row or entity, or None if it couldn't be blanked"""
+        return self.blanks.get((item.grammar_pattern, item.japanese_sentence))
+
+    def __contains__(self, item) -> bool:
+        return (item.grammar_pattern, item.japanese_sentence) in self.blanks
+
+    def __len__(self) -> int:
+        return len(self.blanks)
+
+    def unblanked_rows(self, table: CorpusTable) -> List[Dict]:
+        """JSON-serializable coverage gaps: one entry per entity without a blank, with its 1-based CSV data rows"""
+        failed = {}
+        for entity_id, entity in enumerate(table.entities):
+            reason = self.failures.get((entity.grammar_pattern, entity.japanese_sentence))
+            if reason is not None:
+                failed[entity_id] = {'grammar_pattern': entity.grammar_pattern, 'reason': reason, 'rows': []}
+        if failed:
+            for entity_id, source_row in zip(table.entity_ids, table.source_rows):
+                if entity_id in failed:
+                    failed[entity_id]['rows'].append(source_row + 1)
+        return list(failed.values())
@@ -4,8 +4,10 @@ JLPT Quiz Application - Main Entry Point
 Japanese Language Proficiency Test study tool with Korean interface
 """
 
+import json
 import sys
 import os
+import time
 from pathlib import Path
 
 # Add src directory to Python path
@@ -15,11 +17,16 @@ sys.path.insert(0, str(src_path.parent))
 import click
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 from rich.traceback import install
 
 from src.ui.menu import MainMenu
-from src.data.csv_loader import CSVLoader
+from src.data.corpus_registry import get_shared_loader
+from src.data.validation import validate_levels
+from src.data.integrity import report_messages
+from src.data.conjugation_rules import compile_surface_forms
 from src.utils.korean_ui import get_text
+from src.utils.memory import format_bytes
 
 # Install rich traceback handler
 install()
@@ -28,20 +35,31 @@ console = Console()
 
 @click.command()
 @click.option('--validate', is_flag=True, help='데이터 무결성 검사')
-@click.option('--level', default='N4', help='검사할 레벨 (기본값: N4)')
-def main(validate, level):
+@click.option('--level', default='N4', help='검사할 레벨 (기본값: N4, all: 모든 레벨)')
+@click.option('--report', type=click.Path(dir_okay=False), help='검사 결과를 JSON 파일로 저장')
+@click.option('--build-cache', is_flag=True, help='빠른 시작을 위한 데이터 캐시 생성 (모든 레벨)')
+@click.option('--seed', type=int, help='퀴즈 시드 (결과 화면의 시드로 같은 퀴즈 재현)')
+@click.option('--stream', is_flag=True, help='문제를 미리 만들지 않고 풀면서 백그라운드로 생성 (첫 문제 즉시 시작)')
+def main(validate, level, report, build_cache, seed, stream):
     """JLPT 학습 퀴즈 애플리케이션
     
     일본어 능력시험 학습을 위한 터미널 기반 퀴즈 도구
     """
     
+    if build_cache:
+        build_data_cache()
+        return
+    
     if validate:
-        validate_data(level)
+        if level.lower() == 'all':
+            validate_all_levels(report)
+        else:
+            validate_data(level, report)
         return
     
     try:
         # Initialize and run main menu directly
-        menu = MainMenu(console)
+        menu = MainMenu(console, seed=seed, streaming=stream)
         menu.run()
         
     except KeyboardInterrupt:
@@ -50,28 +68,44 @@ def main(validate, level):
         console.print(f"[red]오류가 발생했습니다: {str(e)}[/red]")
         console.print_exception()
 
-def validate_data(level: str):
+def build_data_cache():
+    """데이터 캐시(스냅샷) 생성"""
+    csv_loader = get_shared_loader()
+    levels = csv_loader.get_available_levels()
+    
+    if not levels:
+        console.print("[yellow]캐시를 생성할 데이터가 없습니다.[/yellow]")
+        return
+    
+    for level in levels:
+        try:
+            path = csv_loader.build_snapshot(level)
+            console.print(f"[green]✓ {level} 캐시 생성 완료: {path} ({format_bytes(path.stat().st_size)})[/green]")
+        except Exception as e:
+            console.print(f"[red]{level} 캐시 생성 중 오류가 발생했습니다: {str(e)}[/red]")
+    
+    try:
+        path = compile_surface_forms(csv_loader.data_dir)
+        console.print(f"[green]✓ 문법 활용형 표 생성 완료: {path} ({format_bytes(path.stat().st_size)})[/green]")
+    except Exception as e:
+        console.print(f"[red]문법 활용형 표 생성 중 오류가 발생했습니다: {str(e)}[/red]")
+
+def write_report(report_path: str, report: dict):
+    """검사 결과 JSON 저장"""
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    console.print(f"[dim]JSON 보고서 저장: {report_path}[/dim]")
+
+def validate_data(level: str, report_path: str = None):
     """데이터 무결성 검사"""
     console.print(f"[cyan]{level} 데이터 검사 중...[/cyan]")
     
     try:
-        csv_loader = CSVLoader()
-        issues = csv_loader.validate_data_integrity(level)
+        csv_loader = get_shared_loader()
+        report = csv_loader.integrity_report(level)
+        issues = report_messages(report)
         
-        if not any(issues.values()):
-            console.print(f"[green]✓ {level} 데이터가 정상입니다![/green]")
-        else:
-            console.print(f"[yellow]⚠️  {level} 데이터에서 문제가 발견되었습니다:[/yellow]")
-            
-            if issues['vocabulary']:
-                console.print("\n[bold]어휘 데이터 문제:[/bold]")
-                for issue in issues['vocabulary']:
-                    console.print(f"  - {issue}")
-            
-            if issues['grammar']:
-                console.print("\n[bold]독해 데이터 문제:[/bold]")
-                for issue in issues['grammar']:
-                    console.print(f"  - {issue}")
+        print_validation_issues(level, issues)
         
         # Display data statistics
         console.print(f"\n[bold]데이터 통계:[/bold]")
@@ -81,13 +115,85 @@ def validate_data(level: str):
             console.print(f"어휘 문제: {vocab_count}개")
             console.print(f"독해 문제: {grammar_count}개")
             console.print(f"총 문제: {vocab_count + grammar_count}개")
+            console.print(f"메모리 사용량: {format_bytes(csv_loader.memory_footprint()['total'])}")
         except Exception as e:
             console.print(f"[red]통계 정보를 가져올 수 없습니다: {str(e)}[/red]")
         
+        if report_path:
+            write_report(report_path, report)
+        
     except FileNotFoundError as e:
         console.print(f"[red]파일을 찾을 수 없습니다: {str(e)}[/red]")
     except Exception as e:
         console.print(f"[red]검사 중 오류가 발생했습니다: {str(e)}[/red]")
 
+def print_validation_issues(level: str, issues: dict):
+    """검사 결과 출력"""
+    if not any(issues.values()):
+        console.print(f"[green]✓ {level} 데이터가 정상입니다![/green]")
+        return
+    
+    console.print(f"[yellow]⚠️  {level} 데이터에서 문제가 발견되었습니다:[/yellow]")
+    
+    if issues['vocabulary']:
+        console.print("\n[bold]어휘 데이터 문제:[/bold]")
+        for issue in issues['vocabulary']:
+            console.print(f"  - {issue}")
+    
+    if issues['grammar']:
+        console.print("\n[bold]독해 데이터 문제:[/bold]")
+        for issue in issues['grammar']:
+            console.print(f"  - {issue}")
+
+def validate_all_levels(report_path: str = None):
+    """모든 레벨 데이터를 병렬로 검사하고 하나의 보고서로 출력"""
+    csv_loader = get_shared_loader()
+    levels = csv_loader.get_available_levels()
+    missing_levels = [level for level in csv_loader.LEVELS if level not in levels]
+    
+    if not levels:
+        console.print("[yellow]검사할 데이터가 없습니다.[/yellow]")
+        return
+    
+    console.print(f"[cyan]{', '.join(levels)} 데이터 검사 중...[/cyan]")
+    start = time.perf_counter()
+    results = validate_levels(str(csv_loader.data_dir), levels)
+    elapsed = time.perf_counter() - start
+    
+    for result in results:
+        console.print()
+        print_validation_issues(result['level'], result['issues'])
+    
+    console.print()
+    table = Table(title="검사 결과")
+    table.add_column("레벨")
+    table.add_column("어휘", justify="right")
+    table.add_column("독해", justify="right")
+    table.add_column("문제", justify="right")
+    table.add_column("로딩", justify="right")
+    table.add_column("검사", justify="right")
+    for result in results:
+        issue_count = sum(len(issues) for issues in result['issues'].values())
+        table.add_row(
+            result['level'],
+            f"{result['vocabulary_count']}개" if result['vocabulary_count'] is not None else "-",
+            f"{result['grammar_count']}개" if result['grammar_count'] is not None else "-",
+            "[green]0[/green]" if issue_count == 0 else f"[yellow]{issue_count}[/yellow]",
+            f"{result['load_seconds'] * 1000:.0f} ms",
+            f"{result['validate_seconds'] * 1000:.0f} ms",
+        )
+    console.print(table)
+    
+    if missing_levels:
+        console.print(f"[dim]데이터 없음: {', '.join(missing_levels)}[/dim]")
+    console.print(f"총 소요 시간: {elapsed * 1000:.0f} ms")
+    
+    if report_path:
+        write_report(report_path, {
+            'levels': [dict(result['report'], load_seconds=result['load_seconds'],
+                            validate_seconds=result['validate_seconds']) for result in results],
+            'missing_levels': missing_levels,
+        })
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,183 @@
+"""Candidate question pools, cached across quiz sessions in the process"""
+
+import bisect
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable, Optional, Tuple
+
+from ..data.corpus_table import CorpusTable
+
+# Pools kept by get_question_pool(): one per (data, level, mode) played
+POOL_CACHE_SIZE = 12
+POOL_CACHE_BYTES = 4 * 1024 * 1024
+
+# PoolSegment.states values
+_UNCHECKED = 0
+_VALID = 1
+_INVALID = 2
+
+
+class PoolSegment:
+    """Candidate rows of one table, with whether each has been seen to generate a question.
+
+    Whether a row generates depends on its data, not on the random choices
+    made for it, so a row checked in one session needs no check in the next.
+    """
+
+    __slots__ = ('category', 'table', 'positions', 'states')
+
+    def __init__(self, category: str, table: CorpusTable, positions: Iterable[int]):
+        self.category = category
+        self.table = table
+        self.positions = array('I', positions)
+        self.states = bytearray(len(self.positions))
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def nbytes(self) -> int:
+        """Bytes the segment itself holds (the table it points into is the loader's)"""
+        return sys.getsizeof(self) + sys.getsizeof(self.positions) + sys.getsizeof(self.states)
+
+
+class QuestionPool(Sequence):
+    """Rows a quiz mode can ask about, as (category, table, position) in candidate order.
+
+    Segments are shared between pools (mixed mode reuses the vocabulary and
+    grammar segments), so what one session learns about a row every pool sees.
+    Pools don't depend on the hiragana setting; sessions that skip some
+    question types draw from indexes() instead.
+    """
+
+    def __init__(self, segments: Iterable[PoolSegment]):
+        self.segments = list(segments)
+        # Skipped question types -> candidate indexes without them
+        self._indexes: Dict[FrozenSet[str], array] = {}
+        # Index of each segment's first candidate
+        self._starts = []
+        start = 0
+        for segment in self.segments:
+            self._starts.append(start)
+            start += len(segment)
+        self._length = start
+
+    @property
+    def tables(self) -> Tuple[CorpusTable, ...]:
+        return tuple(segment.table for segment in self.segments)
+
+    def _locate(self, index: int) -> Tuple[PoolSegment, int]:
+        if not 0 <= index < self._length:
+            raise IndexError("pool index out of range")
+        code = bisect.bisect_right(self._starts, index) - 1
+        return self.segments[code], index - self._starts[code]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Tuple[str, CorpusTable, int]:
+        segment, offset = self._locate(index)
+        return segment.category, segment.table, segment.positions[offset]
+
+    def indexes(self, skip_question_types: Iterable[str] = ()) -> array:
+        """Candidate indexes whose rows are not of the skipped question types"""
+        key = frozenset(skip_question_types)
+        indexes = self._indexes.get(key)
+        if indexes is None:
+            indexes = array('I')
+            for start, segment in zip(self._starts, self.segments):
+                table = segment.table
+                skipped = {code for code, question_type in enumerate(table.question_types) if question_type in key}
+                codes = table.question_type_codes
+                indexes.extend(start + offset for offset, position in enumerate(segment.positions)
+                               if codes[position] not in skipped)
+            self._indexes[key] = indexes
+        return indexes
+
+    def is_valid(self, index: int) -> Optional[bool]:
+        """Whether the candidate generates a question; None until it has been checked"""
+        segment, offset = self._locate(index)
+        state = segment.states[offset]
+        return None if state == _UNCHECKED else state == _VALID
+
+    def mark(self, index: int, valid: bool):
+        """Record whether the candidate generated a question"""
+        segment, offset = self._locate(index)
+        segment.states[offset] = _VALID if valid else _INVALID
+
+    def index_nbytes(self) -> int:
+        """Bytes of the index selections this pool has cached"""
+        return sum(sys.getsizeof(indexes) for indexes in self._indexes.values())
+
+    def nbytes(self) -> int:
+        return sum(segment.nbytes() for segment in self.segments) + self.index_nbytes()
+
+
+class _PoolCache:
+    """Bounded LRU of question pools with a memory budget"""
+
+    def __init__(self, maxsize: int, maxbytes: int):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Hashable, QuestionPool]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, tables: Tuple[CorpusTable, ...],
+            build: Callable[[], QuestionPool]) -> QuestionPool:
+        with self._lock:
+            pool = self._entries.get(key)
+            # A reloaded CSV gives new tables, and the old pool points into the old ones
+            if pool is not None and all(a is b for a, b in zip(pool.tables, tables)):
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return pool
+            self.misses += 1
+        # Built outside the lock; a concurrent miss on the same key just builds it twice
+        pool = build()
+        with self._lock:
+            self._entries[key] = pool
+            self._entries.move_to_end(key)
+            while len(self._entries) > 1 and (len(self._entries) > self.maxsize or
+                                               self._nbytes() > self.maxbytes):
+                self._entries.popitem(last=False)
+        return pool
+
+    def _nbytes(self) -> int:
+        # Pools share segments, so each is counted once
+        segments = {id(segment): segment for pool in self._entries.values() for segment in pool.segments}
+        return (sum(segment.nbytes() for segment in segments.values()) +
+                sum(pool.index_nbytes() for pool in self._entries.values()))
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._entries), 'maxsize': self.maxsize,
+                    'bytes': self._nbytes(), 'maxbytes': self.maxbytes}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_pools = _PoolCache(POOL_CACHE_SIZE, POOL_CACHE_BYTES)
+
+
+def get_question_pool(key: Hashable, tables: Tuple[CorpusTable, ...],
+                      build: Callable[[], QuestionPool]) -> QuestionPool:
+    """Shared pool for key, built on first use and whenever its tables were reloaded (bounded LRU)"""
+    return _pools.get(key, tables, build)
+
+
+def pool_cache_info() -> Dict[str, int]:
+    """Hit/miss counters, size and bytes of the question-pool cache, for instrumentation"""
+    return _pools.info()
+
+
+def clear_pool_cache():
+    """Drop every cached pool and reset the counters"""
+    _pools.clear()
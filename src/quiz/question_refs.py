@@ -0,0 +1,60 @@
+"""Prepared quiz questions stored as corpus row references plus generation seeds"""
+
+import random
+from array import array
+from typing import List, NamedTuple
+
+from ..data.corpus_table import CorpusTable
+
+
+class QuestionRef(NamedTuple):
+    """One prepared question: the row it asks about and the seed its random choices are drawn from"""
+    category: str  # 'vocabulary' or 'grammar'
+    table: CorpusTable
+    position: int
+    seed: int
+
+
+class QuestionRefs:
+    """Prepared questions of a session, column-wise (9 bytes per question).
+
+    Options, their order and every other random choice are reproduced by
+    regenerating the question with random.Random(seed), so nothing formatted
+    is kept until a question is shown.
+    """
+
+    def __init__(self):
+        # code -> (category, table); a session draws from at most one table per category
+        self.categories: List[str] = []
+        self.tables: List[CorpusTable] = []
+        self.table_codes = array('B')
+        self.positions = array('I')
+        self.seeds = array('I')
+
+    def append(self, category: str, table: CorpusTable, position: int, seed: int):
+        """Add a question for row position of table"""
+        for code, known in enumerate(self.tables):
+            if known is table:
+                break
+        else:
+            code = len(self.tables)
+            self.categories.append(category)
+            self.tables.append(table)
+        self.table_codes.append(code)
+        self.positions.append(position)
+        self.seeds.append(seed)
+
+    def shuffle(self, rng=random):
+        """Put the questions in random order"""
+        order = list(range(len(self.positions)))
+        rng.shuffle(order)
+        self.table_codes = array('B', (self.table_codes[i] for i in order))
+        self.positions = array('I', (self.positions[i] for i in order))
+        self.seeds = array('I', (self.seeds[i] for i in order))
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __getitem__(self, index: int) -> QuestionRef:
+        code = self.table_codes[index]
+        return QuestionRef(self.categories[code], self.tables[code], self.positions[index], self.seeds[index])
@@ -0,0 +1,85 @@
+"""Quiz questions generated on a background thread a few ahead of the one shown"""
+
+import queue
+import threading
+from typing import Dict, Iterable, Iterator
+
+# Questions kept ready ahead of the current one
+PREFETCH_SIZE = 4
+# How often a producer blocked on a full buffer checks whether the stream was closed
+_POLL_SECONDS = 0.1
+_DONE = object()
+
+
+class QuestionStream:
+    """Rendered questions pulled from a generator pipeline by a background thread.
+
+    At most prefetch questions wait in the buffer, so memory stays bounded
+    however many questions the session has. Questions are read in order and
+    only the current one is kept. Until the pipeline runs out, len() is the
+    expected count; rows that fail to generate can make the final count smaller.
+    """
+
+    def __init__(self, questions: Iterable[Dict], expected: int, prefetch: int = PREFETCH_SIZE):
+        self.expected = expected
+        self._buffer = queue.Queue(maxsize=prefetch)
+        self._closed = threading.Event()
+        # (index, question) of the last question taken from the buffer
+        self._current = None
+        self._received = 0
+        self._finished = False
+        self._thread = threading.Thread(target=self._produce, args=(iter(questions),),
+                                        name='question-prefetch', daemon=True)
+        self._thread.start()
+
+    def _produce(self, questions: Iterator[Dict]):
+        """Background thread: fill the buffer until the pipeline ends or the stream is closed"""
+        try:
+            for question in questions:
+                if not self._put(question):
+                    return
+        except Exception as e:
+            self._put(e)
+            return
+        self._put(_DONE)
+
+    def _put(self, item) -> bool:
+        """Wait for room in the buffer; False once the stream is closed"""
+        while not self._closed.is_set():
+            try:
+                self._buffer.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def has(self, index: int) -> bool:
+        """Check whether question index exists, waiting for it if it isn't ready yet"""
+        while self._received <= index and not self._finished:
+            item = self._buffer.get()
+            if item is _DONE:
+                self._finished = True
+            elif isinstance(item, Exception):
+                self._finished = True
+                raise RuntimeError(f"Error generating questions: {str(item)}") from item
+            else:
+                self._current = (self._received, item)
+                self._received += 1
+        return index < self._received
+
+    def __getitem__(self, index: int) -> Dict:
+        if not self.has(index):
+            raise IndexError("question index out of range")
+        if self._current[0] != index:
+            raise IndexError(f"question {index} is no longer buffered; questions are read in order")
+        return self._current[1]
+
+    def __len__(self) -> int:
+        return self._received if self._finished else max(self.expected, self._received)
+
+    def __bool__(self) -> bool:
+        return self.has(0)
+
+    def close(self):
+        """Stop the producer; questions already taken stay readable"""
+        self._closed.set()
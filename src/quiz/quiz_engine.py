@@ -1,64 +1,99 @@
 """Quiz engine for JLPT application"""
 
 import random
+import secrets
 import time
-from typing import List, Dict, Optional, Tuple
+from array import array
+from typing import Iterator, List, Dict, Optional, Sequence, Tuple
 from ..data.csv_loader import CSVLoader
-from ..data.question_generator import QuestionGenerator
+from ..data.corpus_table import CorpusTable, RowFilter
+from ..data.corpus_registry import get_shared_loader
+from ..data.question_generator import QuestionCore, QuestionGenerator
+from ..data.sentence_blanks import BLANK_QUESTION_TYPES, SentenceBlanks
+from .question_pool import PoolSegment, QuestionPool, get_question_pool
+from .question_refs import QuestionRef, QuestionRefs
+from .question_stream import QuestionStream
 
 class QuizEngine:
     """Main quiz engine that manages quiz flow and scoring"""
     
-    def __init__(self):
-        self.csv_loader = CSVLoader()
-        self.question_generator = QuestionGenerator()
+    # Question types the generator can turn into questions
+    VOCABULARY_QUESTION_TYPES = ('reading', 'meaning_to_japanese', 'japanese_to_meaning')
+    GRAMMAR_QUESTION_TYPES = ('sentence_completion', 'meaning_comprehension', 'pattern_identification')
+    
+    def __init__(self, csv_loader: Optional[CSVLoader] = None, streaming: bool = False):
+        # Share the process-wide corpus unless a loader is injected
+        self.csv_loader = csv_loader if csv_loader is not None else get_shared_loader()
+        self.question_generator = QuestionGenerator(self.csv_loader)
+        # Generate questions on a background thread as the quiz reaches them
+        # (QuestionStream) instead of preparing them all up front
+        self.streaming = streaming
+        self.questions = None
         self.reset_quiz()
     
     def reset_quiz(self):
         """Reset quiz state"""
-        self.questions = []
+        if isinstance(self.questions, QuestionStream):
+            self.questions.close()
+        self.questions = QuestionRefs()
+        # (index, question) of the one question rendered from self.questions
+        self._rendered = None
         self.current_question_index = 0
         self.answers = []
         self.start_time = None
         self.end_time = None
         self.quiz_config = {}
+        # Every random choice of the session comes from this stream (see prepare_quiz)
+        self.rng = random.Random()
     
     def prepare_quiz(self, level: str, mode: str, question_count: int, 
-                    feedback_mode: str, show_hiragana: bool) -> bool:
-        """Prepare quiz with specified configuration"""
+                    feedback_mode: str, show_hiragana: bool, seed: Optional[int] = None) -> bool:
+        """Prepare quiz with specified configuration.
+        
+        The same seed and configuration reproduce the identical quiz; without
+        one a fresh seed is drawn and recorded in quiz_config['seed']. In
+        streaming mode this returns once the first question is ready.
+        """
         try:
             self.reset_quiz()
+            if seed is None:
+                seed = secrets.randbits(32)
+            self.rng = random.Random(seed)
             self.quiz_config = {
                 'level': level,
                 'mode': mode,
                 'question_count': question_count,
                 'feedback_mode': feedback_mode,
-                'show_hiragana': show_hiragana
+                'show_hiragana': show_hiragana,
+                'seed': seed
             }
             
-            # Load data based on mode
-            if mode == 'vocabulary':
-                data = self.csv_loader.load_vocabulary(level)
-                question_pool = self._prepare_vocabulary_questions(data, show_hiragana)
-            elif mode == 'grammar':
-                data = self.csv_loader.load_grammar(level)
-                question_pool = self._prepare_grammar_questions(data, show_hiragana)
-            elif mode == 'mixed':
-                vocab_data = self.csv_loader.load_vocabulary(level)
-                grammar_data = self.csv_loader.load_grammar(level)
-                vocab_questions = self._prepare_vocabulary_questions(vocab_data, show_hiragana)
-                grammar_questions = self._prepare_grammar_questions(grammar_data, show_hiragana)
-                question_pool = vocab_questions + grammar_questions
-                random.shuffle(question_pool)
-            else:
-                raise ValueError(f"Unknown quiz mode: {mode}")
+            # Load only the rows quizzes can use, and have the generator draw
+            # blanks, lookups and wrong options from the same level's tables
+            vocabulary_filter, grammar_filter = self._row_filters()
+            self.question_generator.set_level(level)
+            self.question_generator.set_row_filters(vocabulary_filter, grammar_filter)
+            
+            # The rows that can become questions for this mode, reused from earlier
+            # sessions with either hiragana setting
+            candidates = self._question_pool(level, mode, vocabulary_filter, grammar_filter)
+            # Skip reading questions when hiragana is being displayed
+            indexes = candidates.indexes(('reading',) if show_hiragana else ())
             
             # Select questions
-            if question_count == -1:  # All questions
-                self.questions = question_pool.copy()  # Create a copy to avoid modifying the original
-                random.shuffle(self.questions)  # Randomize the order
+            if self.streaming:
+                # Sampled rows are generated in the background a few questions ahead
+                expected = len(indexes) if question_count == -1 else min(question_count, len(indexes))
+                self.questions = QuestionStream(
+                    self._stream_sampled_questions(candidates, indexes, question_count, show_hiragana, self.rng),
+                    expected)
+                return bool(self.questions)
+            elif question_count == -1:  # All questions
+                self.questions = self._generate_questions(candidates, indexes)
+                self.questions.shuffle(self.rng)  # Randomize the order
             else:
-                self.questions = random.sample(question_pool, min(question_count, len(question_pool)))
+                # Sample rows first so only the questions actually asked get generated
+                self.questions = self._generate_sampled_questions(candidates, indexes, question_count)
             
             return len(self.questions) > 0
             
@@ -66,40 +101,130 @@ class QuizEngine:
             print(f"Error preparing quiz: {str(e)}")
             return False
     
-    def _prepare_vocabulary_questions(self, vocab_data: List[Dict], show_hiragana: bool) -> List[Dict]:
-        """Prepare vocabulary questions from data"""
-        questions = []
-        for item in vocab_data:
-            try:
-                # Skip reading questions when hiragana is being displayed
-                if show_hiragana and item['question_type'] == 'reading':
-                    continue
-                    
-                question = self.question_generator.generate_vocabulary_question(item, show_hiragana)
-                questions.append(question)
-            except Exception as e:
-                print(f"Error generating vocabulary question: {str(e)}")
-                continue
+    def _row_filters(self) -> Tuple[RowFilter, RowFilter]:
+        """Row filters matching the rows _collect_*_candidates keep"""
+        # When a CSV only has these question types, the loader serves the full table
+        return (RowFilter.create(question_types=self.VOCABULARY_QUESTION_TYPES),
+                RowFilter.create(question_types=self.GRAMMAR_QUESTION_TYPES))
+    
+    def _question_pool(self, level: str, mode: str,
+                       vocabulary_filter: RowFilter, grammar_filter: RowFilter) -> QuestionPool:
+        """The candidate pool for a mode, shared across sessions until its tables are reloaded"""
+        if mode == 'vocabulary':
+            vocab_table = self.csv_loader.load_vocabulary_table(level, vocabulary_filter)
+            tables = (vocab_table,)
+            build = lambda: QuestionPool([self._collect_vocabulary_candidates(vocab_table)])
+        elif mode == 'grammar':
+            grammar_table = self.csv_loader.load_grammar_table(level, grammar_filter)
+            tables = (grammar_table,)
+            build = lambda: QuestionPool([self._collect_grammar_candidates(
+                grammar_table, self.csv_loader.get_sentence_blanks(level, grammar_filter))])
+        elif mode == 'mixed':
+            # Mixed quizzes reuse (and keep warm) the vocabulary and grammar pools
+            parts = [self._question_pool(level, part, vocabulary_filter, grammar_filter)
+                     for part in ('vocabulary', 'grammar')]
+            tables = parts[0].tables + parts[1].tables
+            build = lambda: QuestionPool(parts[0].segments + parts[1].segments)
+        else:
+            raise ValueError(f"Unknown quiz mode: {mode}")
+        return get_question_pool((str(self.csv_loader.data_dir), level, mode), tables, build)
+    
+    def _collect_vocabulary_candidates(self, vocab_table: CorpusTable) -> PoolSegment:
+        """Collect vocabulary rows that can be turned into questions"""
+        return PoolSegment('vocabulary', vocab_table, vocab_table.positions(self.VOCABULARY_QUESTION_TYPES))
+    
+    def _collect_grammar_candidates(self, grammar_table: CorpusTable, blanks: SentenceBlanks) -> PoolSegment:
+        """Collect grammar rows that can be turned into questions"""
+        # Blank-based question types need a verified blanked sentence for the row
+        blank_codes = {code for code, question_type in enumerate(grammar_table.question_types)
+                       if question_type in BLANK_QUESTION_TYPES}
+        blankable = [entity in blanks for entity in grammar_table.entities]
+        return PoolSegment('grammar', grammar_table,
+                           (position for position in grammar_table.positions(self.GRAMMAR_QUESTION_TYPES)
+                            if grammar_table.question_type_codes[position] not in blank_codes
+                            or blankable[grammar_table.entity_ids[position]]))
+    
+    def _generate_core(self, category: str, item: Dict, rng: random.Random) -> Optional[QuestionCore]:
+        """Draw the display-agnostic part of a question, returning None if the row can't be used"""
+        try:
+            if category == 'vocabulary':
+                return self.question_generator.generate_vocabulary_core(item, rng)
+            return self.question_generator.generate_grammar_core(item, rng)
+        except Exception as e:
+            print(f"Error generating {category} question: {str(e)}")
+            return None
+    
+    def _generate_question(self, category: str, item: Dict, show_hiragana: bool, rng: random.Random) -> Optional[Dict]:
+        """Generate a single question, returning None if the row can't be used"""
+        core = self._generate_core(category, item, rng)
+        return self.question_generator.render_question(core, show_hiragana) if core is not None else None
+    
+    def _add_question(self, questions: QuestionRefs, candidates: QuestionPool, index: int,
+                      seed: Optional[int] = None):
+        """Keep a candidate's reference and seed if its row generates a question"""
+        # Each question gets its own stream, so it renders the same on any thread or worker
+        if seed is None:
+            seed = self.rng.getrandbits(32)
+        category, table, position = candidates[index]
+        # Rows are only generated once per pool to learn whether they work; the
+        # core is display-agnostic, so this holds for both hiragana settings
+        valid = candidates.is_valid(index)
+        if valid is None:
+            valid = self._generate_core(category, table.row(position), random.Random(seed)) is not None
+            candidates.mark(index, valid)
+        if valid:
+            questions.append(category, table, position, seed)
+    
+    def _generate_questions(self, candidates: QuestionPool, indexes: Sequence[int]) -> QuestionRefs:
+        """Generate questions for every candidate row in indexes"""
+        questions = QuestionRefs()
+        for index in indexes:
+            self._add_question(questions, candidates, index)
         return questions
     
-    def _prepare_grammar_questions(self, grammar_data: List[Dict], show_hiragana: bool) -> List[Dict]:
-        """Prepare grammar questions from data (only reading comprehension types)"""
-        questions = []
-        for item in grammar_data:
-            # Only allow meaning_comprehension questions for reading comprehension
-            # Skip sentence_completion AND pattern_identification (both show blanks)
-            question_type = item.get('question_type', '')
-            if question_type != 'meaning_comprehension':
-                continue  # Skip any question type that's not meaning comprehension
-                
-            try:
-                question = self.question_generator.generate_grammar_question(item, show_hiragana)
-                questions.append(question)
-            except Exception as e:
-                print(f"Error generating grammar question: {str(e)}")
-                continue
+    def _generate_sampled_questions(self, candidates: QuestionPool, indexes: Sequence[int],
+                                    question_count: int) -> QuestionRefs:
+        """Generate questions for randomly sampled candidates until question_count is reached"""
+        questions = QuestionRefs()
+        if question_count <= 0:
+            return questions
+        for index, seed in self._sample_candidates(indexes, self.rng):
+            self._add_question(questions, candidates, index, seed)
+            if len(questions) >= question_count:
+                break
         return questions
     
+    def _sample_candidates(self, indexes: Sequence[int], rng: random.Random) -> Iterator[Tuple[int, int]]:
+        """Draw candidate indexes in random order without replacement, each with its question seed"""
+        remaining = array('I', indexes)
+        while remaining:
+            # Partial Fisher-Yates: draw one index without replacement, so a row
+            # that fails to generate is simply replaced by another random row
+            pick = rng.randrange(len(remaining))
+            remaining[pick], remaining[-1] = remaining[-1], remaining[pick]
+            yield remaining.pop(), rng.getrandbits(32)
+    
+    def _stream_sampled_questions(self, candidates: QuestionPool, indexes: Sequence[int], question_count: int,
+                                  show_hiragana: bool, rng: random.Random) -> Iterator[Dict]:
+        """Generate questions for sampled candidates one at a time (-1: every candidate).
+
+        Draws the same rows and seeds as _generate_sampled_questions, so a seeded
+        streaming quiz of question_count questions matches the prepared one.
+        """
+        produced = 0
+        for index, seed in self._sample_candidates(indexes, rng):
+            if produced == question_count:
+                return
+            if candidates.is_valid(index) is False:
+                continue
+            # Only sampled rows are materialized from the table
+            category, table, position = candidates[index]
+            question = self._generate_question(category, table.row(position), show_hiragana, random.Random(seed))
+            candidates.mark(index, question is not None)
+            if question is not None:
+                produced += 1
+                yield question
+    
     def start_quiz(self):
         """Start the quiz"""
         if not self.questions:
@@ -109,21 +234,46 @@ class QuizEngine:
         self.current_question_index = 0
         self.answers = []
     
+    def render_question(self, ref: QuestionRef, show_hiragana: Optional[bool] = None) -> Dict:
+        """Regenerate a prepared question from its row and seed, for the session's hiragana setting by default"""
+        core = self._generate_core(ref.category, ref.table.row(ref.position), random.Random(ref.seed))
+        if core is None:
+            raise RuntimeError(f"Prepared {ref.category} question at row {ref.position} no longer generates")
+        if show_hiragana is None:
+            show_hiragana = self.quiz_config.get('show_hiragana', False)
+        return self.question_generator.render_question(core, show_hiragana)
+    
+    def _current_question(self) -> Dict:
+        """The current question, rendered once and kept until the quiz moves on"""
+        index = self.current_question_index
+        if self._rendered is None or self._rendered[0] != index:
+            if self.streaming:
+                question = self.questions[index]
+            else:
+                question = self.render_question(self.questions[index])
+            question['current_index'] = index + 1
+            question['total_questions'] = len(self.questions)
+            self._rendered = (index, question)
+        return self._rendered[1]
+    
+    def _has_question(self, index: int) -> bool:
+        """Check whether question index exists (a stream waits until it knows)"""
+        if self.streaming:
+            return self.questions.has(index)
+        return index < len(self.questions)
+    
     def get_current_question(self) -> Optional[Dict]:
         """Get the current question"""
-        if self.current_question_index < len(self.questions):
-            question = self.questions[self.current_question_index].copy()
-            question['current_index'] = self.current_question_index + 1
-            question['total_questions'] = len(self.questions)
-            return question
+        if self._has_question(self.current_question_index):
+            return self._current_question()
         return None
     
     def submit_answer(self, answer_index: int) -> Dict:
         """Submit answer and get feedback"""
-        if self.current_question_index >= len(self.questions):
+        if not self._has_question(self.current_question_index):
             raise RuntimeError("No current question")
         
-        current_question = self.questions[self.current_question_index]
+        current_question = self._current_question()
         correct_answer_index = current_question['correct_answer']
         is_correct = answer_index == correct_answer_index
         
@@ -148,7 +298,8 @@ class QuizEngine:
             'total_questions': len(self.questions),
             'question_type': current_question.get('type', ''),
             'question_category': current_question.get('category', ''),
-            'option_translations': current_question.get('option_translations', [])
+            # Generated lazily; this is the first place they are needed
+            'option_translations': list(current_question.get('option_translations', []))
         }
         
         return feedback
@@ -156,11 +307,11 @@ class QuizEngine:
     def next_question(self) -> bool:
         """Move to next question. Returns True if there are more questions"""
         self.current_question_index += 1
-        return self.current_question_index < len(self.questions)
+        return self._has_question(self.current_question_index)
     
     def is_quiz_finished(self) -> bool:
         """Check if quiz is finished"""
-        return self.current_question_index >= len(self.questions)
+        return not self._has_question(self.current_question_index)
     
     def get_quiz_results(self) -> Dict:
         """Get final quiz results"""
@@ -301,6 +452,12 @@ class QuizEngine:
                 '예문을 많이 읽고 패턴을 익히세요',
                 '비슷한 문법의 차이점을 정리하세요'
             ])
+        elif category == 'pattern_identification':
+            recommendations.extend([
+                '문장 속 문법 패턴을 찾아 표시하며 읽어 보세요',
+                '활용형이 바뀌어도 같은 패턴임을 알아보는 연습을 하세요',
+                '헷갈리는 패턴은 예문과 함께 정리하세요'
+            ])
         elif category == 'meaning_comprehension':
             recommendations.extend([
                 '일본어 문장 해석 연습을 늘려보세요',
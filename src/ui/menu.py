@@ -12,17 +12,23 @@ import sys
 from ..utils.korean_ui import UI_TEXT, get_text
 from ..utils.settings import Settings
 from ..data.csv_loader import CSVLoader
+from ..data.corpus_registry import get_shared_loader
 from ..quiz.quiz_engine import QuizEngine
 from .quiz_display import QuizDisplay
 
 class MainMenu:
     """Main menu controller for JLPT Quiz Application"""
     
-    def __init__(self, console: Console):
+    def __init__(self, console: Console, csv_loader: Optional[CSVLoader] = None, seed: Optional[int] = None,
+                 streaming: bool = False):
         self.console = console
+        # Fixed quiz seed (--seed) to replay a session; None draws a new one per quiz
+        self.seed = seed
         self.settings = Settings()
-        self.csv_loader = CSVLoader()
-        self.quiz_engine = QuizEngine()
+        # Share the process-wide corpus unless a loader is injected
+        self.csv_loader = csv_loader if csv_loader is not None else get_shared_loader()
+        # --stream: questions are generated in the background while the quiz runs
+        self.quiz_engine = QuizEngine(self.csv_loader, streaming=streaming)
         self.quiz_display = QuizDisplay(console)
         
         # Navigation stack for proper back/forth navigation
@@ -307,7 +313,8 @@ class MainMenu:
         # Prepare quiz
         self.quiz_display.show_loading_message("퀴즈를 준비하는 중...")
         
-        success = self.quiz_engine.prepare_quiz(level, mode, question_count, feedback_mode, show_hiragana)
+        success = self.quiz_engine.prepare_quiz(level, mode, question_count, feedback_mode, show_hiragana,
+                                                seed=self.seed)
         if not success:
             self.console.print("[red]퀴즈를 준비하는 중 오류가 발생했습니다.[/red]")
             self.console.input("\n[Enter]를 눌러 계속...")
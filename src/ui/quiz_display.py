@@ -252,6 +252,10 @@ class QuizDisplay:
         else:
             content.append(f"\n[bold green]모든 분야에서 우수한 성과를 보였습니다![/bold green]\n")
         
+        seed = results.get('quiz_config', {}).get('seed')
+        if seed is not None:
+            content.append(f"\n시드: {seed} (--seed {seed} 로 같은 퀴즈 재현)\n", style="dim")
+        
         content.append(f"\n{get_text('results', 'continue')}", style="dim")
         
         # Show results panel
@@ -291,6 +295,7 @@ class QuizDisplay:
             'meaning_to_japanese': '의미 → 일본어',
             'japanese_to_meaning': '일본어 → 의미',
             'sentence_completion': '문장 완성',
+            'pattern_identification': '문법 패턴 찾기',
             'meaning_comprehension': '의미 이해'
         }
         return category_names.get(category, category)
\ No newline at end of file
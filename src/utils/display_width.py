@@ -0,0 +1,43 @@
+"""Terminal display width of text, for aligning kanji/hiragana/Korean columns"""
+
+import unicodedata
+from functools import lru_cache
+
+# Basic Multilingual Plane code point -> cells, filled in as characters are seen
+_TABLE_SIZE = 0x10000
+_UNKNOWN = 0xFF
+_widths = bytearray([_UNKNOWN]) * _TABLE_SIZE
+# Combining marks, format characters (zero-width joiner, BOM) and controls take no cell
+_ZERO_WIDTH_CATEGORIES = frozenset(('Mn', 'Me', 'Cf', 'Cc'))
+# Option texts are repeated across questions, so whole strings are memoized too
+STRING_CACHE_SIZE = 8192
+
+
+def char_width(char: str) -> int:
+    """Cells one character takes: 2 for East Asian Wide/Fullwidth (kanji, kana, Hangul, fullwidth forms)"""
+    if unicodedata.category(char) in _ZERO_WIDTH_CATEGORIES:
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+
+
+@lru_cache(maxsize=STRING_CACHE_SIZE)
+def display_width(text: str) -> int:
+    """Cells text takes in a monospace terminal"""
+    if not text:
+        return 0
+    if text.isascii() and text.isprintable():
+        return len(text)
+
+    widths = _widths
+    width = 0
+    for char in text:
+        code = ord(char)
+        if code < _TABLE_SIZE:
+            cells = widths[code]
+            if cells == _UNKNOWN:
+                cells = widths[code] = char_width(char)
+        else:
+            cells = char_width(char)
+        width += cells
+    return width
+
@@ -0,0 +1,126 @@
+"""Editing a CSV or the conjugation rules invalidates every cache derived from it"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.data.corpus_table import RowFilter
+from src.data.csv_loader import CSVLoader
+from src.quiz.quiz_engine import QuizEngine
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+DATA_FILES = ('n4_vocabulary.csv', 'n4_grammar.csv', 'conjugation_rules.json')
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    for name in DATA_FILES:
+        shutil.copy(DATA_DIR / name, tmp_path / name)
+    return tmp_path
+
+
+def _loader(data_dir: Path, use_snapshot: bool) -> CSVLoader:
+    """A loader reading data_dir, from a snapshot of its current files when use_snapshot"""
+    if use_snapshot:
+        CSVLoader(str(data_dir)).build_snapshot('N4')
+    return CSVLoader(str(data_dir), use_snapshot=use_snapshot)
+
+
+def _write(path: Path, text: str):
+    """Rewrite a data file and move its mtime forward so the edit is seen within the clock's resolution"""
+    path.write_text(text, encoding='utf-8')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def _edit(path: Path, old: str, new: str):
+    """Replace every occurrence of old in a data file"""
+    text = path.read_text(encoding='utf-8')
+    assert old in text
+    _write(path, text.replace(old, new))
+
+
+@pytest.mark.parametrize('use_snapshot', [False, True])
+def test_vocabulary_edit(data_dir, use_snapshot):
+    loader = _loader(data_dir, use_snapshot)
+    quiz_filter = RowFilter.create(question_types=QuizEngine.VOCABULARY_QUESTION_TYPES)
+    table = loader.load_vocabulary_table('N4')
+    filtered = loader.load_vocabulary_table('N4', quiz_filter)
+    distractors = loader.get_vocabulary_distractors('N4')
+    word = table.entities[0]
+    assert loader.find_vocabulary('N4', 'kanji', word.kanji) is word
+
+    _edit(data_dir / 'n4_vocabulary.csv', f'"{word.kanji}","{word.hiragana}"', '"試験語","しけんご"')
+
+    edited = loader.find_vocabulary('N4', 'kanji', '試験語')
+    assert edited is not None and edited.hiragana == 'しけんご'
+    assert loader.load_vocabulary_table('N4') is not table
+    assert edited in loader.load_vocabulary_table('N4').entities
+    assert loader.load_vocabulary_table('N4', quiz_filter) is not filtered
+    assert loader.find_vocabulary('N4', 'kanji', '試験語', quiz_filter) is not None
+    assert loader.get_vocabulary_distractors('N4') is not distractors
+    assert edited in loader.get_vocabulary_distractors('N4').words.items
+    # A snapshot taken before the edit is not loaded by a new process either
+    assert CSVLoader(str(data_dir)).find_vocabulary('N4', 'kanji', '試験語') is not None
+
+
+@pytest.mark.parametrize('use_snapshot', [False, True])
+def test_grammar_edit(data_dir, use_snapshot):
+    loader = _loader(data_dir, use_snapshot)
+    quiz_filter = RowFilter.create(question_types=QuizEngine.GRAMMAR_QUESTION_TYPES)
+    table = loader.load_grammar_table('N4')
+    distractors = loader.get_grammar_distractors('N4')
+    blanks = loader.get_sentence_blanks('N4')
+    filtered_blanks = loader.get_sentence_blanks('N4', quiz_filter)
+    matcher = loader.get_pattern_matcher('N4')
+    log = loader.sanitization_log('N4')
+
+    # A new pattern, and a sentence replaced by Korean text the sanitizer repairs
+    _edit(data_dir / 'n4_grammar.csv', '"てしまう","愛を失ってしまいました。"', '"てしまいました","한국어 문장"')
+
+    repaired = loader.find_grammar('N4', 'japanese_sentence', 'あいをうしなってしまいました。')
+    assert repaired is not None and repaired.grammar_pattern == 'てしまいました'
+    assert loader.find_grammar('N4', 'japanese_sentence', '愛を失ってしまいました。') is None
+    assert loader.load_grammar_table('N4') is not table
+    assert loader.get_grammar_distractors('N4') is not distractors
+    assert 'あいをうしなってしまいました。' in loader.get_grammar_distractors('N4').sentences.items
+    assert loader.get_sentence_blanks('N4') is not blanks
+    assert repaired in loader.get_sentence_blanks('N4')
+    assert loader.get_sentence_blanks('N4', quiz_filter) is not filtered_blanks
+    assert loader.get_pattern_matcher('N4') is not matcher
+    assert 'てしまいました' in loader.get_pattern_matcher('N4').patterns
+    added = [entry for entry in loader.sanitization_log('N4') if entry not in log]
+    assert [(entry['action'], entry['after']) for entry in added] == [('repaired', 'あいをうしなってしまいました。')]
+
+
+def test_quiz_pool_follows_edit(data_dir):
+    loader = _loader(data_dir, False)
+    engine = QuizEngine(loader)
+    assert engine.prepare_quiz('N4', 'grammar', 5, 'immediate', False, seed=7)
+    table = engine.questions[0].table
+
+    _edit(data_dir / 'n4_grammar.csv', '"てしまう","愛を失ってしまいました。"', '"てしまう","愛をなくしてしまいました。"')
+
+    assert engine.prepare_quiz('N4', 'grammar', 5, 'immediate', False, seed=7)
+    assert all(ref.table is not table for ref in engine.questions)
+    grammar_filter = engine._row_filters()[1]
+    assert engine.questions[0].table is loader.load_grammar_table('N4', grammar_filter)
+
+
+@pytest.mark.parametrize('use_snapshot', [False, True])
+def test_rules_edit(data_dir, use_snapshot):
+    loader = _loader(data_dir, use_snapshot)
+    blanks = loader.get_sentence_blanks('N4')
+    matcher = loader.get_pattern_matcher('N4')
+
+    rules_file = data_dir / 'conjugation_rules.json'
+    rules = json.loads(rules_file.read_text(encoding='utf-8'))
+    for pattern in list(rules['patterns'])[:5]:
+        del rules['patterns'][pattern]
+    _write(rules_file, json.dumps(rules, ensure_ascii=False))
+
+    assert loader.get_pattern_matcher('N4') is not matcher
+    assert len(loader.get_sentence_blanks('N4')) < len(blanks)
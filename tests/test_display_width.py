@@ -0,0 +1,59 @@
+"""Display widths of mixed kana/kanji/Hangul text, as option alignment measures it"""
+
+from pathlib import Path
+
+import pytest
+from rich.cells import cell_len
+
+from src.data.csv_loader import CSVLoader
+from src.utils.display_width import char_width, display_width
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+
+# (text, expected cells)
+CASES = [
+    ('', 0),
+    ('abc', 3),
+    ('食べる', 6),
+    ('(たべる)', 8),
+    ('コーヒー', 8),  # prolonged sound mark
+    ('ヴァイオリン', 12),  # small katakana
+    ('々', 2),  # iteration mark, outside the old kanji range
+    ('～', 2),  # fullwidth tilde
+    ('！？', 4),  # fullwidth punctuation
+    ('、。「」', 8),  # CJK punctuation
+    ('ｶﾀｶﾅ', 4),  # halfwidth katakana
+    ('오늘', 4),  # Hangul syllables
+    ('생활 (life)', 11),
+    ('土曜日 (どようび) 토요일', 24),
+    ('\u304c\u3099', 2),  # combining voiced mark
+    ('e\u0301', 1),  # combining acute
+    ('ﾃﾞ', 2),  # halfwidth voiced mark is its own cell
+    ('\u200d', 0),  # zero-width joiner
+    ('𠮷', 2),  # CJK extension B, outside the lookup table
+]
+
+
+@pytest.mark.parametrize('text, expected', CASES)
+def test_display_width(text, expected):
+    assert display_width(text) == expected
+
+
+@pytest.mark.parametrize('text, expected', CASES)
+def test_uncached_width_matches(text, expected):
+    assert display_width.__wrapped__(text) == expected
+
+
+@pytest.mark.parametrize('text', [text for text, _ in CASES])
+def test_width_is_sum_of_char_widths(text):
+    assert display_width(text) == sum(char_width(char) for char in text)
+
+
+def test_corpus_texts_match_rich():
+    """Every text the alignment helpers measure takes as many cells as rich renders"""
+    texts = set()
+    for item in CSVLoader(str(DATA_DIR)).load_vocabulary('N4'):
+        texts.update(text for text in (item.kanji, f"({item.hiragana})", item.korean_meaning) if text)
+    assert texts
+    mismatches = sorted(text for text in texts if display_width(text) != cell_len(text))
+    assert mismatches == []
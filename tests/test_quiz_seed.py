@@ -0,0 +1,64 @@
+"""Seeded quizzes: the same seed and settings give the same questions in both modes"""
+
+from pathlib import Path
+
+import pytest
+
+from src.data.csv_loader import CSVLoader
+from src.quiz.question_pool import clear_pool_cache
+from src.quiz.quiz_engine import QuizEngine
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+
+
+@pytest.fixture(scope='module')
+def loader():
+    return CSVLoader(str(DATA_DIR), use_snapshot=False)
+
+
+def _questions(loader, streaming, mode, seed, count=20, show_hiragana=False):
+    """(id, display text, options, answer) of every question of a freshly prepared quiz"""
+    clear_pool_cache()
+    engine = QuizEngine(loader, streaming=streaming)
+    assert engine.prepare_quiz('N4', mode, count, 'immediate', show_hiragana, seed=seed)
+    questions = []
+    index = 0
+    try:
+        while engine._has_question(index):
+            if streaming:
+                question = engine.questions[index]
+            else:
+                question = engine.render_question(engine.questions[index])
+            questions.append((question['id'], question['display_text'],
+                              question['options'], question['correct_answer']))
+            index += 1
+    finally:
+        engine.reset_quiz()
+    return questions
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+@pytest.mark.parametrize('mode', ['vocabulary', 'grammar', 'mixed'])
+def test_same_seed_same_quiz(loader, streaming, mode):
+    first = _questions(loader, streaming, mode, seed=1234)
+    assert len(first) == 20
+    assert _questions(loader, streaming, mode, seed=1234) == first
+
+
+@pytest.mark.parametrize('mode', ['vocabulary', 'grammar', 'mixed'])
+def test_streaming_matches_prepared(loader, mode):
+    assert _questions(loader, True, mode, seed=99) == _questions(loader, False, mode, seed=99)
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_different_seeds_differ(loader, streaming):
+    assert _questions(loader, streaming, 'mixed', seed=1) != _questions(loader, streaming, 'mixed', seed=2)
+
+
+def test_seed_recorded(loader):
+    engine = QuizEngine(loader)
+    assert engine.prepare_quiz('N4', 'vocabulary', 5, 'immediate', True)
+    seed = engine.quiz_config['seed']
+    replayed = [question[0] for question in _questions(loader, False, 'vocabulary', seed, count=5,
+                                                       show_hiragana=True)]
+    assert [engine.render_question(ref)['id'] for ref in engine.questions] == replayed
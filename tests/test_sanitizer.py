@@ -0,0 +1,86 @@
+"""Repair and quarantine of grammar rows with Korean text in the Japanese sentence"""
+
+import csv
+
+import pytest
+
+from src.data.corpus_table import RowFilter
+from src.data.csv_loader import CSVLoader
+from src.data.sanitizer import QUARANTINED, REPAIRED
+
+GRAMMAR_COLUMNS = ('grammar_pattern', 'japanese_sentence', 'hiragana_reading', 'korean_translation',
+                   'question_type', 'difficulty', 'file_source')
+VOCABULARY_COLUMNS = ('kanji', 'hiragana', 'pos', 'korean_meaning', 'question_type', 'difficulty')
+
+GRAMMAR_ROWS = [
+    ('てしまう', '愛を失ってしまいました。', 'あいをうしなってしまいました。', '사랑을 잃어버렸습니다.',
+     'sentence_completion', '1', '01.md'),
+    # Korean sentence and reading: quarantined
+    ('てしまう', '한국어 문장', '한국어', '사랑을 잃어버렸습니다.', 'meaning_comprehension', '1', '01.md'),
+    ('てしまう', '忘れてしまった。', 'わすれてしまった。', '잊어버렸다.', 'sentence_completion', '1', '01.md'),
+    # Korean sentence with a clean reading: repaired, both rows of the entity
+    ('ながら', '음악을 聞きながら', 'おんがくをききながら', '음악을 들으면서', 'sentence_completion', '2', '02.md'),
+    ('ながら', '음악을 聞きながら', 'おんがくをききながら', '음악을 들으면서', 'meaning_comprehension', '2', '02.md'),
+    # Reported by the integrity check at its own CSV row
+    ('ながら', '歩きながら話す。', 'あるきながらはなす。', '', 'sentence_completion', '2', '02.md'),
+]
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    for name, columns, rows in (
+            ('n4_grammar.csv', GRAMMAR_COLUMNS, GRAMMAR_ROWS),
+            ('n4_vocabulary.csv', VOCABULARY_COLUMNS, [('愛', 'あい', 'n', '사랑', 'reading', '1')])):
+        with open(tmp_path / name, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            writer.writerow(columns)
+            writer.writerows(rows)
+    return tmp_path
+
+
+def _sentences(table):
+    return [table.row(position).japanese_sentence for position in range(len(table))]
+
+
+@pytest.fixture(params=['csv', 'pandas'])
+def loader(request, data_dir):
+    if request.param == 'pandas':
+        pytest.importorskip('pandas')
+    return CSVLoader(str(data_dir), use_snapshot=False, backend=request.param)
+
+
+def test_log(loader):
+    log = loader.sanitization_log('N4')
+    assert [(entry['action'], entry['grammar_pattern'], entry['rows']) for entry in log] == [
+        (QUARANTINED, 'てしまう', [2]),
+        (REPAIRED, 'ながら', [4, 5]),
+    ]
+    assert log[0]['after'] is None
+    assert log[1]['before'] == '음악을 聞きながら'
+    assert log[1]['after'] == 'おんがくをききながら'
+
+
+def test_table(loader):
+    table = loader.load_grammar_table('N4')
+    assert len(table) == 5
+    sentences = _sentences(table)
+    assert '한국어 문장' not in sentences
+    assert sentences.count('おんがくをききながら') == 2
+    # Rows keep their position in the CSV after a quarantined row is dropped
+    assert list(table.source_rows) == [0, 2, 3, 4, 5]
+
+
+def test_filtered_table(loader):
+    table = loader.load_grammar_table('N4', RowFilter.create(question_types=['sentence_completion']))
+    assert _sentences(table) == [
+        '愛を失ってしまいました。', '忘れてしまった。', 'おんがくをききながら', '歩きながら話す。']
+    assert list(table.source_rows) == [0, 2, 3, 5]
+
+
+def test_integrity_rows(loader):
+    assert loader.validate_data_integrity('N4')['grammar'] == [
+        'Row 2: Korean text in Japanese sentence; row quarantined',
+        'Row 4: Korean text in Japanese sentence replaced with its hiragana reading',
+        'Row 5: Korean text in Japanese sentence replaced with its hiragana reading',
+        'Row 6: Missing Korean translation',
+    ]